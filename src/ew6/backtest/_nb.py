@@ -0,0 +1,147 @@
+"""Compiled kernels for the pattern backtest (M1.7).
+
+Numba is an optional extra (`pip install -e .[fast]`). When it is not installed,
+`simulate_trades` falls back to an equivalent NumPy implementation, so callers never
+need to care which path ran.
+
+Kernel contract (all arrays 1-D, same length, one row per kept trade):
+    entry, exitp, direction (+1/-1 as float64)
+    cost_frac: round-trip cost as one fraction, 2*(fee + slippage) with bps / 10_000
+Returns (equity_curve[n+1], signed_net[n], wins, gross_wins, gross_losses, max_drawdown).
+
+`simulate_grid` runs the same simulation for K (cost_frac, risk_fraction) pairs; with
+Numba the configurations are independent and spread over cores via `prange`.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+    prange = range  # type: ignore
+
+HAVE_NUMBA = njit is not None
+
+SimResult = Tuple[np.ndarray, np.ndarray, int, float, float, float]
+
+
+def _simulate_trades_loop(entry, exitp, direction, cost_frac, risk_fraction, initial_cash):
+    # Single fused pass: returns, compounding, win count and running peak/drawdown.
+    # Gross win/loss sums are left to NumPy's pairwise summation (see _gross_sums).
+    n = entry.shape[0]
+    curve = np.empty(n + 1, dtype=np.float64)
+    signed_net = np.empty(n, dtype=np.float64)
+    equity = initial_cash
+    curve[0] = equity
+    peak = equity
+    mdd = 0.0
+    wins = 0
+    for i in range(n):
+        r = direction[i] * ((exitp[i] - entry[i]) / entry[i]) - cost_frac
+        signed_net[i] = r
+        equity = equity * (1.0 + risk_fraction * r)
+        curve[i + 1] = equity
+        if r > 0:
+            wins += 1
+        # NaN propagates as in np.maximum.accumulate / ndarray.max (the fallback path)
+        if equity > peak or equity != equity:
+            peak = equity
+        if peak > 0:
+            dd = (peak - equity) / peak
+            if dd > mdd or dd != dd:
+                mdd = dd
+    return curve, signed_net, wins, mdd
+
+
+def _gross_sums(signed_net: np.ndarray) -> Tuple[float, float]:
+    # Pairwise summation: stable profit factor regardless of trade count/order.
+    win = signed_net > 0
+    return float(signed_net[win].sum()), float(-signed_net[~win].sum())
+
+
+def _simulate_trades_np(entry, exitp, direction, cost_frac, risk_fraction, initial_cash) -> SimResult:
+    signed_net = direction * ((exitp - entry) / entry) - cost_frac
+    # Preallocated curve: cumprod writes straight into curve[1:], no concatenate copy.
+    curve = np.empty(signed_net.shape[0] + 1, dtype=np.float64)
+    curve[0] = 1.0
+    np.cumprod(1.0 + risk_fraction * signed_net, out=curve[1:])
+    curve *= initial_cash
+    peaks = np.maximum.accumulate(curve)
+    dd = np.where(peaks > 0, (peaks - curve) / np.where(peaks > 0, peaks, 1.0), 0.0)
+    gw, gl = _gross_sums(signed_net)
+    return curve, signed_net, int((signed_net > 0).sum()), gw, gl, float(dd.max(initial=0.0))
+
+
+# no fastmath: its no-NaN/no-inf assumptions leave `r > 0` and `equity > peak` undefined on
+# such inputs, and the kernel must match the NumPy fallback there too
+if HAVE_NUMBA:
+    _simulate_trades_nb = njit(cache=True)(_simulate_trades_loop)
+else:  # pragma: no cover
+    _simulate_trades_nb = None
+
+
+def _simulate_grid_loop(entry, exitp, direction, cost_fracs, risk_fractions, initial_cash, out_final, out_mdd, out_wins):
+    for k in prange(cost_fracs.shape[0]):
+        curve, _net, wins, mdd = _simulate_trades_nb(entry, exitp, direction, cost_fracs[k], risk_fractions[k], initial_cash)
+        out_final[k] = curve[curve.shape[0] - 1]
+        out_mdd[k] = mdd
+        out_wins[k] = wins
+
+
+if HAVE_NUMBA:
+    _simulate_grid_nb = njit(cache=True, parallel=True)(_simulate_grid_loop)
+else:  # pragma: no cover
+    _simulate_grid_nb = None
+
+
+def simulate_trades(
+    entry: np.ndarray,
+    exitp: np.ndarray,
+    direction: np.ndarray,
+    cost_frac: float,
+    risk_fraction: float,
+    initial_cash: float,
+) -> SimResult:
+    """Run the equity/drawdown simulation (Numba kernel when available, NumPy otherwise)."""
+    e = np.ascontiguousarray(entry, dtype=np.float64)
+    x = np.ascontiguousarray(exitp, dtype=np.float64)
+    d = np.ascontiguousarray(direction, dtype=np.float64)
+    if _simulate_trades_nb is None:
+        return _simulate_trades_np(e, x, d, float(cost_frac), float(risk_fraction), float(initial_cash))
+    curve, signed_net, wins, mdd = _simulate_trades_nb(e, x, d, float(cost_frac), float(risk_fraction), float(initial_cash))
+    gw, gl = _gross_sums(signed_net)
+    return curve, signed_net, int(wins), gw, gl, float(mdd)
+
+
+def simulate_grid(
+    entry: np.ndarray,
+    exitp: np.ndarray,
+    direction: np.ndarray,
+    cost_fracs: np.ndarray,
+    risk_fractions: np.ndarray,
+    initial_cash: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Simulate K configurations at once -> (final_equity[K], max_drawdown[K], wins[K])."""
+    e = np.ascontiguousarray(entry, dtype=np.float64)
+    x = np.ascontiguousarray(exitp, dtype=np.float64)
+    d = np.ascontiguousarray(direction, dtype=np.float64)
+    cf = np.ascontiguousarray(cost_fracs, dtype=np.float64)
+    rf = np.ascontiguousarray(risk_fractions, dtype=np.float64)
+    k = cf.shape[0]
+    out_final = np.empty(k, dtype=np.float64)
+    out_mdd = np.empty(k, dtype=np.float64)
+    out_wins = np.empty(k, dtype=np.int64)
+    if _simulate_grid_nb is not None:
+        _simulate_grid_nb(e, x, d, cf, rf, float(initial_cash), out_final, out_mdd, out_wins)
+        return out_final, out_mdd, out_wins
+    for j in range(k):
+        curve, _net, wins, _gw, _gl, mdd = _simulate_trades_np(e, x, d, float(cf[j]), float(rf[j]), float(initial_cash))
+        out_final[j] = curve[-1]
+        out_mdd[j] = mdd
+        out_wins[j] = wins
+    return out_final, out_mdd, out_wins
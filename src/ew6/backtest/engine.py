@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import List
 
+import numpy as np
 import pandas as pd
 
 from ew6.data.types import BarSeries
@@ -30,31 +31,34 @@ def run_simple_backtest(bars: BarSeries, signals: List[Signal], cfg: BacktestCon
     """
     bars.validate()
     close = bars.close
-    equity = pd.Series(index=close.index, dtype=float)
 
     cash = float(cfg.initial_cash)
+    if not signals or cash <= 0:
+        # Nothing to allocate: flat equity, no trades.
+        return BacktestResult(equity_curve=pd.Series(cash, index=close.index, name="equity", dtype=float), trades=[])
+
+    close_arr = close.to_numpy(dtype=np.float64, copy=False)
     pos_qty = 0.0
     trades: List[dict] = []
 
     # Apply first actionable signal at the first bar.
-    if signals:
-        sig = next((s for s in signals if s.side != Side.FLAT), None)
-        if sig is not None:
-            entry_price = float(close.iloc[0])
-            if sig.side == Side.BUY:
+    sig = next((s for s in signals if s.side != Side.FLAT), None)
+    if sig is not None:
+        entry_price = float(close_arr[0])
+        if sig.side == Side.BUY:
+            notional = cash * float(cfg.max_position_pct)
+            pos_qty = notional / entry_price
+            cash -= notional
+            trades.append({"side": "buy", "ts": close.index[0], "price": entry_price, "qty": pos_qty})
+        elif sig.side == Side.SELL:
+            if cfg.allow_short:
                 notional = cash * float(cfg.max_position_pct)
-                pos_qty = notional / entry_price
-                cash -= notional
-                trades.append({"side": "buy", "ts": close.index[0], "price": entry_price, "qty": pos_qty})
-            elif sig.side == Side.SELL:
-                if cfg.allow_short:
-                    notional = cash * float(cfg.max_position_pct)
-                    pos_qty = -notional / entry_price
-                    trades.append({"side": "sell_short", "ts": close.index[0], "price": entry_price, "qty": pos_qty})
-                else:
-                    trades.append({"side": "sell_ignored_long_only", "ts": close.index[0], "price": entry_price, "qty": 0.0})
-
-    for ts, price in close.items():
-        equity.loc[ts] = cash + pos_qty * float(price)
+                pos_qty = -notional / entry_price
+                trades.append({"side": "sell_short", "ts": close.index[0], "price": entry_price, "qty": pos_qty})
+            else:
+                trades.append({"side": "sell_ignored_long_only", "ts": close.index[0], "price": entry_price, "qty": 0.0})
+
+    # Mark-to-market: equity is linear in price, so one array expression covers all bars.
+    equity = pd.Series(cash + pos_qty * close_arr, index=close.index, name="equity")
 
     return BacktestResult(equity_curve=equity, trades=trades)
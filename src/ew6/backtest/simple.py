@@ -10,17 +10,22 @@ Notes:
 - Index mapping assumes pattern leg indices align with bar index order. For our pipeline
   (bars -> zigzag -> swings -> monowaves -> patterns) this is typically true when
   zigzag returns indices in bar space.
+- The equity/drawdown simulation runs in `ew6.backtest._nb` (Numba-compiled when the
+  `fast` extra is installed, NumPy otherwise).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+from dataclasses import dataclass, field, fields
 
+from ew6.backtest._nb import simulate_grid, simulate_trades
 from ew6.logging import get_logger
 
 log = get_logger("ew6.backtest")
-from typing import List, Tuple, Optional
-import math
+from typing import Dict, Iterator, List, Sequence, Tuple, Optional
+
+import numpy as np
 
 
 @dataclass(frozen=True)
@@ -36,6 +41,48 @@ class Trade:
     slippage: float
 
 
+_TRADE_FIELDS = tuple(f.name for f in fields(Trade))
+
+
+@dataclass(frozen=True, eq=False)
+class TradesSoA:
+    """Trades as struct-of-arrays: one NumPy column per `Trade` field.
+
+    Iterating (or `to_records()`) yields `Trade` objects for code that expects the old
+    list-of-Trade form; `to_dataframe()` is the cheap path for exports.
+    """
+    pattern_idx: np.ndarray   # int64
+    direction: np.ndarray     # int64
+    entry_px: np.ndarray
+    exit_px: np.ndarray
+    ret: np.ndarray
+    pnl: np.ndarray
+    equity_after: np.ndarray
+    fees: np.ndarray
+    slippage: np.ndarray
+
+    @staticmethod
+    def empty() -> "TradesSoA":
+        i = np.empty(0, dtype=np.int64)
+        f = np.empty(0, dtype=np.float64)
+        return TradesSoA(i, i, f, f, f, f, f, f, f)
+
+    def __len__(self) -> int:
+        return int(self.pattern_idx.shape[0])
+
+    def __iter__(self) -> Iterator[Trade]:
+        return iter(self.to_records())
+
+    def to_records(self) -> List[Trade]:
+        cols = [getattr(self, name).tolist() for name in _TRADE_FIELDS]
+        return [Trade(*row) for row in zip(*cols)]
+
+    def to_dataframe(self):
+        import pandas as pd
+
+        return pd.DataFrame({name: getattr(self, name) for name in _TRADE_FIELDS})
+
+
 @dataclass(frozen=True)
 class BacktestReport:
     initial_cash: float
@@ -46,37 +93,116 @@ class BacktestReport:
     avg_ret: float
     total_ret: float
     max_drawdown: float  # fraction
-    equity_curve: List[float]
+    equity_curve: np.ndarray = field(compare=False)  # float64, initial_cash first
     profit_factor: float
     expectancy: float
     sharpe_like: float
 
+    @property
+    def equity_curve_list(self) -> List[float]:
+        return self.equity_curve.tolist()
+
 
-def _dd_from_curve(curve: List[float]) -> float:
-    if not curve:
+def _empty_report(initial_cash: float) -> BacktestReport:
+    return BacktestReport(
+        initial_cash=float(initial_cash),
+        final_equity=float(initial_cash),
+        trades=0,
+        wins=0,
+        winrate=0.0,
+        avg_ret=0.0,
+        total_ret=0.0,
+        max_drawdown=0.0,
+        equity_curve=np.array([float(initial_cash)], dtype=np.float64),
+        profit_factor=0.0,
+        expectancy=0.0,
+        sharpe_like=0.0,
+    )
+
+
+def _dd_from_curve(curve: Sequence[float], lookback: Optional[int] = None) -> float:
+    """Max drawdown of an equity curve (fraction).
+
+    lookback=None: peak is the running max since the start.
+    lookback=D:    peak is the max over the trailing window [t-D, t] (time-windowed drawdown).
+    """
+    arr = np.asarray(curve, dtype=np.float64)
+    if arr.size == 0:
         return 0.0
-    peak = curve[0]
-    mdd = 0.0
-    for x in curve:
-        if x > peak:
-            peak = x
-        dd = (peak - x) / peak if peak > 0 else 0.0
-        if dd > mdd:
-            mdd = dd
-    return mdd
-
-
-def _close_at(bars, idx: int) -> Optional[float]:
-    """Get close price at bar index idx."""
-    try:
-        df = bars.df
-        if idx < 0:
-            idx = 0
-        if idx >= len(df):
-            idx = len(df) - 1
-        return float(df["close"].iloc[idx])
-    except Exception:
+    if lookback is None:
+        peaks = np.maximum.accumulate(arr)
+    else:
+        import pandas as pd
+
+        peaks = pd.Series(arr).rolling(int(lookback) + 1, min_periods=1).max().to_numpy()
+    dd = np.where(peaks > 0, (peaks - arr) / np.where(peaks > 0, peaks, 1.0), 0.0)
+    return float(dd.max(initial=0.0))
+
+
+def _close_array(bars) -> Optional[np.ndarray]:
+    """Bar closes as a contiguous float64 array (None if bars carry no close column / no rows).
+
+    Validated once per call; bad close data raises instead of silently falling back.
+    BarSeries objects cache this array (`close_np`), so parameter sweeps over the same
+    bars do not re-materialize the column.
+    """
+    cached = getattr(bars, "close_np", None)
+    if isinstance(cached, np.ndarray):
+        return cached if cached.size else None
+    df = getattr(bars, "df", None)
+    if df is None or "close" not in getattr(df, "columns", ()):
         return None
+    arr = np.ascontiguousarray(df["close"].to_numpy(), dtype=np.float64)
+    return arr if arr.size else None
+
+
+_NO_LEGS = (0.0, 0.0, 0.0, 0, 0)
+
+
+def _patterns_to_arrays(patterns) -> Dict[str, np.ndarray]:
+    """One pass over pattern objects -> typed columns (one row per pattern).
+
+    Rows without legs get placeholder prices; `n_legs` lets the caller mask them out.
+    """
+    rows = [
+        (i, float((getattr(p, "meta", None) or {}).get("confidence", 0.0)), len(legs))
+        + ((legs[0].start_px, legs[0].end_px, legs[-1].end_px, legs[0].start_idx, legs[-1].end_idx) if legs else _NO_LEGS)
+        for i, p in enumerate(patterns)
+        for legs in (getattr(p, "legs", None) or [],)
+    ]
+    arr = np.asarray(rows, dtype=np.float64).reshape(-1, 8)
+    return {
+        "pattern_idx": arr[:, 0].astype(np.int64),
+        "confidence": arr[:, 1],
+        "n_legs": arr[:, 2].astype(np.int64),
+        "start_px": arr[:, 3],
+        "end_px_first": arr[:, 4],
+        "end_px_last": arr[:, 5],
+        "start_idx_first": arr[:, 6].astype(np.int64),
+        "end_idx_last": arr[:, 7].astype(np.int64),
+    }
+
+
+def _select_trades(patterns, *, min_confidence: float, bars, entry_mode: str) -> Tuple[np.ndarray, ...]:
+    """Filter patterns to tradable rows -> (pattern_idx, direction, entry, exit) arrays."""
+    close_arr = _close_array(bars) if (entry_mode == "bar" and bars is not None) else None
+
+    cols = _patterns_to_arrays(patterns)
+    idx = cols["pattern_idx"]
+    # Direction from leg1 (flat leg1 counts as long)
+    dirs = np.where(cols["end_px_first"] - cols["start_px"] >= 0, 1, -1).astype(np.int64)
+    if close_arr is not None:
+        # Bar pricing: gather closes at leg1.start_idx / leg5.end_idx (indices clipped to the series).
+        last = close_arr.shape[0] - 1
+        entry = close_arr[np.clip(cols["start_idx_first"], 0, last)]
+        exitp = close_arr[np.clip(cols["end_idx_last"], 0, last)]
+    else:
+        entry = cols["start_px"]
+        exitp = cols["end_px_last"]
+
+    # All filters in one mask: confidence, complete 1-5 impulse, positive prices.
+    keep = (cols["confidence"] >= float(min_confidence)) & (cols["n_legs"] >= 5) & (entry > 0) & (exitp > 0)
+    return idx[keep], dirs[keep], entry[keep], exitp[keep]
 
 
 def backtest_patterns(
@@ -88,95 +214,68 @@ def backtest_patterns(
     entry_mode: str = "pattern",   # "pattern" or "bar"
     fee_bps: float = 0.0,
     slippage_bps: float = 0.0,
-) -> Tuple[List[Trade], BacktestReport]:
-    equity = float(initial_cash)
-    curve = [equity]
-    trades: List[Trade] = []
-    log.debug("backtest start", extra={"patterns": len(patterns), "bars": len(bars) if hasattr(bars,'__len__') else None, "fee_bps": fee_bps, "slippage_bps": slippage_bps, "entry_mode": entry_mode})
-    wins = 0
-    rets = []
-    gross_wins = 0.0
-    gross_losses = 0.0
-
-    fb = float(fee_bps) / 10_000.0
-    sb = float(slippage_bps) / 10_000.0
-
-    for i, p in enumerate(patterns):
-        meta = getattr(p, "meta", {}) or {}
-        conf = float(meta.get("confidence", 0.0))
-        if conf < float(min_confidence):
-            continue
-        legs = getattr(p, "legs", None) or []
-        if len(legs) < 5:
-            continue
-
-        # Determine direction from leg1
-        direction = 1 if (float(legs[0].end_px) - float(legs[0].start_px)) >= 0 else -1
-
-        if entry_mode == "bar" and bars is not None:
-            e = _close_at(bars, int(legs[0].start_idx))
-            x = _close_at(bars, int(legs[-1].end_idx))
-            if e is None or x is None:
-                entry = float(legs[0].start_px)
-                exitp = float(legs[-1].end_px)
-            else:
-                entry, exitp = float(e), float(x)
-        else:
-            entry = float(legs[0].start_px)
-            exitp = float(legs[-1].end_px)
-
-        if entry <= 0 or exitp <= 0:
-            continue
-
-        gross_ret = (exitp - entry) / entry
-        signed_gross = gross_ret if direction == 1 else -gross_ret
-
-        # Costs: fee + slippage on entry and exit, proportional
-        # Approx: total cost fraction = 2*(fee + slippage)
-        cost_frac = 2.0 * (fb + sb)
-        signed_net = signed_gross - cost_frac
-
-        stake = equity * float(risk_fraction)
-        pnl = stake * signed_net
-        equity2 = equity + pnl
-
-        fees = stake * (2.0 * fb)
-        slip = stake * (2.0 * sb)
-
-        t = Trade(
-            pattern_idx=i,
-            direction=direction,
+    return_trades: bool = True,
+    dd_lookback: Optional[int] = None,
+) -> Tuple[TradesSoA, BacktestReport]:
+    """Backtest patterns as one trade each (leg1 start -> leg5 end).
+
+    Trades come back as a `TradesSoA` (iterable of `Trade` for older callers).
+    return_trades=False skips building the trade columns (returns an empty TradesSoA),
+    which is what parameter sweeps want when only the report aggregates are used.
+    dd_lookback (in equity-curve points, i.e. trades) switches max_drawdown to the
+    trailing-window definition; None keeps the running-peak drawdown.
+    """
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("backtest start", extra={"patterns": len(patterns), "bars": len(bars) if hasattr(bars,'__len__') else None, "fee_bps": fee_bps, "slippage_bps": slippage_bps, "entry_mode": entry_mode})
+
+    # Degenerate inputs: nothing to simulate, skip all allocations.
+    if len(patterns) == 0 or initial_cash <= 0:
+        return TradesSoA.empty(), _empty_report(initial_cash)
+
+    # Costs: fee + slippage on entry and exit, proportional.
+    # Approx: total cost fraction = 2*(fee + slippage); hoisted once per call.
+    two_fb = 2.0 * float(fee_bps) / 10_000.0
+    two_sb = 2.0 * float(slippage_bps) / 10_000.0
+    cost_frac = two_fb + two_sb
+
+    idx, dirs, entry, exitp = _select_trades(patterns, min_confidence=min_confidence, bars=bars, entry_mode=entry_mode)
+
+    # Compounding: equity_t = equity_{t-1} * (1 + risk_fraction * net_t)
+    curve, signed_net, wins, gross_wins, gross_losses, mdd = simulate_trades(
+        entry, exitp, dirs, cost_frac, float(risk_fraction), float(initial_cash)
+    )
+
+    trades = TradesSoA.empty()
+    if return_trades:
+        stake = curve[:-1] * float(risk_fraction)
+        trades = TradesSoA(
+            pattern_idx=idx,
+            direction=dirs,
             entry_px=entry,
             exit_px=exitp,
             ret=signed_net,
-            pnl=pnl,
-            equity_after=equity2,
-            fees=fees,
-            slippage=slip,
+            pnl=stake * signed_net,
+            equity_after=curve[1:],
+            fees=stake * two_fb,
+            slippage=stake * two_sb,
         )
-        trades.append(t)
-        equity = equity2
-        curve.append(equity)
-        rets.append(signed_net)
 
-        if signed_net > 0:
-            wins += 1
-            gross_wins += signed_net
-        else:
-            gross_losses += -signed_net
+    if dd_lookback is not None:
+        mdd = _dd_from_curve(curve, lookback=dd_lookback)
+
+    n = int(signed_net.size)
+    equity = float(curve[-1])
 
     total_ret = (equity - initial_cash) / initial_cash if initial_cash > 0 else 0.0
-    avg_ret = sum(rets) / len(rets) if rets else 0.0
-    winrate = wins / len(trades) if trades else 0.0
-    mdd = _dd_from_curve(curve)
+    avg_ret = float(signed_net.mean()) if n else 0.0
+    winrate = wins / n if n else 0.0
 
     profit_factor = (gross_wins / gross_losses) if gross_losses > 1e-12 else (float("inf") if gross_wins > 0 else 0.0)
     expectancy = avg_ret
     # Sharpe-like: mean/std of trade returns (not annualized)
-    if len(rets) >= 2:
+    if n >= 2:
         mu = avg_ret
-        var = sum((x - mu) ** 2 for x in rets) / (len(rets) - 1)
-        sd = math.sqrt(var) if var > 0 else 0.0
+        sd = float(signed_net.std(ddof=1))
         sharpe_like = (mu / sd) if sd > 1e-12 else (float("inf") if mu > 0 else 0.0)
     else:
         sharpe_like = 0.0
@@ -184,7 +283,7 @@ def backtest_patterns(
     rep = BacktestReport(
         initial_cash=float(initial_cash),
         final_equity=float(equity),
-        trades=len(trades),
+        trades=n,
         wins=wins,
         winrate=float(winrate),
         avg_ret=float(avg_ret),
@@ -196,3 +295,49 @@ def backtest_patterns(
         sharpe_like=float(sharpe_like) if sharpe_like != float("inf") else float("inf"),
     )
     return trades, rep
+
+
+def backtest_patterns_grid(
+    patterns,
+    fee_grid: Sequence[float],
+    slip_grid: Sequence[float],
+    risk_grid: Sequence[float],
+    initial_cash: float = 10_000.0,
+    min_confidence: float = 0.0,
+    bars=None,
+    entry_mode: str = "pattern",
+):
+    """Sweep the cartesian grid fee_bps x slippage_bps x risk_fraction in one call.
+
+    Trade selection (confidence filter, bar pricing) is done once; only the cost and
+    sizing parameters vary. Returns a DataFrame with one row per configuration.
+    """
+    import pandas as pd
+
+    fees, slips, risks = (
+        g.ravel() for g in np.meshgrid(
+            np.asarray(fee_grid, dtype=np.float64),
+            np.asarray(slip_grid, dtype=np.float64),
+            np.asarray(risk_grid, dtype=np.float64),
+            indexing="ij",
+        )
+    )
+    _idx, dirs, entry, exitp = _select_trades(patterns, min_confidence=min_confidence, bars=bars, entry_mode=entry_mode)
+    cost_fracs = 2.0 * (fees + slips) / 10_000.0
+    final, mdd, wins = simulate_grid(entry, exitp, dirs, cost_fracs, risks, float(initial_cash))
+
+    n = int(entry.shape[0])
+    total_ret = (final - initial_cash) / initial_cash if initial_cash > 0 else np.zeros_like(final)
+    return pd.DataFrame(
+        {
+            "fee_bps": fees,
+            "slippage_bps": slips,
+            "risk_fraction": risks,
+            "trades": n,
+            "wins": wins,
+            "winrate": wins / n if n else np.zeros_like(final),
+            "final_equity": final,
+            "total_ret": total_ret,
+            "max_drawdown": mdd,
+        }
+    )
@@ -0,0 +1,163 @@
+"""Disk memoization for deterministic pipeline steps (swings, pattern detection).
+
+Repeat runs over the same bars and parameters (parameter exploration, re-running a
+batch) reuse pickled results instead of recomputing them.
+
+- Opt-in: set EW6_DISK_CACHE=1 (the CLI's --disk_cache does this); off by default.
+- Key: function name + CACHE_VERSION + package version + a hash of the ew6 source tree +
+  a fingerprint of the arguments, so any code change invalidates old entries. Arrays and
+  DataFrames are hashed from their raw bytes; other arguments are pickled.
+- Hash: xxhash.xxh3_64 when installed (`fast` extra), hashlib.blake2b otherwise.
+- Location: $EW6_CACHE_DIR or ~/.cache/ew6.
+- Bound: $EW6_CACHE_MAX_MB (default 256); after a write, least recently used entries are
+  pruned until the directory fits.
+
+Cache I/O problems never fail the wrapped call; they only cost a recompute.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+import numpy as np
+
+try:
+    import xxhash  # type: ignore
+except Exception:  # pragma: no cover
+    xxhash = None  # type: ignore
+
+# Bump when the on-disk entry format changes (code changes are covered by the source hash).
+CACHE_VERSION = 3
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _hasher() -> Any:
+    return xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=8)
+
+
+def _cache_dir() -> Optional[Path]:
+    if os.environ.get("EW6_DISK_CACHE", "0").strip().lower() not in ("1", "true", "yes", "on"):
+        return None
+    return Path(os.environ.get("EW6_CACHE_DIR") or Path.home() / ".cache" / "ew6")
+
+
+def _max_bytes() -> int:
+    try:
+        return int(float(os.environ.get("EW6_CACHE_MAX_MB", "256")) * 1024 * 1024)
+    except ValueError:
+        return 256 * 1024 * 1024
+
+
+@functools.lru_cache(maxsize=1)
+def _code_version() -> str:
+    """Package version + a hash of every ew6 source file (computed once per process)."""
+    try:
+        from importlib.metadata import version
+
+        ver = version("ew6")
+    except Exception:
+        ver = "0+unknown"
+    h = _hasher()
+    h.update(ver.encode())
+    pkg = Path(__file__).resolve().parent
+    for src in sorted(pkg.rglob("*.py")):
+        h.update(str(src.relative_to(pkg)).encode())
+        h.update(src.read_bytes())
+    return h.hexdigest()
+
+
+def _prune(root: Path, limit: int) -> None:
+    """Delete least recently used entries until the cache dir holds at most `limit` bytes."""
+    entries = []
+    total = 0
+    for p in root.glob("*.pkl"):
+        try:
+            st = p.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, p))
+        total += st.st_size
+    if total <= limit:
+        return
+    for _, size, p in sorted(entries):
+        try:
+            p.unlink()
+        except OSError:
+            continue
+        total -= size
+        if total <= limit:
+            break
+
+
+def _feed(h: Any, obj: Any) -> None:
+    import pandas as pd
+
+    if isinstance(obj, np.ndarray):
+        arr = np.ascontiguousarray(obj)
+        h.update(f"nd:{arr.dtype.str}:{arr.shape}".encode())
+        h.update(arr.tobytes() if arr.dtype != object else pickle.dumps(arr.tolist(), protocol=5))
+        return
+    if isinstance(obj, pd.DataFrame):
+        h.update(f"df:{list(obj.columns)}".encode())
+        for c in obj.columns:
+            _feed(h, obj[c].to_numpy())
+        return
+    df = getattr(obj, "df", None)
+    if isinstance(df, pd.DataFrame):
+        _feed(h, df)
+        return
+    h.update(pickle.dumps(obj, protocol=5))
+
+
+def fingerprint(*parts: Any) -> str:
+    """Stable hex digest of the given values (bars are hashed by their array bytes)."""
+    h = _hasher()
+    for p in parts:
+        _feed(h, p)
+        h.update(b"|")
+    return h.hexdigest()
+
+
+def memoize_to_disk(fn: F) -> F:
+    """Cache `fn(*args, **kwargs)` as a pickle under the cache dir, keyed on its arguments."""
+
+    @functools.wraps(fn)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        root = _cache_dir()
+        if root is None:
+            return fn(*args, **kwargs)
+        try:
+            kw = [x for item in sorted(kwargs.items()) for x in item]
+            key = fingerprint(fn.__module__, fn.__qualname__, CACHE_VERSION, _code_version(), *args, *kw)
+            path = root / f"{key}.pkl"
+        except Exception:
+            return fn(*args, **kwargs)
+
+        if path.exists():
+            try:
+                with path.open("rb") as f:
+                    out = pickle.load(f)
+                os.utime(path)  # mtime = last use, for LRU pruning
+                return out
+            except Exception:
+                pass
+
+        out = fn(*args, **kwargs)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            with tmp.open("wb") as f:
+                pickle.dump(out, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp.replace(path)
+            _prune(root, _max_bytes())
+        except Exception:
+            pass
+        return out
+
+    return wrapper  # type: ignore[return-value]
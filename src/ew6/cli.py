@@ -29,19 +29,26 @@ from __future__ import annotations
 
 import argparse
 import json
+import operator
 import os
 import signal
 import faulthandler
 import sys
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Sequence, Tuple
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
-import pandas as pd
+import numpy as np
 
+from ew6.cache import memoize_to_disk
 from ew6.config import load_config
 from ew6.logging import setup_logging, get_logger, LogConfig
+from ew6.run._pool import spawn_pool
+
+if TYPE_CHECKING:  # pandas is imported lazily: `ew6 --help` should not pay for it
+    import pandas as pd
 
 log = get_logger("ew6.cli")
 
@@ -54,22 +61,37 @@ def _parse_csv_list(s: Optional[str]) -> List[str]:
     return [x.strip() for x in s.split(",") if x.strip()]
 
 
+# Parent directories already created this process (exports often share one directory).
+_ENSURED_DIRS: set = set()
+
+
 def _ensure_dir(p: str) -> None:
-    Path(p).parent.mkdir(parents=True, exist_ok=True)
+    parent = str(Path(p).parent)
+    if parent not in _ENSURED_DIRS:
+        Path(parent).mkdir(parents=True, exist_ok=True)
+        _ENSURED_DIRS.add(parent)
 
 
 def _to_df(bars: Any) -> pd.DataFrame:
-    """Convert BarSeries/list/df into a pandas DataFrame with ts/open/high/low/close/volume."""
+    """Convert BarSeries/list/df into a pandas DataFrame with ts/open/high/low/close/volume.
+
+    Read-only contract: the result may share memory with `bars` (no defensive copy);
+    callers that need to mutate must copy themselves.
+    """
+    import pandas as pd
+
     if bars is None:
         return pd.DataFrame()
     if isinstance(bars, pd.DataFrame):
-        return bars.copy()
-    # BarSeries style
+        return bars
+    # BarSeries style: the cached frame itself (to_df() returns a copy)
+    if isinstance(getattr(bars, "df", None), pd.DataFrame):
+        return bars.df
     if hasattr(bars, "to_df"):
         try:
             df = bars.to_df()  # type: ignore
             if isinstance(df, pd.DataFrame):
-                return df.copy()
+                return df
         except Exception:
             pass
     # list of objects/dicts
@@ -95,27 +117,68 @@ def _to_df(bars: Any) -> pd.DataFrame:
     return pd.DataFrame()
 
 
+_BAR_COLS = ("ts", "open", "high", "low", "close", "volume")
+
+
+def _bars_view(bars: Any) -> Mapping[str, np.ndarray]:
+    """Column name -> 1-D array for whatever bar container we got (read-only).
+
+    Columnar BarSeries (ndarray attributes ts/open/high/low/close/volume) are returned
+    as zero-copy views; anything else goes through _to_df once. Missing columns are
+    simply absent from the mapping.
+    """
+    if all(isinstance(getattr(bars, c, None), np.ndarray) for c in _BAR_COLS):
+        return {c: getattr(bars, c) for c in _BAR_COLS}
+    df = _to_df(bars)
+    return {c: df[c].to_numpy() for c in _BAR_COLS if c in df.columns}
+
+
+def _fmt_ms(t_ms: Any) -> str:
+    # Same text as str(pd.Timestamp(t, unit="ms", tz="UTC")) without the pandas scalar path.
+    return str(datetime.fromtimestamp(int(t_ms) / 1000.0, tz=timezone.utc))
+
+
+def _peek_ts(row: Any) -> Any:
+    if isinstance(row, dict):
+        return row.get("ts", row.get("timestamp"))
+    return getattr(row, "ts", getattr(row, "timestamp", None))
+
+
 def _bars_range_str(bars: Any) -> str:
+    # ew6.data.bars.BarSeries exposes the first/last timestamp directly
+    if hasattr(bars, "ts_first") and hasattr(bars, "ts_last"):
+        t0, t1 = bars.ts_first, bars.ts_last
+        return f"[{_fmt_ms(t0)}..{_fmt_ms(t1)}]" if t0 is not None else "[None..None]"
+    # columnar containers: first/last element of the ts array
+    ts_arr = getattr(bars, "ts", None)
+    if isinstance(ts_arr, np.ndarray):
+        return f"[{_fmt_ms(ts_arr[0])}..{_fmt_ms(ts_arr[-1])}]" if ts_arr.size else "[None..None]"
+    # list-backed series: peek at the first/last Bar, no DataFrame needed
+    seq = getattr(bars, "bars", None)
+    if isinstance(seq, (list, tuple)) and seq:
+        try:
+            return f"[{_fmt_ms(seq[0].ts)}..{_fmt_ms(seq[-1].ts)}]"
+        except Exception:
+            pass
     # Prefer BarSeries start/end if present
     if hasattr(bars, "start_time") and hasattr(bars, "end_time"):
         try:
             return f"[{getattr(bars,'start_time')}..{getattr(bars,'end_time')}]"
         except Exception:
             pass
-    df = _to_df(bars)
-    if df.empty:
-        return "[None..None]"
-    ts = None
-    if "ts" in df.columns:
-        ts = df["ts"]
-    elif "timestamp" in df.columns:
-        ts = df["timestamp"]
-    if ts is None:
+    import pandas as pd
+
+    t0 = t1 = None
+    if isinstance(bars, pd.DataFrame):
+        col = "ts" if "ts" in bars.columns else ("timestamp" if "timestamp" in bars.columns else None)
+        if col is not None and len(bars):
+            t0, t1 = bars[col].iloc[0], bars[col].iloc[-1]
+    elif isinstance(bars, (list, tuple)) and bars:
+        t0, t1 = _peek_ts(bars[0]), _peek_ts(bars[-1])
+    if t0 is None or t1 is None:
         return "[None..None]"
     try:
-        t0 = int(ts.iloc[0])
-        t1 = int(ts.iloc[-1])
-        return f"[{pd.to_datetime(t0, unit='ms', utc=True)}..{pd.to_datetime(t1, unit='ms', utc=True)}]"
+        return f"[{_fmt_ms(t0)}..{_fmt_ms(t1)}]"
     except Exception:
         return "[None..None]"
 
@@ -165,6 +228,95 @@ class JobResult:
         return dict(self.__dict__)
 
 
+_JOB_FIELDS = [f.name for f in fields(JobResult)]
+# Batch results accumulate in one structured array (one row per job) instead of a list of
+# JobResult objects; field order/names follow JobResult. Strings are object columns (no
+# fixed width to truncate symbols/timeframes); a new JobResult field needs an entry here.
+_JOB_COLUMN_DTYPES: Dict[str, Any] = {
+    "symbol": object,
+    "timeframe": object,
+    "bars": np.int64,
+    "swings": np.int64,
+    "patterns": np.int64,
+    "best_score": np.float64,
+    "best_conf": np.float64,
+    "tuned": np.int64,
+    "bt_trades": np.int64,
+    "bt_winrate": np.float64,
+    "bt_mdd": np.float64,
+    "bt_totalret": np.float64,
+    "bt_equity": np.float64,
+    "bt_pf": np.float64,
+    "bt_sharpe": np.float64,
+    "wf_mode": object,
+    "wf_splits": np.float64,
+    "wf_score": np.float64,
+    "wf_pos": np.float64,
+    "wf_ret_mu": np.float64,
+    "wf_ret_sd": np.float64,
+}
+_JOB_DTYPE = np.dtype([(name, _JOB_COLUMN_DTYPES[name]) for name in _JOB_FIELDS])
+
+
+def _new_results(n: int) -> np.ndarray:
+    results = np.zeros(n, dtype=_JOB_DTYPE)
+    for name in _JOB_FIELDS:
+        if _JOB_COLUMN_DTYPES[name] is object:
+            results[name] = ""  # zeros() leaves object columns as int 0
+    return results
+
+
+def _job_row_dicts(results: np.ndarray) -> Iterable[Dict[str, Any]]:
+    # .tolist() converts each row to Python scalars in C
+    return (dict(zip(_JOB_FIELDS, row)) for row in results.tolist())
+
+
+def _write_json_rows(f: Any, rows: Iterable[Dict[str, Any]]) -> None:
+    """Write rows as an indented JSON array, streamed one row at a time.
+
+    Byte-identical to json.dump(list(rows), f, indent=2, ensure_ascii=False). Always the
+    stdlib encoder: orjson writes inf (pf/sharpe with no losing trade) as null and formats
+    floats differently, so exports would depend on the installed extras.
+    """
+    enc = json.JSONEncoder(ensure_ascii=False, indent=2)
+    first = True
+    for row in rows:
+        f.write("[\n  " if first else ",\n  ")
+        first = False
+        for chunk in enc.iterencode(row):
+            f.write(chunk.replace("\n", "\n  "))
+    f.write("[]" if first else "\n]")
+
+
+def _is_parquet(path: str) -> bool:
+    return str(path).lower().endswith(".parquet")
+
+
+def _write_columns(path: str, cols: Mapping[str, Any]) -> None:
+    """Write named columns: Parquet for *.parquet, CSV otherwise.
+
+    Parquet goes through pyarrow directly when installed (NumPy numeric columns are handed
+    to Arrow without boxing), else pandas. CSV is always pandas' writer, so the file format
+    does not depend on which extras are installed.
+    """
+    if _is_parquet(path):
+        try:
+            import pyarrow as pa  # type: ignore
+            import pyarrow.parquet as pq  # type: ignore
+        except Exception:
+            pa = None
+        if pa is not None:
+            pq.write_table(pa.table(dict(cols)), path)
+            return
+    import pandas as pd
+
+    df = pd.DataFrame(dict(cols))
+    if _is_parquet(path):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
 # ------------------------- Binance loading --------------------------
 
 @dataclass
@@ -199,6 +351,17 @@ def _make_instrument(symbol: str, market: str, venue: str = "binance") -> Any:
         return type("Instrument", (), {"symbol": symbol, "market": market, "venue": venue})()
 
 
+# One connector per process (per worker under --jobs), created on first use.
+_CONNECTORS: Dict[bool, Any] = {}
+
+
+def _shared_connector(progress: bool = False):
+    conn = _CONNECTORS.get(bool(progress))
+    if conn is None:
+        conn = _CONNECTORS[bool(progress)] = _binance_connector(progress=progress)
+    return conn
+
+
 def _binance_connector(progress: bool = False):
     from ew6.exchange.binance.connector import BinanceConnector, BinanceConfig  # type: ignore
     try:
@@ -208,7 +371,49 @@ def _binance_connector(progress: bool = False):
     return BinanceConnector(cfg)
 
 
-def _trades_to_time_bars(trades: List[Dict[str, Any]], timeframe: str) -> Any:
+_AGG_GETTER = operator.itemgetter("T", "p", "q")
+_AGG_DTYPE = np.dtype([("T", "i8"), ("p", "f8"), ("q", "f8")])
+
+
+def _trades_to_arrays(trades: Any) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Trades -> (ts int64 ms, price float64, qty float64); rows without ts/price are dropped.
+
+    Accepts the connector's column mapping (T/p/q arrays) or a list of trade dicts.
+    """
+    if isinstance(trades, Mapping):
+        return (
+            np.ascontiguousarray(trades["T"], dtype=np.int64),
+            np.ascontiguousarray(trades["p"], dtype=np.float64),
+            np.ascontiguousarray(trades["q"], dtype=np.float64),
+        )
+    # Binance aggTrades keys: T (ms), p (price), q (qty). Fast path: one C-level pass,
+    # string->float coercion included.
+    n = len(trades)
+    try:
+        rec = np.fromiter(map(_AGG_GETTER, trades), dtype=_AGG_DTYPE, count=n)
+        return (np.ascontiguousarray(rec["T"]), np.ascontiguousarray(rec["p"]), np.ascontiguousarray(rec["q"]))
+    except (KeyError, TypeError, ValueError):
+        pass
+
+    # Other schemas (time/price/qty, missing fields): per-row normalization.
+    ts = np.empty(n, dtype=np.int64)
+    px = np.empty(n, dtype=np.float64)
+    qty = np.empty(n, dtype=np.float64)
+    k = 0
+    for t in trades:
+        t_ms = t.get("T") or t.get("time") or t.get("ts") or t.get("timestamp")
+        p = t.get("p") or t.get("price") or t.get("c")
+        q = t.get("q") or t.get("qty") or t.get("volume") or 0.0
+        if t_ms is None or p is None:
+            continue
+        ts[k] = int(t_ms)
+        px[k] = float(p)
+        qty[k] = float(q)
+        k += 1
+    return ts[:k], px[:k], qty[:k]
+
+
+def _trades_to_time_bars(trades: Any, timeframe: str) -> Any:
     # timeframe like "5m", "1m", "15m"
     tf = timeframe.strip().lower()
     if tf.endswith("min"):
@@ -222,78 +427,66 @@ def _trades_to_time_bars(trades: List[Dict[str, Any]], timeframe: str) -> Any:
     if not trades:
         return []
 
-    # Binance aggTrades keys: T (ms), p (price), q (qty)
-    rows = []
-    for t in trades:
-        ts = t.get("T") or t.get("time") or t.get("ts") or t.get("timestamp")
-        px = t.get("p") or t.get("price") or t.get("c")
-        qty = t.get("q") or t.get("qty") or t.get("volume") or 0.0
-        if ts is None or px is None:
-            continue
-        rows.append((int(ts), float(px), float(qty)))
-    if not rows:
+    ts, px, qty = _trades_to_arrays(trades)
+    k = ts.shape[0]
+    if k == 0:
         return []
 
-    df = pd.DataFrame(rows, columns=["ts", "price", "qty"])
-    # floor to timeframe bucket
-    bucket = (df["ts"] // (minutes * 60_000)) * (minutes * 60_000)
-    df["bucket"] = bucket
-
-    g = df.groupby("bucket", sort=True)
-    out = pd.DataFrame({
-        "ts": g["bucket"].first(),
-        "open": g["price"].first(),
-        "high": g["price"].max(),
-        "low": g["price"].min(),
-        "close": g["price"].last(),
-        "volume": g["qty"].sum(),
-    }).reset_index(drop=True)
+    import pandas as pd
+
+    step = minutes * 60_000
+    if k > 1 and (ts[1:] < ts[:-1]).any():
+        # aggTrades arrive time-ordered; a stable sort by bucket keeps in-bucket order for open/close
+        order = np.argsort(ts // step, kind="stable")
+        ts, px, qty = ts[order], px[order], qty[order]
+
+    # Bucket edges by binary-searching the (few) timeframe boundaries into ts, instead of
+    # dividing every trade; empty buckets are dropped.
+    t_start = (int(ts[0]) // step) * step
+    t_end = (int(ts[-1]) // step + 1) * step
+    boundaries = np.arange(t_start, t_end, step, dtype=np.int64)
+    starts = np.searchsorted(ts, boundaries, side="left")
+    nonempty = np.diff(starts, append=k) > 0
+    edges = starts[nonempty]
+
+    # one pass over contiguous arrays: reduceat per column from the group starts
+    cols = {
+        "ts": boundaries[nonempty],
+        "open": px[edges],
+        "high": np.maximum.reduceat(px, edges),
+        "low": np.minimum.reduceat(px, edges),
+        "close": px[np.r_[edges[1:] - 1, k - 1]],
+        "volume": np.add.reduceat(qty, edges),
+    }
 
     # Return BarSeries if available
     try:
-        from ew6.data.bars import Bar, BarSeries  # type: ignore
-        bars = [Bar(ts=int(r.ts), open=float(r.open), high=float(r.high), low=float(r.low), close=float(r.close), volume=float(r.volume))
-                for r in out.itertuples(index=False)]
-        return BarSeries.from_bars(bars)
+        from ew6.data.bars import BarSeries  # type: ignore
+        return BarSeries.from_arrays(**cols)
     except Exception:
-        return out
+        return pd.DataFrame(cols)
 
 
-def _trades_to_tick_bars(trades: List[Dict[str, Any]], ticks_per_bar: int) -> Any:
+def _trades_to_tick_bars(trades: Any, ticks_per_bar: int) -> Any:
     n = max(1, int(ticks_per_bar))
     if not trades:
         return []
 
-    rows = []
-    for t in trades:
-        ts = t.get("T") or t.get("time") or t.get("ts") or t.get("timestamp")
-        px = t.get("p") or t.get("price") or t.get("c")
-        qty = t.get("q") or t.get("qty") or t.get("volume") or 0.0
-        if ts is None or px is None:
-            continue
-        rows.append((int(ts), float(px), float(qty)))
-    if not rows:
+    ts, px, qty = _trades_to_arrays(trades)
+    if ts.shape[0] == 0:
         return []
 
-    # chunk by ticks_per_bar
-    out_rows = []
-    for i in range(0, len(rows), n):
-        chunk = rows[i:i+n]
-        if not chunk:
-            continue
-        ts0 = chunk[0][0]
-        prices = [c[1] for c in chunk]
-        qtys = [c[2] for c in chunk]
-        out_rows.append((ts0, prices[0], max(prices), min(prices), prices[-1], float(sum(qtys))))
+    # chunk by ticks_per_bar (compiled kernel when numba is installed)
+    import pandas as pd
+    from ew6.data._agg_numba import tick_bars  # type: ignore
+    bar_ts, ohlcv = tick_bars(ts, px, qty, n)
 
-    out = pd.DataFrame(out_rows, columns=["ts","open","high","low","close","volume"])
+    cols = {"ts": bar_ts, "open": ohlcv[:, 0], "high": ohlcv[:, 1], "low": ohlcv[:, 2], "close": ohlcv[:, 3], "volume": ohlcv[:, 4]}
     try:
-        from ew6.data.bars import Bar, BarSeries  # type: ignore
-        bars = [Bar(ts=int(r.ts), open=float(r.open), high=float(r.high), low=float(r.low), close=float(r.close), volume=float(r.volume))
-                for r in out.itertuples(index=False)]
-        return BarSeries.from_bars(bars)
+        from ew6.data.bars import BarSeries  # type: ignore
+        return BarSeries.from_arrays(**cols)
     except Exception:
-        return out
+        return pd.DataFrame(cols)
 
 
 def _load_from_binance(
@@ -308,7 +501,7 @@ def _load_from_binance(
     max_trades: int,
     progress: bool,
 ) -> Tuple[Any, Any]:
-    conn = _binance_connector(progress=progress)
+    conn = _shared_connector(progress=progress)
     inst = _make_instrument(symbol, market=str(market).lower(), venue="binance")
 
     if data.lower() == "ohlcv":
@@ -326,8 +519,25 @@ def _load_from_binance(
     return bars, conn
 
 
+def _prefetch_ohlcv(pairs: List[Tuple[str, str]], args: argparse.Namespace) -> List[Any]:
+    """Fetch OHLCV for all (symbol, timeframe) pairs concurrently; [None]*n when not applicable.
+
+    Network latency overlaps across pairs instead of adding up. Trades data is paginated
+    per job and still fetched inside the job.
+    """
+    if str(args.binance_data).lower() != "ohlcv" or len(pairs) < 2:
+        return [None] * len(pairs)
+    from ew6.exchange.binance.async_connector import fetch_ohlcv_many  # type: ignore
+
+    market = str(args.binance_market).lower()
+    reqs = [_OHLCVReq(instrument=_make_instrument(sym, market=market, venue="binance"), timeframe=tf, limit=1000)
+            for sym, tf in pairs]
+    return fetch_ohlcv_many(_shared_connector(progress=args.progress), reqs)
+
+
 # ----------------------- Swings / Analyzer --------------------------
 
+@memoize_to_disk
 def _extract_swings(bars: Any, pct: float) -> Any:
     from ew6.swing import zigzag as zz  # type: ignore
 
@@ -339,12 +549,12 @@ def _extract_swings(bars: Any, pct: float) -> Any:
         return zz.extract_swings(bars, cfg) if cfg is not None else zz.extract_swings(bars, float(pct))
 
     # function variants returning a list of SwingPoint
-    df = _to_df(bars)
-    if df.empty:
+    view = _bars_view(bars)
+    if "close" not in view or len(view["close"]) == 0:
         return []
-    high = df["high"] if "high" in df.columns else df["close"]
-    low = df["low"] if "low" in df.columns else df["close"]
-    close = df["close"] if "close" in df.columns else high
+    close = view["close"]
+    high = view.get("high", close)
+    low = view.get("low", close)
 
     if hasattr(zz, "zigzag_from_hl"):
         return zz.zigzag_from_hl(high, low, pct=float(pct))
@@ -354,6 +564,7 @@ def _extract_swings(bars: Any, pct: float) -> Any:
     raise RuntimeError("No swing extractor available in ew6.swing.zigzag")
 
 
+@memoize_to_disk
 def _detect_patterns(swings: Any, options: Any) -> Any:
     from ew6.ew.detectors.analyzer import AnalyzerConfig, scan_impulses_from_swings  # type: ignore
 
@@ -375,15 +586,128 @@ def _detect_patterns(swings: Any, options: Any) -> Any:
 def _summarize_patterns(patterns: Any) -> Tuple[float, float]:
     if not patterns:
         return 0.0, 0.0
-    # patterns with .meta dict
+    # patterns with .meta dict: one pass, each meta touched once. Seeded from the first
+    # pattern like max(): the first max wins on ties, and a NaN first score is kept
     try:
-        best = max(patterns, key=lambda p: float(getattr(p, "meta", {}).get("score", 0.0)))
-        meta = getattr(best, "meta", {}) or {}
-        return float(meta.get("score", 0.0)), float(meta.get("confidence", 0.0))
+        it = iter(patterns)
+        best_meta: Dict[str, Any] = getattr(next(it), "meta", None) or {}
+        best_score = float(best_meta.get("score", 0.0))
+        for p in it:
+            m = getattr(p, "meta", None) or {}
+            sc = float(m.get("score", 0.0))
+            if sc > best_score:
+                best_score, best_meta = sc, m
+        return best_score, float(best_meta.get("confidence", 0.0))
     except Exception:
         return 0.0, 0.0
 
 
+# ----------------------------- jobs -----------------------------
+
+def _run_one_job(
+    sym: str, tf: str, args: argparse.Namespace, opts: Any, btkw: Dict[str, Any], bars: Any = None
+) -> Tuple[JobResult, Any, str]:
+    """fetch -> swings -> detect -> backtest -> walk-forward for one (symbol, timeframe).
+
+    Module-level and argument-only so it can run in a worker process (--jobs).
+    `bars` skips the fetch when main already prefetched them.
+    Returns (JobResult, backtest trades or None, bar range string).
+    """
+    if bars is None:
+        bars, _conn = _load_from_binance(
+            symbol=sym,
+            market=args.binance_market,
+            data=args.binance_data,
+            timeframe=tf,
+            lookback_hours=args.lookback_hours,
+            bar_type=args.bar_type,
+            ticks_per_bar=args.ticks_per_bar,
+            max_trades=args.max_trades,
+            progress=args.progress,
+        )
+
+    # swings
+    swings = _extract_swings(bars, pct=float(args.zigzag_pct))
+
+    # tune options using swings
+    opts2 = opts
+    tuned = 0
+    if args.tune:
+        try:
+            from ew6.ew.detectors.tuner import tune_wave_options  # type: ignore
+            tr = tune_wave_options(swings, opts)
+            opts2 = getattr(tr, "options", opts2)
+            tuned = 1
+        except Exception as e:
+            log.warning("tune failed: %s", e)
+
+    patterns = _detect_patterns(swings, opts2)
+    best_score, best_conf = _summarize_patterns(patterns)
+
+    # backtest
+    bt_rep = None
+    bt_trades = None
+    if args.backtest:
+        try:
+            from ew6.backtest.simple import backtest_patterns  # type: ignore
+            bt_rep, bt_trades = _bt_call(backtest_patterns, patterns, bars, btkw)
+        except Exception as e:
+            log.error("backtest failed: %s", e)
+
+    # walk-forward (only meaningful with backtest)
+    wf: Dict[str, Any] = {}
+    if args.walk_forward and args.backtest:
+        try:
+            from ew6.run.walkforward import walk_forward_metrics  # type: ignore
+            wf = walk_forward_metrics(
+                bars,
+                zigzag_pct=float(args.zigzag_pct),
+                options=opts2,
+                splits=int(args.wf_splits),
+                min_bars_per_split=int(args.wf_min_bars),
+                backtest_kwargs=btkw,
+                mode=str(args.wf_mode),
+                train_bars=(int(args.wf_train_bars) if int(args.wf_train_bars) > 0 else None),
+                test_bars=(int(args.wf_test_bars) if int(args.wf_test_bars) > 0 else None),
+                step_bars=(int(args.wf_step_bars) if int(args.wf_step_bars) > 0 else None),
+            )
+        except Exception as e:
+            log.error("walk-forward failed: %s", e)
+
+    jr = JobResult(
+        symbol=sym,
+        timeframe=tf,
+        bars=int(len(bars) if hasattr(bars, "__len__") else 0),
+        swings=int(len(swings) if hasattr(swings, "__len__") else 0),
+        patterns=int(len(patterns) if hasattr(patterns, "__len__") else 0),
+        best_score=float(best_score),
+        best_conf=float(best_conf),
+        tuned=int(tuned),
+    )
+
+    # fill backtest metrics
+    if bt_rep is not None:
+        from ew6.run.batch import bt_fields
+
+        for dst, val in bt_fields(bt_rep).items():
+            setattr(jr, dst, val)
+
+    # wf fields
+    if wf:
+        jr.wf_mode = str(args.wf_mode)
+        jr.wf_splits = float(wf.get("wf_splits", wf.get("wf_splits_eff", 0)) or 0.0)
+        jr.wf_score = float(wf.get("wf_score", 0.0) or 0.0)
+        jr.wf_pos = float(wf.get("wf_pos_frac", wf.get("wf_pos", 0.0)) or 0.0)
+        jr.wf_ret_mu = float(wf.get("wf_ret_mu", wf.get("wf_ret_mean", 0.0)) or 0.0)
+        jr.wf_ret_sd = float(wf.get("wf_ret_sd", wf.get("wf_ret_std", 0.0)) or 0.0)
+
+    return jr, bt_trades, _bars_range_str(bars)
+
+
+def _run_one_job_star(job: Tuple[Any, ...]) -> Tuple[JobResult, Any, str]:
+    return _run_one_job(*job)
+
+
 # ----------------------------- main -----------------------------
 
 def build_parser() -> argparse.ArgumentParser:
@@ -401,6 +725,8 @@ def build_parser() -> argparse.ArgumentParser:
     p.add_argument("--ticks_per_bar", type=int, default=50)
     p.add_argument("--max_trades", type=int, default=200000)
     p.add_argument("--progress", action="store_true")
+    p.add_argument("--jobs", type=int, default=1,
+                   help="Worker processes for symbol x timeframe jobs (default 1 = serial)")
 
     # EW / backtest
     p.add_argument("--zigzag_pct", type=float, default=0.5)
@@ -439,6 +765,7 @@ def build_parser() -> argparse.ArgumentParser:
     # logging/config
     p.add_argument("--config", default=os.environ.get("EW6_CONFIG", ""))
     p.add_argument("--log_level", default=os.environ.get("EW6_LOG_LEVEL", "info"))
+    p.add_argument("--disk_cache", action="store_true", help="reuse swings/patterns from EW6_CACHE_DIR (~/.cache/ew6)")
 
     return p
 
@@ -450,6 +777,8 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
 
     cfg = load_config(defaults={}, file_path=args.config or None)
     setup_logging(LogConfig(level=str(args.log_level)))
+    if args.disk_cache:
+        os.environ["EW6_DISK_CACHE"] = "1"  # read per call by ew6.cache (and by --jobs workers)
 
     # symbols/timeframes
     sym_list = _parse_csv_list(args.symbols)
@@ -464,9 +793,6 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
     from ew6.ew.core.options import WaveOptions  # type: ignore
     opts = WaveOptions()
 
-    # tuning
-    tune_enabled = bool(args.tune)
-
     # backtest kwargs (filtering is inside backtest in most versions; we keep minimal)
     btkw: Dict[str, Any] = {
         "initial_cash": 10_000.0,
@@ -476,155 +802,84 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
         "slippage_bps": float(args.slippage_bps),
     }
 
-    # import backtest
-    from ew6.backtest.simple import backtest_patterns  # type: ignore
-
-    # walk-forward
-    from ew6.run.walkforward import walk_forward_metrics  # type: ignore
-
     # notify
     notify_channels = (args.notify_channels or str(cfg.get("notify_channels", ""))).strip()
     do_notify = bool(args.notify) and bool(notify_channels)
 
-    # ranker
-    from ew6.run.rank import rank_results  # type: ignore
-
-    results: List[JobResult] = []
-    reco_input: List[Tuple[str, str, Dict[str, Any]]] = []
     last_trades_any: Optional[Any] = None
 
-    for sym in sym_list:
-        for tf in tf_list:
-            bars, conn = _load_from_binance(
-                symbol=sym,
-                market=args.binance_market,
-                data=args.binance_data,
-                timeframe=tf,
-                lookback_hours=args.lookback_hours,
-                bar_type=args.bar_type,
-                ticks_per_bar=args.ticks_per_bar,
-                max_trades=args.max_trades,
-                progress=args.progress,
-            )
+    # independent (symbol, timeframe) jobs; results are consumed in submission order
+    pairs = [(sym, tf) for sym in sym_list for tf in tf_list]
+    prefetched = _prefetch_ohlcv(pairs, args)
+    jobs = [(sym, tf, args, opts, btkw, b) for (sym, tf), b in zip(pairs, prefetched)]
+    results = _new_results(len(jobs))
+    n_workers = max(1, min(int(args.jobs or 1), len(jobs)))
+    executor = spawn_pool(n_workers) if n_workers > 1 else None
+    outputs = executor.map(_run_one_job_star, jobs) if executor is not None else map(_run_one_job_star, jobs)
 
-            # swings
-            swings = _extract_swings(bars, pct=float(args.zigzag_pct))
-
-            # tune options using swings
-            opts2 = opts
-            tuned = 0
-            if tune_enabled:
-                try:
-                    from ew6.ew.detectors.tuner import tune_wave_options  # type: ignore
-                    tr = tune_wave_options(swings, opts)
-                    opts2 = getattr(tr, "options", opts2)
-                    tuned = 1
-                except Exception as e:
-                    log.warning("tune failed: %s", e)
-
-            patterns = _detect_patterns(swings, opts2)
-            best_score, best_conf = _summarize_patterns(patterns)
-
-            # backtest
-            bt_rep = None
-            bt_trades = None
-            if args.backtest:
-                try:
-                    bt_rep, bt_trades = _bt_call(backtest_patterns, patterns, bars, btkw)
-                    last_trades_any = bt_trades
-                except Exception as e:
-                    log.error("backtest failed: %s", e)
-
-            # walk-forward (only meaningful with backtest)
-            wf: Dict[str, Any] = {}
-            if args.walk_forward and args.backtest:
-                try:
-                    wf = walk_forward_metrics(
-                        bars,
-                        zigzag_pct=float(args.zigzag_pct),
-                        options=opts2,
-                        splits=int(args.wf_splits),
-                        min_bars_per_split=int(args.wf_min_bars),
-                        backtest_kwargs=btkw,
-                        mode=str(args.wf_mode),
-                        train_bars=(int(args.wf_train_bars) if int(args.wf_train_bars) > 0 else None),
-                        test_bars=(int(args.wf_test_bars) if int(args.wf_test_bars) > 0 else None),
-                        step_bars=(int(args.wf_step_bars) if int(args.wf_step_bars) > 0 else None),
-                    )
-                except Exception as e:
-                    log.error("walk-forward failed: %s", e)
-
-            jr = JobResult(
-                symbol=sym,
-                timeframe=tf,
-                bars=int(len(bars) if hasattr(bars, "__len__") else 0),
-                swings=int(len(swings) if hasattr(swings, "__len__") else 0),
-                patterns=int(len(patterns) if hasattr(patterns, "__len__") else 0),
-                best_score=float(best_score),
-                best_conf=float(best_conf),
-                tuned=int(tuned),
-            )
+    out_lines: List[str] = []
+    try:
+        for i, (jr, bt_trades, rng) in enumerate(outputs):
+            if args.backtest and bt_trades is not None:
+                last_trades_any = bt_trades
+            results[i] = tuple(getattr(jr, name) for name in _JOB_FIELDS)
 
-            # fill backtest metrics
-            if bt_rep is not None:
-                # support multiple report field names across versions
-                jr.bt_trades = int(getattr(bt_rep, "trades", getattr(bt_rep, "n_trades", 0)) or 0)
-                jr.bt_winrate = float(getattr(bt_rep, "winrate", 0.0) or 0.0)
-                jr.bt_mdd = float(getattr(bt_rep, "max_drawdown", getattr(bt_rep, "mdd", 0.0)) or 0.0)
-                jr.bt_totalret = float(getattr(bt_rep, "total_return", getattr(bt_rep, "total_ret", 0.0)) or 0.0)
-                jr.bt_equity = float(getattr(bt_rep, "final_equity", getattr(bt_rep, "equity_end", 0.0)) or 0.0)
-                jr.bt_pf = float(getattr(bt_rep, "profit_factor", getattr(bt_rep, "pf", 0.0)) or 0.0)
-                jr.bt_sharpe = float(getattr(bt_rep, "sharpe_like", getattr(bt_rep, "sharpe", 0.0)) or 0.0)
-
-            # wf fields
-            if wf:
-                jr.wf_mode = str(args.wf_mode)
-                jr.wf_splits = float(wf.get("wf_splits", wf.get("wf_splits_eff", 0)) or 0.0)
-                jr.wf_score = float(wf.get("wf_score", 0.0) or 0.0)
-                jr.wf_pos = float(wf.get("wf_pos_frac", wf.get("wf_pos", 0.0)) or 0.0)
-                jr.wf_ret_mu = float(wf.get("wf_ret_mu", wf.get("wf_ret_mean", 0.0)) or 0.0)
-                jr.wf_ret_sd = float(wf.get("wf_ret_sd", wf.get("wf_ret_std", 0.0)) or 0.0)
-
-            results.append(jr)
-            reco_input.append((jr.symbol, jr.timeframe, jr.to_dict()))
-
-            # compact one-line
-            rng = _bars_range_str(bars)
-            print(
+            # compact one-line (buffered unless --progress: one write for the whole batch)
+            out_lines.append(
                 f"symbol={jr.symbol} tf={jr.timeframe} bars={jr.bars} {rng} "
                 f"swings={jr.swings} patterns={jr.patterns} best_score={jr.best_score:.2f} best_conf={jr.best_conf:.2f} "
                 f"tuned={jr.tuned} "
                 + (f"bt_trades={jr.bt_trades} bt_winrate={jr.bt_winrate:.2f} bt_mdd={jr.bt_mdd:.2f} bt_totalret={jr.bt_totalret:.2f} bt_equity={jr.bt_equity:.2f} bt_pf={jr.bt_pf:.2f} bt_sharpe={jr.bt_sharpe:.2f} " if args.backtest else "")
                 + (f"wf_mode={jr.wf_mode} wf_score={jr.wf_score:.2f} wf_pos={jr.wf_pos:.2f} wf_ret_mu={jr.wf_ret_mu:.2f} wf_ret_sd={jr.wf_ret_sd:.2f}" if args.walk_forward and args.backtest else "")
+                + "\n"
             )
+            if args.progress:
+                sys.stdout.write(out_lines.pop())
+                sys.stdout.flush()
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if out_lines:
+            sys.stdout.write("".join(out_lines))
+            sys.stdout.flush()
 
     # exports
     if args.export_report:
         _ensure_dir(args.export_report)
         with open(args.export_report, "w", encoding="utf-8") as f:
-            json.dump([r.to_dict() for r in results], f, ensure_ascii=False, indent=2)
+            _write_json_rows(f, _job_row_dicts(results))
 
     if args.export_report_csv:
         _ensure_dir(args.export_report_csv)
-        pd.DataFrame([r.to_dict() for r in results]).to_csv(args.export_report_csv, index=False)
+        _write_columns(args.export_report_csv, {name: results[name] for name in _JOB_FIELDS})
 
     if args.export_trades and last_trades_any is not None:
         _ensure_dir(args.export_trades)
         try:
-            # trades list of dicts
+            import pandas as pd
+
+            # trades: TradesSoA (columns), DataFrame, or list of dicts
             if isinstance(last_trades_any, pd.DataFrame):
-                last_trades_any.to_csv(args.export_trades, index=False)
+                cols = {c: last_trades_any[c].to_numpy() for c in last_trades_any.columns}
+            elif hasattr(last_trades_any, "to_dataframe"):
+                cols = {f.name: getattr(last_trades_any, f.name) for f in fields(last_trades_any)}
             else:
-                pd.DataFrame(list(last_trades_any)).to_csv(args.export_trades, index=False)
+                df_tr = pd.DataFrame(list(last_trades_any))
+                cols = {c: df_tr[c].to_numpy() for c in df_tr.columns}
+            _write_columns(args.export_trades, cols)
         except Exception as e:
             log.warning("export_trades failed: %s", e)
 
-    ranked = rank_results(reco_input, top=int(args.rank_top), oos_weight=float(args.rank_oos_weight))
+    ranked: List[Any] = []
+    if int(args.rank_top) > 0:
+        from ew6.run.rank import rank_results  # type: ignore
+        reco_input = ((r["symbol"], r["timeframe"], r) for r in _job_row_dicts(results))
+        ranked = rank_results(reco_input, top=int(args.rank_top), oos_weight=float(args.rank_oos_weight))
     print("recommendations=" + ", ".join([f"{x.symbol}:{x.timeframe}:{x.score:.3f}" for x in ranked]))
     if args.export_reco:
         _ensure_dir(args.export_reco)
         with open(args.export_reco, "w", encoding="utf-8") as f:
-            json.dump([x.__dict__ for x in ranked], f, ensure_ascii=False, indent=2)
+            _write_json_rows(f, (x.__dict__ for x in ranked))
 
     # notifications (optional)
     if do_notify:
@@ -639,7 +894,7 @@ def main(argv: Optional[Sequence[str]] = None) -> int:
             _notify_title = f"EW6 Report ({','.join(sym_list)} | {','.join(tf_list)})"
 
             notify_run(
-                results=[r.to_dict() for r in results],
+                results=list(_job_row_dicts(results)),
                 ranked=[x.__dict__ for x in ranked],
                 channels=_parse_csv_list(notify_channels),
                 fmt=str(args.notify_format),
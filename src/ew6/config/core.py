@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import copy
+import functools
 import json
 import os
+import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
@@ -19,28 +22,36 @@ def merge_dicts(base: Dict[str, Any], overlay: Dict[str, Any]) -> Dict[str, Any]
             out[k] = v
     return out
 
+# One match classifies a scalar: 1=bool, 2=int, 3=float, 4=JSON object/array.
+# Mirrors the int()/float() fallback order, "_" digit separators included ("1_000", "0_1",
+# "1_000.5"); unsigned ints with a leading zero ("007") are floats.
+_DIGITS = r"\d(?:_?\d)*"
+_SCALAR_RX = re.compile(
+    r"(true|false)"
+    rf"|([+-]{_DIGITS}|0(?:_{_DIGITS})?|(?!0){_DIGITS})"
+    rf"|([+-]?(?:(?:{_DIGITS}(?:\.(?:{_DIGITS})?)?|\.{_DIGITS})(?:e[+-]?{_DIGITS})?|inf(?:inity)?|nan))"
+    r"|([\{\[].*[\}\]])",
+    re.I | re.S,
+)
+
 def _parse_scalar(v: str) -> Any:
     s = v.strip()
-    if s.lower() in ("true","false"):
+    m = _SCALAR_RX.fullmatch(s)
+    if m is None:
+        return s
+    g = m.lastindex
+    if g == 1:
         return s.lower() == "true"
-    try:
-        if s.startswith("0") and len(s) > 1 and s[1].isdigit():
-            raise ValueError
+    if g == 2:
         return int(s)
-    except Exception:
-        pass
-    try:
+    if g == 3:
         return float(s)
+    try:
+        return json.loads(s)
     except Exception:
-        pass
-    if (s.startswith("{") and s.endswith("}")) or (s.startswith("[") and s.endswith("]")):
-        try:
-            return json.loads(s)
-        except Exception:
-            pass
-    return s
+        return s
 
-def _env_to_dict(prefix: str="EW6_") -> Dict[str, Any]:
+def _parse_env(prefix: str="EW6_") -> Dict[str, Any]:
     out: Dict[str, Any] = {}
     for k, v in os.environ.items():
         if not k.startswith(prefix):
@@ -56,10 +67,23 @@ def _env_to_dict(prefix: str="EW6_") -> Dict[str, Any]:
         cur[path[-1]] = _parse_scalar(v)
     return out
 
-def _load_file(path: str) -> Dict[str, Any]:
-    p = path.strip()
-    if not p:
-        return {}
+# Parsed environment per prefix; the process env is read once unless reload_env_cache() is called.
+_ENV_CACHE: Dict[str, Dict[str, Any]] = {}
+
+def reload_env_cache() -> None:
+    """Drop cached EW6_* environment parses (call after mutating os.environ)."""
+    _ENV_CACHE.clear()
+
+def _env_to_dict(prefix: str="EW6_") -> Dict[str, Any]:
+    cached = _ENV_CACHE.get(prefix)
+    if cached is None:
+        cached = _ENV_CACHE[prefix] = _parse_env(prefix)
+    # callers merge into and may mutate the result; hand out a private copy
+    return copy.deepcopy(cached)
+
+@functools.lru_cache(maxsize=32)
+def _load_file_cached(p: str, mtime_ns: int) -> Dict[str, Any]:
+    # mtime_ns is part of the cache key only: an edited file gets a fresh parse.
     with open(p, "rb") as f:
         raw = f.read()
     if p.lower().endswith(".json"):
@@ -70,6 +94,12 @@ def _load_file(path: str) -> Dict[str, Any]:
         return tomllib.loads(raw.decode("utf-8"))
     raise RuntimeError(f"Unsupported config format for {p} (use .toml or .json)")
 
+def _load_file(path: str) -> Dict[str, Any]:
+    p = path.strip()
+    if not p:
+        return {}
+    return copy.deepcopy(_load_file_cached(p, os.stat(p).st_mtime_ns))
+
 @dataclass
 class Config:
     data: Dict[str, Any] = field(default_factory=dict)
@@ -8,14 +8,19 @@ Design:
   - Provider returns a dict-like config payload.
   - ConfigManager composes multiple providers with precedence order.
   - Optional periodic refresh can be implemented by providers (V2).
+  - Env/file payloads are memoized (env: the prefixed variables; file: path+mtime+size).
+    A provider may expose `cache_key()`; ConfigManager reuses its merged dict while
+    all keys are unchanged. `ConfigManager.reload()` drops every cache.
 
 NOTE: Keep dependencies minimal (stdlib only).
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, Iterable, List, Mapping, Optional, Protocol, runtime_checkable
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Hashable, Iterable, List, Mapping, Optional, Protocol, Tuple, runtime_checkable
+import copy
 import json
 import os
 
@@ -30,12 +35,22 @@ class ConfigProvider(Protocol):
 
 
 def _deep_merge(a: Dict[str, Any], b: Mapping[str, Any]) -> Dict[str, Any]:
-    """Merge mapping b into dict a (recursive for dict values)."""
-    for k, v in b.items():
-        if isinstance(v, Mapping) and isinstance(a.get(k), Mapping):
-            a[k] = _deep_merge(dict(a[k]), v)  # type: ignore[arg-type]
-        else:
-            a[k] = v
+    """Merge mapping b into dict a (nested mappings are merged, not replaced).
+
+    Iterative: an explicit stack of (dst, src) pairs instead of one call frame per level.
+    A sub-dict of `a` that receives keys is shallow-copied first, since it may still be
+    shared with a provider payload (DictProvider returns a shallow copy of its data).
+    """
+    stack = [(a, b)]
+    while stack:
+        dst, src = stack.pop()
+        for k, v in src.items():
+            cur = dst.get(k)
+            if isinstance(v, Mapping) and isinstance(cur, Mapping):
+                dst[k] = node = dict(cur)
+                stack.append((node, v))
+            else:
+                dst[k] = v
     return a
 
 
@@ -48,22 +63,33 @@ def _set_nested(d: Dict[str, Any], keys: List[str], value: Any) -> None:
     cur[keys[-1]] = value
 
 
+_TRUE = frozenset({"true", "1", "yes", "y", "on"})
+_FALSE = frozenset({"false", "0", "no", "n", "off"})
+_NUM_START = frozenset("+-0123456789.")
+_JSON_END = {"{": "}", "[": "]"}
+
+
 def _coerce_value(s: str) -> Any:
-    # bool
     sl = s.strip().lower()
-    if sl in {"true", "1", "yes", "y", "on"}:
+    # bool
+    if sl in _TRUE:
         return True
-    if sl in {"false", "0", "no", "n", "off"}:
+    if sl in _FALSE:
         return False
-    # int/float
-    try:
-        if "." in sl:
-            return float(sl)
-        return int(sl)
-    except Exception:
-        pass
+    if not sl:
+        return s
+    c = sl[0]
+    # int/float: only attempt a parse when the first char can start a number
+    if c in _NUM_START or c.isdigit():
+        try:
+            if "." in sl:
+                return float(sl)
+            return int(sl)
+        except ValueError:
+            pass
     # json
-    if (sl.startswith("{") and sl.endswith("}")) or (sl.startswith("[") and sl.endswith("]")):
+    end = _JSON_END.get(c)
+    if end is not None and sl[-1] == end:
         try:
             return json.loads(s)
         except Exception:
@@ -96,17 +122,23 @@ class EnvProvider:
     prefix: str = "EW6_"
     sep: str = "__"
 
+    def cache_key(self) -> Hashable:
+        return (self.prefix, self.sep, tuple((k, v) for k, v in os.environ.items() if k.startswith(self.prefix)))
+
     def load(self) -> Dict[str, Any]:
-        out: Dict[str, Any] = {}
-        for k, v in os.environ.items():
-            if not k.startswith(self.prefix):
-                continue
-            key = k[len(self.prefix):]
-            parts = [p.strip().lower() for p in key.split(self.sep) if p.strip()]
-            if not parts:
-                continue
-            _set_nested(out, parts, _coerce_value(v))
-        return out
+        return copy.deepcopy(_env_payload(self.cache_key()))
+
+
+@lru_cache(maxsize=8)
+def _env_payload(key: Tuple[str, str, Tuple[Tuple[str, str], ...]]) -> Dict[str, Any]:
+    prefix, sep, items = key
+    out: Dict[str, Any] = {}
+    for k, v in items:
+        parts = [p.strip().lower() for p in k[len(prefix):].split(sep) if p.strip()]
+        if not parts:
+            continue
+        _set_nested(out, parts, _coerce_value(v))
+    return out
 
 
 @dataclass
@@ -117,39 +149,53 @@ class FileProvider:
     path: str = ""
     optional: bool = True
 
-    def load(self) -> Dict[str, Any]:
+    def cache_key(self) -> Hashable:
         if not self.path:
+            return None
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return (self.path, None, None)
+        return (self.path, st.st_mtime_ns, st.st_size)
+
+    def load(self) -> Dict[str, Any]:
+        key = self.cache_key()
+        if key is None:
             return {}
-        if not os.path.exists(self.path):
+        if key[1] is None:
             if self.optional:
                 return {}
             raise FileNotFoundError(self.path)
+        return copy.deepcopy(_parse_file(*key))
 
-        with open(self.path, "rb") as f:
-            raw = f.read()
 
-        # detect
-        p = self.path.lower()
-        if p.endswith(".json"):
-            return json.loads(raw.decode("utf-8"))
+@lru_cache(maxsize=32)
+def _parse_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    with open(path, "rb") as f:
+        raw = f.read()
 
-        if p.endswith(".toml"):
-            try:
-                import tomllib  # py3.11+
-            except Exception:
-                # minimal fallback: allow empty
-                raise RuntimeError("TOML config requires tomllib (python>=3.11)")
-            return tomllib.loads(raw.decode("utf-8"))
+    # detect
+    p = path.lower()
+    if p.endswith(".json"):
+        return json.loads(raw.decode("utf-8"))
 
-        # try json then toml
+    if p.endswith(".toml"):
         try:
-            return json.loads(raw.decode("utf-8"))
+            import tomllib  # py3.11+
         except Exception:
-            try:
-                import tomllib
-                return tomllib.loads(raw.decode("utf-8"))
-            except Exception as e:
-                raise RuntimeError(f"Unsupported config format: {self.path}") from e
+            # minimal fallback: allow empty
+            raise RuntimeError("TOML config requires tomllib (python>=3.11)")
+        return tomllib.loads(raw.decode("utf-8"))
+
+    # try json then toml
+    try:
+        return json.loads(raw.decode("utf-8"))
+    except Exception:
+        try:
+            import tomllib
+            return tomllib.loads(raw.decode("utf-8"))
+        except Exception as e:
+            raise RuntimeError(f"Unsupported config format: {path}") from e
 
 
 @dataclass
@@ -180,11 +226,34 @@ class ConfigManager:
     """Compose providers in precedence order (later overrides earlier)."""
 
     providers: List[ConfigProvider]
+    _merged_key: Optional[Tuple[Hashable, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _merged: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+
+    def _key(self) -> Optional[Tuple[Hashable, ...]]:
+        keys = []
+        for p in self.providers:
+            fn = getattr(p, "cache_key", None)
+            if fn is None:
+                return None
+            keys.append((type(p).__name__, fn()))
+        return tuple(keys)
 
     def load(self) -> Dict[str, Any]:
+        key = self._key()
+        if key is not None and key == self._merged_key and self._merged is not None:
+            return copy.deepcopy(self._merged)
         merged: Dict[str, Any] = {}
         for p in self.providers:
             payload = p.load()
             if payload:
                 _deep_merge(merged, payload)
+        if key is not None:
+            self._merged_key, self._merged = key, copy.deepcopy(merged)
         return merged
+
+    def reload(self) -> Dict[str, Any]:
+        """Drop cached env/file payloads and the merged dict, then load again."""
+        self._merged_key = self._merged = None
+        _env_payload.cache_clear()
+        _parse_file.cache_clear()
+        return self.load()
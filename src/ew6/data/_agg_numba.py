@@ -0,0 +1,81 @@
+"""Compiled tick-bar aggregation (fixed trade count per bar).
+
+Numba is an optional extra (`pip install -e .[fast]`). Without it, `tick_bars` uses an
+equivalent NumPy `reduceat` path over the same arrays: identical OHLC (NaN prices
+propagate on both), volume equal up to summation order (last-bit rounding).
+
+Inputs are 1-D arrays of equal length: ts (int64 ms), px, qty (float64).
+Bar timestamp is the timestamp of the first trade in the bar (CLI convention).
+Returns (bar_ts[m], ohlcv[m, 5]) with columns open, high, low, close, volume.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+
+
+def _tick_bars_loop(ts, px, qty, n):
+    size = ts.shape[0]
+    m = (size + n - 1) // n
+    bar_ts = np.empty(m, dtype=np.int64)
+    ohlcv = np.empty((m, 5), dtype=np.float64)
+    for b in range(m):
+        i0 = b * n
+        i1 = min(i0 + n, size)
+        o = px[i0]
+        hi = o
+        lo = o
+        vol = 0.0
+        for i in range(i0, i1):
+            p = px[i]
+            # a NaN price wins, as in np.maximum / np.minimum (the fallback path)
+            if p > hi or p != p:
+                hi = p
+            if p < lo or p != p:
+                lo = p
+            vol += qty[i]
+        bar_ts[b] = ts[i0]
+        ohlcv[b, 0] = o
+        ohlcv[b, 1] = hi
+        ohlcv[b, 2] = lo
+        ohlcv[b, 3] = px[i1 - 1]
+        ohlcv[b, 4] = vol
+    return bar_ts, ohlcv
+
+
+if njit is not None:
+    tick_bars_nb = njit(cache=True)(_tick_bars_loop)
+else:  # pragma: no cover
+    tick_bars_nb = None
+
+
+def _tick_bars_np(ts: np.ndarray, px: np.ndarray, qty: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    size = ts.shape[0]
+    starts = np.arange(0, size, n)
+    ohlcv = np.empty((starts.shape[0], 5), dtype=np.float64)
+    ohlcv[:, 0] = px[starts]
+    ohlcv[:, 1] = np.maximum.reduceat(px, starts)
+    ohlcv[:, 2] = np.minimum.reduceat(px, starts)
+    ohlcv[:, 3] = px[np.minimum(starts + n, size) - 1]
+    ohlcv[:, 4] = np.add.reduceat(qty, starts)
+    return ts[starts], ohlcv
+
+
+def tick_bars(ts: np.ndarray, px: np.ndarray, qty: np.ndarray, n: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Aggregate every `n` consecutive trades into one OHLCV bar (Numba kernel when available)."""
+    t = np.ascontiguousarray(ts, dtype=np.int64)
+    p = np.ascontiguousarray(px, dtype=np.float64)
+    q = np.ascontiguousarray(qty, dtype=np.float64)
+    n = max(1, int(n))
+    if t.shape[0] == 0:
+        return np.empty(0, dtype=np.int64), np.empty((0, 5), dtype=np.float64)
+    if tick_bars_nb is None:
+        return _tick_bars_np(t, p, q, n)
+    return tick_bars_nb(t, p, q, n)
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Literal
+from typing import TYPE_CHECKING, Literal
 
-import pandas as pd
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 from .types import BarSeries
 
@@ -28,6 +31,8 @@ def resample_to_time_bars(df_ticks: pd.DataFrame, cfg: TimeBarConfig) -> BarSeri
     Expects df_ticks.index as DatetimeIndex and a 'price' column. If 'size' exists,
     it is used as volume.
     """
+    import pandas as pd
+
     if not isinstance(df_ticks.index, pd.DatetimeIndex):
         raise TypeError("df_ticks.index must be a pandas.DatetimeIndex")
     if "price" not in df_ticks.columns:
@@ -53,6 +58,8 @@ def build_tick_bars(df_ticks: pd.DataFrame, cfg: TickBarConfig) -> BarSeries:
 
     Bar timestamp is the timestamp of the last tick in the bar.
     """
+    import pandas as pd
+
     if cfg.ticks_per_bar <= 0:
         raise ValueError("ticks_per_bar must be > 0")
     if not isinstance(df_ticks.index, pd.DatetimeIndex):
@@ -65,9 +72,42 @@ def build_tick_bars(df_ticks: pd.DataFrame, cfg: TickBarConfig) -> BarSeries:
     if n == 0:
         return BarSeries(pd.DataFrame(columns=["open","high","low","close","volume"]))
 
-    # assign group id per tick count
-    grp = (pd.Series(range(n), index=df.index) // cfg.ticks_per_bar).astype(int)
-    g = df.groupby(grp)
+    # groups are contiguous strides of ticks_per_bar: reduce over start offsets
+    tpb = int(cfg.ticks_per_bar)
+    starts = np.arange(0, n, tpb)
+    last = np.minimum(starts + tpb, n) - 1
+    px = df["price"].to_numpy()
+    if px.dtype.kind == "f" and np.isnan(px).any():
+        return _tick_bars_groupby(df, tpb, last)
+
+    out = pd.DataFrame(
+        {
+            "open": px[starts],
+            "high": np.maximum.reduceat(px, starts),
+            "low": np.minimum.reduceat(px, starts),
+            "close": px[last],
+        },
+        # timestamp = last tick timestamp in each group
+        index=df.index[last],
+    )
+    if "size" in df.columns:
+        size = df["size"].to_numpy()
+        if size.dtype.kind == "f":
+            size = np.where(np.isnan(size), 0.0, size)
+        out["volume"] = np.add.reduceat(size, starts)
+    else:
+        out["volume"] = 0.0
+    out.index.name = "ts"
+    return BarSeries(out)
+
+
+def _tick_bars_groupby(df: pd.DataFrame, tpb: int, last: np.ndarray) -> BarSeries:
+    """NaN-aware groupby path (first/last/max/min skip missing prices)."""
+    import pandas as pd
+
+    # group ids are already monotonic: no Series, no group re-sort
+    grp = np.arange(len(df), dtype=np.int64) // tpb
+    g = df.groupby(grp, sort=False)
 
     out = pd.DataFrame(
         {
@@ -82,8 +122,7 @@ def build_tick_bars(df_ticks: pd.DataFrame, cfg: TickBarConfig) -> BarSeries:
     else:
         out["volume"] = 0.0
 
-    # timestamp = last tick timestamp in each group
-    out.index = g.apply(lambda x: x.index[-1])
+    out.index = df.index[last]
     out.index.name = "ts"
     out = out.dropna(subset=["open", "high", "low", "close"])
     return BarSeries(out)
@@ -1,10 +1,10 @@
 """Minimal OHLCV bar models (stable surface).
 
 Some parts of the project (connectors/zigzag/CLI/export) expect a BarSeries with:
-- bars: list[Bar]
+- bars: list[Bar] (lazy view; storage is column arrays)
 - df: pandas DataFrame (DatetimeIndex UTC)
 - start_time / end_time properties
-- from_bars constructor
+- from_bars constructor (from_arrays for column arrays)
 
 We keep this module intentionally tiny and dependency-light.
 """
@@ -12,12 +12,15 @@ We keep this module intentionally tiny and dependency-light.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Iterator, List, Optional
+from typing import TYPE_CHECKING, Dict, Iterator, List, Mapping, Optional, Sequence, Union
 
-import pandas as pd
+import numpy as np
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Bar:
     ts: int  # milliseconds since epoch (UTC)
     open: float
@@ -27,49 +30,153 @@ class Bar:
     volume: float = 0.0
 
 
+_BAR_DTYPE = np.dtype(
+    [("ts", "i8"), ("open", "f8"), ("high", "f8"), ("low", "f8"), ("close", "f8"), ("volume", "f8")]
+)
+
+
+_COLS = _BAR_DTYPE.names
+
+
+def _bars_to_arrays(bars: Sequence[Bar]) -> Dict[str, np.ndarray]:
+    """One AoS -> SoA transpose: a single pass over `bars` into a typed buffer."""
+    rec = np.fromiter(
+        ((b.ts, b.open, b.high, b.low, b.close, b.volume) for b in bars),
+        dtype=_BAR_DTYPE,
+        count=len(bars),
+    )
+    return {name: np.ascontiguousarray(rec[name]) for name in _COLS}
+
+
 class BarSeries:
-    def __init__(self, bars: List[Bar]):
-        self.bars: List[Bar] = bars
+    """OHLCV series stored as column arrays (ts int64 ms, the rest float64).
+
+    Accepts a list of Bar (transposed once) or a mapping of column arrays.
+    `bars` is a lazily materialized list view kept for older callers.
+    Columns (and `df`, which wraps them) are read-only; `to_df` returns an editable copy.
+    """
+
+    def __init__(self, bars: Union[Sequence[Bar], Mapping[str, np.ndarray]]):
+        if isinstance(bars, Mapping):
+            n = len(bars["ts"])
+            self._arrays: Dict[str, np.ndarray] = {
+                name: (
+                    np.ascontiguousarray(bars[name], dtype=_BAR_DTYPE[name])
+                    if bars.get(name) is not None
+                    else np.zeros(n, dtype=_BAR_DTYPE[name])
+                )
+                for name in _COLS
+            }
+            self._bars: Optional[List[Bar]] = None
+        else:
+            self._arrays = _bars_to_arrays(bars)
+            self._bars = bars if isinstance(bars, list) else None
+        # read-only views: the columns, df and cached per-series results can never disagree
+        for name, arr in self._arrays.items():
+            view = arr.view()
+            view.flags.writeable = False
+            self._arrays[name] = view
         self._df: Optional[pd.DataFrame] = None
+        self._times: Dict[int, "pd.Timestamp"] = {}
 
     @staticmethod
     def from_bars(bars: List[Bar]) -> "BarSeries":
         return BarSeries(bars)
 
+    @staticmethod
+    def from_arrays(
+        ts: np.ndarray,
+        open: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: Optional[np.ndarray] = None,
+    ) -> "BarSeries":
+        """Build from column arrays (ts in ms) without creating per-row Bar objects.
+
+        Arrays already of the column dtype are wrapped, not copied; do not modify them afterwards.
+        """
+        return BarSeries({"ts": ts, "open": open, "high": high, "low": low, "close": close, "volume": volume})
+
+    @property
+    def bars(self) -> List[Bar]:
+        if self._bars is None:
+            self._bars = list(self._iter_arrays())
+        return self._bars
+
+    def _iter_arrays(self) -> Iterator[Bar]:
+        a = self._arrays
+        for t, o, h, l, c, v in zip(*(a[k].tolist() for k in _COLS)):
+            yield Bar(ts=t, open=o, high=h, low=l, close=c, volume=v)
+
     def __len__(self) -> int:
-        return len(self.bars)
+        return int(self._arrays["ts"].shape[0])
 
     def __iter__(self) -> Iterator[Bar]:
-        return iter(self.bars)
+        if self._bars is not None:
+            return iter(self._bars)
+        return self._iter_arrays()
 
     @property
     def df(self) -> pd.DataFrame:
         if self._df is None:
-            idx = pd.to_datetime([int(b.ts) for b in self.bars], unit="ms", utc=True)
-            self._df = pd.DataFrame(
-                {
-                    "ts": [int(b.ts) for b in self.bars],
-                    "open": [float(b.open) for b in self.bars],
-                    "high": [float(b.high) for b in self.bars],
-                    "low": [float(b.low) for b in self.bars],
-                    "close": [float(b.close) for b in self.bars],
-                    "volume": [float(b.volume) for b in self.bars],
-                },
-                index=idx,
-            )
+            import pandas as pd
+
+            a = self._arrays
+            idx = pd.to_datetime(a["ts"], unit="ms", utc=True)
+            self._df = pd.DataFrame(dict(a), index=idx, copy=False)
         return self._df
 
+    @property
+    def close_np(self) -> np.ndarray:
+        """Closes as a read-only contiguous float64 array."""
+        return self._arrays["close"]
+
     def to_df(self) -> pd.DataFrame:
         return self.df.copy()
 
+    def _col(self, name: str) -> np.ndarray:
+        return self._arrays[name]
+
+    # Column arrays (zero-copy, read-only; shared with df)
+    ts = property(lambda self: self._col("ts"))
+    open = property(lambda self: self._col("open"))
+    high = property(lambda self: self._col("high"))
+    low = property(lambda self: self._col("low"))
+    close = property(lambda self: self._col("close"))
+    volume = property(lambda self: self._col("volume"))
+
+    def _ts_at(self, i: int) -> Optional[int]:
+        ts = self._arrays["ts"]
+        return int(ts[i]) if ts.shape[0] else None
+
+    @property
+    def ts_first(self) -> Optional[int]:
+        """First bar timestamp in ms (None when empty)."""
+        return self._ts_at(0)
+
+    @property
+    def ts_last(self) -> Optional[int]:
+        """Last bar timestamp in ms (None when empty)."""
+        return self._ts_at(-1)
+
+    def _time_at(self, i: int):
+        """Timestamp of bar `i` (0 or -1), cached; reuses the df index when it exists."""
+        t = self._times.get(i)
+        if t is None and len(self):
+            if self._df is not None:
+                t = self._df.index[i]
+            else:
+                import pandas as pd
+
+                t = pd.to_datetime(self._ts_at(i), unit="ms", utc=True)
+            self._times[i] = t
+        return t
+
     @property
     def start_time(self):
-        if not self.bars:
-            return None
-        return pd.to_datetime(int(self.bars[0].ts), unit="ms", utc=True)
+        return self._time_at(0)
 
     @property
     def end_time(self):
-        if not self.bars:
-            return None
-        return pd.to_datetime(int(self.bars[-1].ts), unit="ms", utc=True)
+        return self._time_at(-1)
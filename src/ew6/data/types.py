@@ -2,12 +2,16 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Optional
+from functools import cached_property
+from typing import TYPE_CHECKING, Optional
 
-import pandas as pd
+import numpy as np
 
+if TYPE_CHECKING:
+    import pandas as pd
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class Bar:
     """Single OHLCV bar."""
 
@@ -29,6 +33,8 @@ class BarSeries:
     df: pd.DataFrame
 
     def validate(self) -> None:
+        import pandas as pd
+
         req = {"open", "high", "low", "close"}
         missing = req - set(self.df.columns)
         if missing:
@@ -39,3 +45,10 @@ class BarSeries:
     @property
     def close(self) -> pd.Series:
         return self.df["close"]
+
+    @cached_property
+    def close_np(self) -> np.ndarray:
+        """Closes as a cached, read-only contiguous float64 array."""
+        arr = np.ascontiguousarray(self.df["close"].to_numpy(), dtype=np.float64)
+        arr.flags.writeable = False
+        return arr
@@ -3,13 +3,25 @@ import sys
 import signal
 import faulthandler
 
+# None until the first enable(); later calls are no-ops
+_STATE = None
+
 def enable() -> None:
+    global _STATE
+    if _STATE is not None:
+        return
+    _STATE = False
+
     flag = os.getenv("EW6_STACKDUMP", "1").lower()
     if flag in ("0", "false", "no", "off"):
         return
+    # Windows has neither SIGUSR1 nor faulthandler.register
+    if not hasattr(signal, "SIGUSR1") or not hasattr(faulthandler, "register"):
+        return
 
     try:
         faulthandler.register(signal.SIGUSR1, all_threads=True, chain=False)
+        _STATE = True
         if os.getenv("EW6_STACKDUMP_VERBOSE", "0").lower() in ("1", "true", "yes", "on"):
             print("[EW6] SIGUSR1 stackdump REGISTERED", file=sys.stderr)
     except Exception as e:
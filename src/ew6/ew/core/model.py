@@ -10,28 +10,24 @@ from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaveLeg:
     """A single leg between two points (index + price)."""
     start_idx: int
     end_idx: int
     start_px: float
     end_px: float
+    # derived once at construction (read on every rule/scorer pass)
+    direction: int = field(init=False, repr=False, compare=False)
+    abs_move: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def direction(self) -> int:
-        if self.end_px > self.start_px:
-            return 1
-        if self.end_px < self.start_px:
-            return -1
-        return 0
-
-    @property
-    def abs_move(self) -> float:
-        return abs(self.end_px - self.start_px)
+    def __post_init__(self) -> None:
+        e, s = self.end_px, self.start_px
+        object.__setattr__(self, "direction", 1 if e > s else (-1 if e < s else 0))
+        object.__setattr__(self, "abs_move", abs(e - s))
 
 
-@dataclass
+@dataclass(slots=True)
 class WavePattern:
     """A detected wave pattern (e.g., impulse 1-5)."""
     kind: str
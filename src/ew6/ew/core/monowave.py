@@ -3,6 +3,9 @@
 This module is intentionally backward-compatible:
 - provides MonoWaveConfig
 - provides build_monowaves_from_swings(swings, cfg)
+- provides build_monowaves_soa(swings, cfg) -> column arrays (no MonoWave objects)
+
+The stride/min-move pass runs in one array kernel (Numba-compiled with the `fast` extra).
 
 `swings` is expected to be a sequence of swing points produced by ew6.swing.zigzag.
 We support common representations:
@@ -15,34 +18,38 @@ M1 note: The skip logic here is conservative (down-sampling swings). We will ref
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Iterable, List, Sequence, Tuple, Optional
+from dataclasses import dataclass, field
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, Iterable, List, Sequence, Tuple, Optional
+
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonoWaveConfig:
     skip: int = 1
     min_abs_move: float = 0.0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MonoWave:
     start_idx: int
     end_idx: int
     start_px: float
     end_px: float
+    # derived once at construction (read on every rule/scorer pass)
+    direction: int = field(init=False, repr=False, compare=False)
+    abs_move: float = field(init=False, repr=False, compare=False)
 
-    @property
-    def direction(self) -> int:
-        if self.end_px > self.start_px:
-            return 1
-        if self.end_px < self.start_px:
-            return -1
-        return 0
-
-    @property
-    def abs_move(self) -> float:
-        return abs(self.end_px - self.start_px)
+    def __post_init__(self) -> None:
+        e, s = self.end_px, self.start_px
+        object.__setattr__(self, "direction", 1 if e > s else (-1 if e < s else 0))
+        object.__setattr__(self, "abs_move", abs(e - s))
 
 
 def _get_idx_px(sp: Any) -> Tuple[int, float]:
@@ -74,29 +81,113 @@ def _get_idx_px(sp: Any) -> Tuple[int, float]:
     return int(idx), float(px)
 
 
-def build_monowaves_from_swings(swings: Sequence[Any], cfg: MonoWaveConfig) -> List[MonoWave]:
-    """Convert swing points to monowaves."""
-    if not swings or len(swings) < 2:
-        return []
+_IDX_PX_DTYPE = np.dtype([("idx", "i8"), ("px", "f8")])
+
+
+def _extractor(s0: Any) -> Optional[Callable[[Any], Tuple[Any, Any]]]:
+    """Pick one (idx, price) getter from the first swing; None if its shape is not recognized."""
+    if isinstance(s0, dict):
+        ik = "idx" if "idx" in s0 else "index"
+        pk = next((k for k in ("price", "px") if k in s0), "value")
+        return itemgetter(ik, pk)
+    if isinstance(s0, (tuple, list)):
+        return itemgetter(0, 1) if len(s0) >= 2 else None
+    ik = next((k for k in ("idx", "index") if hasattr(s0, k)), None)
+    pk = next((k for k in ("price", "px", "value") if hasattr(s0, k)), None)
+    if ik is None or pk is None:
+        return None
+    return attrgetter(ik, pk)
+
+
+def _swings_to_arrays(swings: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray]:
+    """Normalize swing points once to (idx int64, px float64), sorted by idx (stable).
+
+    Swing lists are homogeneous in practice, so one getter chosen from the first point is
+    mapped over all of them; mixed or malformed input falls back to per-point dispatch.
+    """
+    m = len(swings)
+    rec = None
+    get = _extractor(swings[0])
+    if get is not None:
+        try:
+            rec = np.fromiter(map(get, swings), dtype=_IDX_PX_DTYPE, count=m)
+        except Exception:
+            rec = None
+    if rec is None:
+        rec = np.fromiter(map(_get_idx_px, swings), dtype=_IDX_PX_DTYPE, count=m)
+    idx = np.ascontiguousarray(rec["idx"])
+    px = np.ascontiguousarray(rec["px"])
+    if m > 1 and (np.diff(idx) < 0).any():
+        order = np.argsort(idx, kind="stable")
+        idx, px = idx[order], px[order]
+    return idx, px
+
+
+def _build_monowaves_loop(idx, px, step, min_abs):
+    m = idx.shape[0]
+    # stride positions, then append the last point if the stride missed it
+    nf = (m - 1) // step + 1
+    last = (nf - 1) * step
+    extra = 1 if (idx[last] != idx[m - 1] or px[last] != px[m - 1]) else 0
+    pos = np.empty(nf + extra, dtype=np.int64)
+    for k in range(nf):
+        pos[k] = k * step
+    if extra:
+        pos[nf] = m - 1
+
+    n_out = pos.shape[0] - 1
+    s_idx = np.empty(n_out, dtype=np.int64)
+    e_idx = np.empty(n_out, dtype=np.int64)
+    s_px = np.empty(n_out, dtype=np.float64)
+    e_px = np.empty(n_out, dtype=np.float64)
+    c = 0
+    for k in range(n_out):
+        i0 = pos[k]
+        i1 = pos[k + 1]
+        if min_abs > 0 and abs(px[i1] - px[i0]) < min_abs:
+            continue
+        s_idx[c] = idx[i0]
+        e_idx[c] = idx[i1]
+        s_px[c] = px[i0]
+        e_px[c] = px[i1]
+        c += 1
+    return s_idx[:c], e_idx[:c], s_px[:c], e_px[:c]
+
 
-    # normalize to (idx, px) and ensure sorted by idx
-    pts = [_get_idx_px(s) for s in swings]
-    pts.sort(key=lambda x: x[0])
+if njit is not None:
+    _build_monowaves_nb = njit(cache=True)(_build_monowaves_loop)
+else:  # pragma: no cover
+    _build_monowaves_nb = _build_monowaves_loop
 
+
+def build_monowaves_soa(
+    swings: Sequence[Any], cfg: MonoWaveConfig
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Monowaves as column arrays: (start_idx, end_idx, start_px, end_px)."""
+    if not swings or len(swings) < 2:
+        empty_i = np.empty(0, dtype=np.int64)
+        empty_f = np.empty(0, dtype=np.float64)
+        return empty_i, empty_i.copy(), empty_f, empty_f.copy()
+
+    idx, px = _swings_to_arrays(swings)
     # simple skip = downsample swings to reduce noise
     step = max(1, int(cfg.skip) + 1)
-    filtered = pts[::step]
-    if filtered[-1] != pts[-1]:
-        filtered.append(pts[-1])
-
-    mws: List[MonoWave] = []
-    for (i0, p0), (i1, p1) in zip(filtered[:-1], filtered[1:]):
-        mw = MonoWave(start_idx=i0, end_idx=i1, start_px=p0, end_px=p1)
-        if cfg.min_abs_move > 0 and mw.abs_move < cfg.min_abs_move:
-            continue
-        mws.append(mw)
+    return _build_monowaves_nb(idx, px, step, float(cfg.min_abs_move))
+
+
+def build_monowaves_from_swings(swings: Sequence[Any], cfg: MonoWaveConfig) -> List[MonoWave]:
+    """Convert swing points to monowaves."""
+    return monowaves_from_soa(*build_monowaves_soa(swings, cfg))
+
 
-    return mws
+def monowaves_from_soa(
+    s_idx: np.ndarray, e_idx: np.ndarray, s_px: np.ndarray, e_px: np.ndarray
+) -> List[MonoWave]:
+    """Wrap `build_monowaves_soa` columns into MonoWave objects."""
+    return [
+        MonoWave(start_idx=i0, end_idx=i1, start_px=p0, end_px=p1)
+        for i0, i1, p0, p1 in zip(s_idx.tolist(), e_idx.tolist(), s_px.tolist(), e_px.tolist())
+    ]
 
 
 # Backward compat alias (some code may import this)
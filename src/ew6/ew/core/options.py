@@ -8,7 +8,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WaveOptions:
     monowave_skip: int = 1
     min_leg_abs_move: float = 0.0
@@ -6,8 +6,13 @@ We implement a simple beam search over partial wave legs and an NMS filter over
 
 from __future__ import annotations
 
+import logging
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass
-from typing import Callable, List, Sequence, Tuple, TypeVar
+from itertools import islice, product
+from typing import Callable, List, Optional, Sequence, Tuple, TypeVar
+
+import numpy as np
 
 from ew6.logging import get_logger
 
@@ -16,7 +21,7 @@ log = get_logger("ew6.pruner")
 T = TypeVar("T")
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BeamConfig:
     beam_width: int = 256
     max_candidates: int = 5000  # hard cap for generated candidates
@@ -27,50 +32,116 @@ def beam_search(
     layers: Sequence[Sequence[T]],
     score_fn: Callable[[Tuple[T, ...]], float],
     cfg: BeamConfig,
+    score_batch_fn: Optional[Callable[[List[Tuple[T, ...]]], Sequence[float]]] = None,
 ) -> List[Tuple[Tuple[T, ...], float]]:
-    """Generic beam search selecting best tuples across multiple layers."""
-    beam: List[Tuple[Tuple[T, ...], float]] = [(tuple(), 0.0)]
+    """Generic beam search selecting best tuples across multiple layers.
+
+    When `score_batch_fn` is given, each layer's candidates (all the same length) are
+    generated first and scored in one call; otherwise `score_fn` is called per candidate.
+    """
+    debug = log.isEnabledFor(logging.DEBUG)
+    prefixes: List[Tuple[T, ...]] = [tuple()]
+    scores = np.zeros(1)
     generated = 0
-    try:
+    if debug:
         log.debug("beam start", extra={"layers": len(layers), "beam_width": cfg.beam_width, "max_candidates": cfg.max_candidates, "max_patterns": cfg.max_patterns})
-    except Exception:
-        pass
 
     for li, layer in enumerate(layers):
-        try:
-            log.debug("beam layer", extra={"i": li, "layer_size": len(layer), "beam_in": len(beam)})
-        except Exception:
-            pass
-        next_beam: List[Tuple[Tuple[T, ...], float]] = []
-        for prefix, _ in beam:
-            for item in layer:
-                cand = prefix + (item,)
-                s = float(score_fn(cand))
-                next_beam.append((cand, s))
-                generated += 1
-                if generated >= cfg.max_candidates:
-                    break
-            if generated >= cfg.max_candidates:
-                break
-
-        next_beam.sort(key=lambda x: x[1], reverse=True)
-        beam = next_beam[: max(1, cfg.beam_width)]
-        try:
-            log.debug("beam kept", extra={"i": li, "beam_out": len(beam), "generated": generated})
-        except Exception:
-            pass
+        if debug:
+            log.debug("beam layer", extra={"i": li, "layer_size": len(layer), "beam_in": len(prefixes)})
+        # the layer's candidate count is known up front: every (prefix, item) pair, cut at the
+        # max_candidates budget (at least one is generated once a layer starts)
+        total = len(prefixes) * len(layer)
+        k = min(total, max(1, cfg.max_candidates - generated)) if total else 0
+        cands: List[Tuple[T, ...]] = [prefix + (item,) for prefix, item in islice(product(prefixes, layer), k)]
+        generated += k
+
+        if score_batch_fn is not None:
+            cand_scores = np.asarray(score_batch_fn(cands), dtype=np.float64).reshape(-1)
+        else:
+            cand_scores = np.fromiter((score_fn(c) for c in cands), dtype=np.float64, count=len(cands))
+
+        keep = _top_k(cand_scores, _layer_width(cfg, li, len(layers)))
+        prefixes = [cands[i] for i in keep.tolist()]
+        scores = cand_scores[keep]
+        if debug:
+            log.debug("beam kept", extra={"i": li, "beam_out": len(prefixes), "generated": generated})
         if generated >= cfg.max_candidates:
             break
 
-    beam.sort(key=lambda x: x[1], reverse=True)
-    out = beam[: cfg.max_patterns]
-    try:
+    out = list(zip(prefixes[: cfg.max_patterns], scores[: cfg.max_patterns].tolist()))
+    if debug:
         log.debug("beam done", extra={"out": len(out), "generated": generated})
-    except Exception:
-        pass
     return out
 
 
+def beam_search_grid(
+    layers: Sequence[np.ndarray],
+    score_batch_fn: Callable[[np.ndarray], np.ndarray],
+    cfg: BeamConfig,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """`beam_search` over integer layers, with prefixes held as rows of one int64 array.
+
+    Candidate order, the max_candidates budget and tie-breaking match `beam_search`;
+    `score_batch_fn` receives each layer's (k, depth) candidate array. Returns the kept
+    rows and their scores (best first).
+    """
+    debug = log.isEnabledFor(logging.DEBUG)
+    prefixes = np.zeros((1, 0), dtype=np.int64)
+    scores = np.zeros(1)
+    generated = 0
+    if debug:
+        log.debug("beam start", extra={"layers": len(layers), "beam_width": cfg.beam_width, "max_candidates": cfg.max_candidates, "max_patterns": cfg.max_patterns})
+
+    for li, layer in enumerate(layers):
+        layer = np.asarray(layer, dtype=np.int64)
+        m = layer.shape[0]
+        if debug:
+            log.debug("beam layer", extra={"i": li, "layer_size": m, "beam_in": prefixes.shape[0]})
+        total = prefixes.shape[0] * m
+        k = min(total, max(1, cfg.max_candidates - generated)) if total else 0
+        # candidate j pairs prefix j // m with item j % m (product order)
+        j = np.arange(k)
+        cands = np.empty((k, li + 1), dtype=np.int64)
+        if k:
+            cands[:, :li] = prefixes[j // m]
+            cands[:, li] = layer[j % m]
+        generated += k
+
+        cand_scores = np.asarray(score_batch_fn(cands), dtype=np.float64).reshape(-1)
+        keep = _top_k(cand_scores, _layer_width(cfg, li, len(layers)))
+        prefixes = cands[keep]
+        scores = cand_scores[keep]
+        if debug:
+            log.debug("beam kept", extra={"i": li, "beam_out": prefixes.shape[0], "generated": generated})
+        if generated >= cfg.max_candidates:
+            break
+
+    if debug:
+        log.debug("beam done", extra={"out": min(prefixes.shape[0], cfg.max_patterns), "generated": generated})
+    return prefixes[: cfg.max_patterns], scores[: cfg.max_patterns]
+
+
+def _layer_width(cfg: BeamConfig, li: int, n_layers: int) -> int:
+    """Beam width for layer `li`; the last layer is never extended, so only the
+    max_patterns rows that are returned need selecting."""
+    if li == n_layers - 1:
+        return max(1, min(cfg.beam_width, cfg.max_patterns))
+    return max(1, cfg.beam_width)
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k highest scores, best first; ties keep generation order (stable sort)."""
+    n = scores.shape[0]
+    if k >= n:
+        return np.argsort(-scores, kind="stable")
+    kth = np.partition(scores, n - k)[n - k]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[: k - above.shape[0]]
+    sel = np.concatenate([above, ties])
+    return sel[np.argsort(-scores[sel], kind="stable")]
+
+
 def overlap_ratio(a_span: Tuple[int, int], b_span: Tuple[int, int]) -> float:
     """Overlap ratio on index spans [start,end)."""
     a0, a1 = a_span
@@ -91,24 +162,34 @@ def nms_by_span(
 ) -> List[T]:
     """Non-maximum suppression by span overlap, keeping highest scoring items."""
     ordered = sorted(items, key=score_fn, reverse=True)
+    spans = [span_fn(it) for it in ordered]
     kept: List[T] = []
-    try:
+    debug = log.isEnabledFor(logging.DEBUG)
+    # kept spans ordered by start, so only a window of them is compared per candidate
+    k_starts: List[int] = []
+    k_spans: List[Tuple[int, int]] = []
+    if debug:
         log.debug("nms start", extra={"items": len(items), "overlap_thresh": overlap_thresh, "max_keep": max_keep})
-    except Exception:
-        pass
-    for it in ordered:
-        sp = span_fn(it)
-        ok = True
-        for kt in kept:
-            if overlap_ratio(sp, span_fn(kt)) >= overlap_thresh:
-                ok = False
-                break
-        if ok:
-            kept.append(it)
-            if len(kept) >= max_keep:
-                break
-    try:
+    for it, sp in zip(ordered, spans):
+        a0, a1 = sp
+        if overlap_thresh > 0:
+            # ratio >= thresh needs union <= inter / thresh; union >= a1 - b0 and inter <= a1 - a0,
+            # so only kept spans starting in [a1 - (a1 - a0) / thresh, a1) can suppress this one
+            if a1 > a0:
+                lo = bisect_left(k_starts, a1 - (a1 - a0) / overlap_thresh - 1)
+                near = k_spans[lo:bisect_left(k_starts, a1)]
+            else:
+                near = []
+        else:
+            near = k_spans
+        if any(overlap_ratio(sp, ks) >= overlap_thresh for ks in near):
+            continue
+        kept.append(it)
+        pos = bisect_right(k_starts, a0)
+        k_starts.insert(pos, a0)
+        k_spans.insert(pos, sp)
+        if len(kept) >= max_keep:
+            break
+    if debug:
         log.debug("nms done", extra={"kept": len(kept)})
-    except Exception:
-        pass
     return kept
@@ -6,7 +6,7 @@ from typing import Sequence
 from ew6.swing.zigzag import SwingPoint, SwingType
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImpulseRules:
     """Pragmatic impulse rules (v1).
 
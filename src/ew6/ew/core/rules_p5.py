@@ -2,83 +2,95 @@
 
 This file provides a stable API:
 - is_valid_impulse_from_monowaves(mws, return_meta=False) -> bool or (bool, meta)
+- is_valid_impulse_batch(starts_px, ends_px) -> (valid, w4_overlap) masks for (N, 5) windows
 
 `mws` is a sequence of 5 MonoWave-like objects with:
-- start_idx, end_idx, start_px, end_px and direction property (or derivable)
+- start_idx, end_idx, start_px, end_px (leg direction is derived from prices)
 
 Rules implemented (conservative M1):
 - directions alternate: 1, -1, 1, -1, 1 (or opposite for downward)
 - wave2 does not retrace beyond wave1 start (in price)
 - wave3 is not the shortest among (1,3,5)
 - basic wave4 overlap heuristic flag (stored in meta) - not hard fail by default
+
+Leg directions come from prices (end_px vs start_px), checked cheapest-first so most
+candidates are rejected after one or two comparisons.
 """
 
 from __future__ import annotations
 
 from typing import Any, Dict, Sequence, Tuple
 
-
-def _dir(mw: Any) -> int:
-    if hasattr(mw, "direction"):
-        return int(mw.direction)
-    # derive from prices
-    if mw.end_px > mw.start_px:
-        return 1
-    if mw.end_px < mw.start_px:
-        return -1
-    return 0
-
-
-def _abs_move(mw: Any) -> float:
-    if hasattr(mw, "abs_move"):
-        return float(mw.abs_move)
-    return float(abs(mw.end_px - mw.start_px))
+import numpy as np
 
 
 def is_valid_impulse_from_monowaves(mws: Sequence[Any], return_meta: bool = False):
+    fail = (False, {}) if return_meta else False
     if len(mws) != 5:
-        return (False, {}) if return_meta else False
-
-    d = [_dir(x) for x in mws]
-    if 0 in d:
-        return (False, {}) if return_meta else False
+        return fail
 
-    # Determine expected sign based on first leg
-    s = d[0]
-    expected = [s, -s, s, -s, s]
-    if d != expected:
-        return (False, {}) if return_meta else False
-
-    # Price points
+    # Direction of wave 1 from prices; a flat first leg rejects before touching the rest
     p0 = mws[0].start_px
     p1 = mws[0].end_px
-    p2 = mws[1].end_px
-    p3 = mws[2].end_px
-    p4 = mws[3].end_px
-    p5 = mws[4].end_px
-
-    meta: Dict[str, bool] = {}
-
-    # wave2 retrace beyond start invalid
-    if s == 1:
-        if p2 <= p0:
-            return (False, {}) if return_meta else False
-    else:
-        if p2 >= p0:
-            return (False, {}) if return_meta else False
+    if not (p1 > p0 or p1 < p0):
+        return fail
+    s = 1 if p1 > p0 else -1
+
+    # wave2 must move against wave1 and not retrace beyond wave1 start (in price)
+    m1 = mws[1]
+    p2 = m1.end_px
+    if not ((m1.start_px - p2) * s > 0) or not ((p2 - p0) * s > 0):
+        return fail
+
+    # remaining legs alternate: 1, -1, 1, -1, 1 (or opposite for downward)
+    if not ((mws[2].end_px - mws[2].start_px) * s > 0):
+        return fail
+    if not ((mws[3].start_px - mws[3].end_px) * s > 0):
+        return fail
+    if not ((mws[4].end_px - mws[4].start_px) * s > 0):
+        return fail
 
     # wave3 not shortest
-    w1 = _abs_move(mws[0])
-    w3 = _abs_move(mws[2])
-    w5 = _abs_move(mws[4])
+    w1 = abs(p1 - p0)
+    w3 = abs(mws[2].end_px - mws[2].start_px)
+    w5 = abs(mws[4].end_px - mws[4].start_px)
     if w3 <= min(w1, w5):
-        return (False, {}) if return_meta else False
+        return fail
 
+    if not return_meta:
+        return True
     # wave4 overlap heuristic
     # Uptrend: wave4 low should not go below wave1 high (common rule). We'll only flag.
-    if s == 1:
-        meta["w4_overlap"] = bool(p4 < p1)
-    else:
-        meta["w4_overlap"] = bool(p4 > p1)
+    p4 = mws[3].end_px
+    meta: Dict[str, bool] = {"w4_overlap": bool(p4 < p1) if s == 1 else bool(p4 > p1)}
+    return True, meta
+
+
+_IMPULSE_SIGNS = np.array([1, -1, 1, -1, 1], dtype=np.int8)
+
+
+def is_valid_impulse_batch(starts_px: np.ndarray, ends_px: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Vectorized `is_valid_impulse_from_monowaves` over N candidate windows.
+
+    `starts_px` / `ends_px` are (N, 5) float64 arrays (leg k of candidate i in row i).
+    Returns (valid, w4_overlap) boolean masks of shape (N,); w4_overlap is only
+    meaningful where valid is True.
+    """
+    sp = np.asarray(starts_px, dtype=np.float64).reshape(-1, 5)
+    ep = np.asarray(ends_px, dtype=np.float64).reshape(-1, 5)
+
+    d = np.sign(ep - sp).astype(np.int8)
+    s = d[:, 0:1]
+    alt = (d == s * _IMPULSE_SIGNS).all(axis=1) & (s[:, 0] != 0)
+
+    sf = s[:, 0].astype(np.float64)
+    p0 = sp[:, 0]
+    p1 = ep[:, 0]
+    p2 = ep[:, 1]
+    p4 = ep[:, 3]
+    w = np.abs(ep - sp)
 
-    return (True, meta) if return_meta else True
+    # wave2 must not retrace beyond wave1 start; wave3 not the shortest of (1,3,5)
+    valid = alt & ((p2 - p0) * sf > 0) & (w[:, 2] > np.minimum(w[:, 0], w[:, 4]))
+    w4_overlap = (p1 - p4) * sf > 0
+    return valid, w4_overlap
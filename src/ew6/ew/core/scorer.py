@@ -4,6 +4,10 @@ M1 version:
 - reward close-to-Fibonacci ratios for wave2/wave3/wave4
 - penalize overlap and extreme leg imbalance
 - confidence in [0,1] from score (sigmoid)
+
+The per-pattern math is one scalar kernel (Numba-compiled with the `fast` extra);
+`score_impulse_batch` runs it over (N, 5) leg-move arrays for the beam search; without
+Numba the batch is plain NumPy (`_within_vec`).
 """
 
 from __future__ import annotations
@@ -12,10 +16,18 @@ from dataclasses import dataclass
 from typing import Tuple
 import math
 
+import numpy as np
+
 from ew6.ew.core.model import WavePattern
 
+try:
+    from numba import njit, prange  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+    prange = range  # type: ignore
+
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ScoreConfig:
     fib_w2: Tuple[float, float] = (0.236, 0.786)
     fib_w3: Tuple[float, float] = (1.0, 2.618)  # relative to wave1
@@ -32,39 +44,112 @@ def _within(x: float, lo: float, hi: float) -> float:
     return math.exp(-((x - hi) / hi) * 2.0) if hi > 0 else 0.0
 
 
-def score_impulse(pattern: WavePattern, cfg: ScoreConfig = ScoreConfig()) -> float:
-    legs = pattern.legs
-    if len(legs) != 5:
-        return 0.0
+def _within_vec(x: np.ndarray, lo: float, hi: float) -> np.ndarray:
+    """`_within` over an array of ratios (same branches, NaN falls through to the upper side)."""
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        below = np.exp(-((lo - x) / lo) * 2.0) if lo > 0 else np.zeros_like(x)
+        above = np.exp(-((x - hi) / hi) * 2.0) if hi > 0 else np.zeros_like(x)
+    return np.where(x < lo, below, np.where(x <= hi, 1.0, above))
 
-    m = [abs(l.end_px - l.start_px) for l in legs]
-    if min(m) <= 0:
+
+def _score_impulse_loop(
+    w1, w2, w3, w4, w5, w4_overlap, span,
+    fib_w2_lo, fib_w2_hi, fib_w3_lo, fib_w3_hi, fib_w4_lo, fib_w4_hi,
+    overlap_penalty, extreme_penalty,
+):
+    mn = min(w1, w2, w3, w4, w5)
+    if mn <= 0:
         return 0.0
 
-    w1, w2, w3, w4, w5 = m
     r2 = w2 / w1
     r3 = w3 / w1
     r4 = w4 / w3 if w3 > 0 else 0.0
 
     s = 0.0
-    s += 2.0 * _within(r2, *cfg.fib_w2)
-    s += 2.0 * _within(r3, *cfg.fib_w3)
-    s += 1.5 * _within(r4, *cfg.fib_w4)
+    s += 2.0 * _fib_fit(r2, fib_w2_lo, fib_w2_hi)
+    s += 2.0 * _fib_fit(r3, fib_w3_lo, fib_w3_hi)
+    s += 1.5 * _fib_fit(r4, fib_w4_lo, fib_w4_hi)
 
     if w3 > min(w1, w5):
         s += 1.0
 
-    if pattern.meta.get("w4_overlap", False):
-        s -= cfg.overlap_penalty
+    if w4_overlap:
+        s -= overlap_penalty
 
-    mx = max(m)
-    mn = min(m)
-    if mn > 0 and mx / mn > 10:
-        s -= cfg.extreme_penalty
+    mx = max(w1, w2, w3, w4, w5)
+    if mx / mn > 10:
+        s -= extreme_penalty
 
-    span = pattern.end_idx - pattern.start_idx
     s += min(max(span / 500.0, 0.0), 0.5)
-    return float(s)
+    return s
+
+
+def _score_rows_loop(moves, w4_overlap, span, params):
+    n = moves.shape[0]
+    out = np.empty(n, dtype=np.float64)
+    for i in prange(n):
+        out[i] = _score_impulse_kernel(
+            moves[i, 0], moves[i, 1], moves[i, 2], moves[i, 3], moves[i, 4], w4_overlap[i], span[i],
+            params[0], params[1], params[2], params[3], params[4], params[5], params[6], params[7],
+        )
+    return out
+
+
+def _score_rows_np(moves, w4_overlap, span, params):
+    """NumPy form of `_score_rows_loop` (used when Numba is not installed)."""
+    w1, w2, w3, w4, w5 = moves.T
+    mn = moves.min(axis=1)
+    with np.errstate(over="ignore", invalid="ignore", divide="ignore"):
+        r2 = w2 / w1
+        r3 = w3 / w1
+        r4 = np.where(w3 > 0, w4 / w3, 0.0)
+        extreme = moves.max(axis=1) / mn > 10
+
+    s = 2.0 * _within_vec(r2, params[0], params[1])
+    s = s + 2.0 * _within_vec(r3, params[2], params[3])
+    s = s + 1.5 * _within_vec(r4, params[4], params[5])
+    s = s + np.where(w3 > np.minimum(w1, w5), 1.0, 0.0)
+    s = s - np.where(w4_overlap, params[6], 0.0)
+    s = s - np.where(extreme, params[7], 0.0)
+    s = s + np.minimum(np.maximum(span / 500.0, 0.0), 0.5)
+    return np.where(mn <= 0, 0.0, s)
+
+
+# no fastmath: compiled batch scores equal score_impulse bit for bit (beam ties are ordered by
+# score); the NumPy fallback can differ in the last ulp where np.exp and math.exp disagree
+if njit is not None:
+    _fib_fit = njit(cache=True)(_within)
+    _score_impulse_kernel = njit(cache=True)(_score_impulse_loop)
+    _score_impulse_rows = njit(cache=True, parallel=True)(_score_rows_loop)
+else:  # pragma: no cover
+    _fib_fit = _within
+    _score_impulse_kernel = _score_impulse_loop
+    _score_impulse_rows = _score_rows_np
+
+
+def _params(cfg: ScoreConfig) -> Tuple[float, ...]:
+    return (*cfg.fib_w2, *cfg.fib_w3, *cfg.fib_w4, cfg.overlap_penalty, cfg.extreme_penalty)
+
+
+def score_impulse(pattern: WavePattern, cfg: ScoreConfig = ScoreConfig()) -> float:
+    legs = pattern.legs
+    if len(legs) != 5:
+        return 0.0
+
+    m = [float(abs(l.end_px - l.start_px)) for l in legs]
+    span = float(pattern.end_idx - pattern.start_idx)
+    overlap = bool(pattern.meta.get("w4_overlap", False))
+    return float(_score_impulse_kernel(*m, overlap, span, *_params(cfg)))
+
+
+def score_impulse_batch(
+    moves: np.ndarray, w4_overlap: np.ndarray, span: np.ndarray, cfg: ScoreConfig = ScoreConfig()
+) -> np.ndarray:
+    """`score_impulse` over N candidates: leg abs moves (N, 5), w4_overlap (N,), index span (N,)."""
+    mv = np.ascontiguousarray(moves, dtype=np.float64).reshape(-1, 5)
+    ov = np.ascontiguousarray(w4_overlap, dtype=np.bool_)
+    sp = np.ascontiguousarray(span, dtype=np.float64)
+    return _score_impulse_rows(mv, ov, sp, np.asarray(_params(cfg), dtype=np.float64))
 
 
 def confidence_from_score(score: float) -> float:
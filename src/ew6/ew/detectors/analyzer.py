@@ -6,25 +6,33 @@
 - Score + confidence + NMS prune.
 
 Requires:
-- ew6.ew.core.pruner (beam_search, nms_by_span)
-- ew6.ew.core.scorer (score_impulse, confidence_from_score)
-- ew6.ew.core.rules_p5 (is_valid_impulse_from_monowaves)
+- ew6.ew.core.pruner (beam_search_grid, nms_by_span)
+- ew6.ew.core.scorer (score_impulse_batch, confidence_from_score)
+- ew6.ew.core.rules_p5 (is_valid_impulse_batch)
 """
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass
 from typing import List, Tuple
 
+import numpy as np
+
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+
 from ew6.logging import get_logger
 
 log = get_logger("ew6.analyzer")
 
 from ew6.ew.core.model import WaveLeg, WavePattern
-from ew6.ew.core.monowave import build_monowaves_from_swings, MonoWaveConfig
-from ew6.ew.core.rules_p5 import is_valid_impulse_from_monowaves
-from ew6.ew.core.scorer import score_impulse, confidence_from_score, ScoreConfig
-from ew6.ew.core.pruner import nms_by_span, BeamConfig, beam_search
+from ew6.ew.core.monowave import build_monowaves_soa, monowaves_from_soa, MonoWaveConfig
+from ew6.ew.core.rules_p5 import is_valid_impulse_batch
+from ew6.ew.core.scorer import score_impulse_batch, confidence_from_score, ScoreConfig
+from ew6.ew.core.pruner import nms_by_span, BeamConfig, beam_search_grid
 from ew6.ew.core.options import WaveOptions
 
 
@@ -57,99 +65,159 @@ def _mw_to_leg(mw) -> WaveLeg:
     return WaveLeg(start_idx=mw.start_idx, end_idx=mw.end_idx, start_px=mw.start_px, end_px=mw.end_px)
 
 
-def _layers(n: int, max_gap: int) -> List[List[int]]:
-    layers: List[List[int]] = []
-    layers.append(list(range(0, max(0, n - 4))))  # i0
-    for _ in range(4):
-        layers.append(list(range(1, max_gap + 2)))  # delta
-    return layers
+def _layers(n: int, max_gap: int) -> List[np.ndarray]:
+    deltas = np.arange(1, max_gap + 2, dtype=np.int64)
+    return [np.arange(0, max(0, n - 4), dtype=np.int64)] + [deltas] * 4  # i0, then 4 deltas
+
+
+_ALT_SIGNS = np.array([1, -1, 1, -1, 1], dtype=np.int8)
+
+
+def _valid_windows(
+    tups: np.ndarray, n: int, s_px: np.ndarray, e_px: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Batch rule check of (N,5) (i0, d1..d4) rows against monowave price columns.
+
+    Returns (in_range rows, valid rows, monowave idxs (M,5) and w4_overlap of the valid rows).
+    The bounds check runs on the last index alone; idxs are built for in-range rows only.
+    """
+    rows = np.flatnonzero(tups.sum(axis=1) < n)
+    w = np.cumsum(tups[rows], axis=1)
+    valid, w4 = is_valid_impulse_batch(s_px[w], e_px[w])
+    return rows, rows[valid], w[valid], w4[valid]
+
+
+def _score_partial_loop(tups: np.ndarray, n: int, mw_dir: np.ndarray, out: np.ndarray) -> None:
+    """Per-row form of `_score_partial_np` for the compiled kernel (stops at the first flat leg)."""
+    L = tups.shape[1]
+    for r in range(tups.shape[0]):
+        i = tups[r, 0]
+        last = i
+        for c in range(1, L):
+            last += tups[r, c]
+        if last >= n:
+            out[r] = -1e9
+            continue
+        if L < 2:
+            out[r] = 0.0
+            continue
+        sign = int(mw_dir[i])
+        flat = sign == 0
+        alt = True
+        c = 1
+        while c < L and not flat:
+            i += tups[r, c]
+            sign = -sign
+            d = int(mw_dir[i])
+            if d == 0:
+                flat = True
+            elif d != sign:
+                alt = False
+            c += 1
+        out[r] = -1e9 if flat else (0.0 if alt else -1e3)
+
+
+if njit is not None:
+    _score_partial_nb = njit(cache=True)(_score_partial_loop)
+else:  # pragma: no cover
+    _score_partial_nb = None
+
+
+def _score_partial(tups: np.ndarray, n: int, mw_dir: np.ndarray) -> np.ndarray:
+    """Prefix scores for (N,L) (i0, d1..) rows: -1e9 out of range or flat leg,
+    -1e3 when directions do not alternate, else 0."""
+    if _score_partial_nb is not None:
+        out = np.empty(tups.shape[0])
+        _score_partial_nb(np.ascontiguousarray(tups, dtype=np.int64), n, mw_dir, out)
+        return out
+    return _score_partial_np(tups, n, mw_dir)
+
+
+def _score_partial_np(tups: np.ndarray, n: int, mw_dir: np.ndarray) -> np.ndarray:
+    L = tups.shape[1]
+    idxs = np.cumsum(tups, axis=1)
+    out = np.full(idxs.shape[0], -1e9)
+    rows = np.flatnonzero(idxs[:, -1] < n)
+    if L < 2:
+        out[rows] = 0.0
+        return out
+    # legs alternate iff dir * (+1, -1, ...) is constant and non-zero across the row
+    signed = mw_dir[idxs[rows]] * _ALT_SIGNS[:L]
+    res = np.zeros(rows.shape[0])
+    bad = np.flatnonzero(~(signed == signed[:, :1]).all(axis=1) | (signed[:, 0] == 0))
+    res[bad] = np.where((signed[bad] == 0).any(axis=1), -1e9, -1e3)
+    out[rows] = res
+    return out
 
 
 def scan_impulses_from_swings(swings, cfg: AnalyzerConfig) -> List[WavePattern]:
-    try:
+    debug = log.isEnabledFor(logging.DEBUG)
+    if debug:
         log.debug("analyzer start", extra={"swings": len(swings) if hasattr(swings,'__len__') else None, "cfg": cfg.__dict__})
-    except Exception:
-        pass
-    mws = build_monowaves_from_swings(swings, MonoWaveConfig(skip=cfg.monowave_skip, min_abs_move=cfg.min_leg_abs_move))
+    cols = build_monowaves_soa(swings, MonoWaveConfig(skip=cfg.monowave_skip, min_abs_move=cfg.min_leg_abs_move))
+    s_idx, e_idx, s_px, e_px = cols
+    mw_dir = np.where(e_px > s_px, 1, np.where(e_px < s_px, -1, 0)).astype(np.int8)
+    # objects only for the legs of the final patterns
+    mws = monowaves_from_soa(*cols)
     n = len(mws)
-    try:
+    if debug:
         log.debug("analyzer monowaves", extra={"monowaves": n})
-    except Exception:
-        pass
     if n < 5:
-        try:
+        if debug:
             log.debug("analyzer early exit", extra={"reason": "monowaves<5"})
-        except Exception:
-            pass
         return []
 
     layers = _layers(n, cfg.max_gap)
 
-    def score_prefix(tup: Tuple[int, ...]) -> float:
-        if not tup:
-            return 0.0
-        i0 = tup[0]
-        idxs = [i0]
-        for d in tup[1:]:
-            idxs.append(idxs[-1] + int(d))
-        if idxs[-1] >= n:
-            return -1e9
-
-        if len(idxs) == 5:
-            win = [mws[i] for i in idxs]
-            ok, meta = is_valid_impulse_from_monowaves(win, return_meta=True)
-            if not ok:
-                return -1e6
-            p = WavePattern(kind="impulse_1_5", legs=[_mw_to_leg(x) for x in win], meta=meta or {})
-            sc = float(score_impulse(p, ScoreConfig()))
-            gap_pen = 0.05 * sum(int(x) - 1 for x in tup[1:])
-            return sc - gap_pen
-
-        # partial alternation check
-        if len(idxs) >= 2:
-            dirs = [int(getattr(mws[i], "direction", 0)) for i in idxs]
-            if 0 in dirs:
-                return -1e9
-            s = dirs[0]
-            for k, dk in enumerate(dirs):
-                exp = s if k % 2 == 0 else -s
-                if dk != exp:
-                    return -1e3
-        return 0.0
-
-    tuples_scores = beam_search(
+    def impulse(idx_row: List[int], w4_overlap: bool) -> WavePattern:
+        win = [mws[i] for i in idx_row]
+        return WavePattern(kind="impulse_1_5", legs=[_mw_to_leg(x) for x in win], meta={"w4_overlap": w4_overlap})
+
+    def score_full(cands: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """Full windows: one vectorized rule pass, then batched scoring of the valid ones.
+
+        Returns (scores, valid rows, their monowave idxs, w4_overlap, raw score).
+        """
+        rows, ok_rows, w, w4 = _valid_windows(cands, n, s_px, e_px)
+        out = np.full(cands.shape[0], -1e9)
+        out[rows] = -1e6
+        raw = np.empty(0)
+        if ok_rows.size:
+            moves = np.abs(e_px[w] - s_px[w])
+            span = e_idx[w[:, 4]] - s_idx[w[:, 0]]
+            gap_pen = 0.05 * (cands[ok_rows, 1:] - 1).sum(axis=1)
+            raw = score_impulse_batch(moves, w4, span, ScoreConfig())
+            out[ok_rows] = raw - gap_pen
+        return out, ok_rows, w, w4, raw
+
+    def score_batch(cands: np.ndarray) -> np.ndarray:
+        if cands.shape[0] == 0:
+            return np.empty(0)
+        if cands.shape[1] != 5:
+            return _score_partial(cands, n, mw_dir)
+        return score_full(cands)[0]
+
+    kept, _ = beam_search_grid(
         layers,
-        score_prefix,
+        score_batch,
         BeamConfig(beam_width=cfg.beam_width, max_candidates=cfg.max_candidates, max_patterns=cfg.max_patterns),
     )
-    try:
-        log.debug("analyzer beam", extra={"kept": len(tuples_scores) if hasattr(tuples_scores,'__len__') else None})
-    except Exception:
-        pass
+    if debug:
+        log.debug("analyzer beam", extra={"kept": kept.shape[0]})
 
     patterns: List[WavePattern] = []
-    for tup, _ in tuples_scores:
-        if len(tup) != 5:
-            continue
-        i0 = tup[0]
-        idxs = [i0]
-        for d in tup[1:]:
-            idxs.append(idxs[-1] + int(d))
-        if idxs[-1] >= n:
-            continue
-        win = [mws[i] for i in idxs]
-        ok, meta = is_valid_impulse_from_monowaves(win, return_meta=True)
-        if not ok:
-            continue
-        p = WavePattern(kind="impulse_1_5", legs=[_mw_to_leg(x) for x in win], meta=meta or {})
-        p.meta["score"] = float(score_impulse(p, ScoreConfig()))
-        p.meta["confidence"] = float(confidence_from_score(float(p.meta["score"])))
-        patterns.append(p)
-
-    try:
+    # only the (at most max_patterns) kept windows are materialized; rows that failed the
+    # rules drop out here, and a search cut short by the budget has no full rows
+    if kept.shape[0] and kept.shape[1] == 5:
+        _, _, w, w4, raw = score_full(kept)
+        for idx_row, ov, sc in zip(w.tolist(), w4.tolist(), raw.tolist()):
+            p = impulse(idx_row, ov)
+            p.meta["score"] = sc
+            p.meta["confidence"] = float(confidence_from_score(sc))
+            patterns.append(p)
+
+    if debug:
         log.debug("analyzer patterns built", extra={"patterns": len(patterns)})
-    except Exception:
-        pass
     return nms_by_span(
         patterns,
         span_fn=lambda p: (p.start_idx, p.end_idx),
@@ -9,15 +9,24 @@ breaking ties by fewer patterns (less noise) then higher best_score.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import logging
+import os
+from dataclasses import asdict, dataclass
+from itertools import product
 from typing import Iterable, List, Tuple, Optional
 
 import time
 
+try:
+    from joblib import Parallel, delayed  # type: ignore
+except Exception:  # pragma: no cover
+    Parallel = delayed = None  # type: ignore
+
 from ew6.ew.core.options import WaveOptions
 from ew6.ew.detectors.analyzer import scan_impulses_from_swings, AnalyzerConfig
 
 from ew6.logging import get_logger
+from ew6.run._pool import spawn_pool
 
 log = get_logger("ew6.tuner")
 
@@ -37,6 +46,51 @@ def _summarize(patterns) -> Tuple[float, float]:
     return float(best.meta.get("score", 0.0)), float(best.meta.get("confidence", 0.0))
 
 
+def _eval_point(
+    swings,
+    base: WaveOptions,
+    sk: int,
+    mm: float,
+    mg: int,
+    bw: int,
+    max_patterns: int,
+    nms_overlap: float,
+) -> TuneResult:
+    """Scan one grid point (top-level so process pools can pickle it)."""
+    opts = WaveOptions(
+        monowave_skip=sk,
+        min_leg_abs_move=mm,
+        max_gap=mg,
+        beam_width=bw,
+        max_candidates=base.max_candidates,
+        max_patterns=max_patterns,
+        nms_overlap=nms_overlap,
+    )
+    pats = scan_impulses_from_swings(swings, AnalyzerConfig.from_options(opts))
+    bs, bc = _summarize(pats)
+    return TuneResult(opts, len(pats), bs, bc)
+
+
+# swings for ProcessPoolExecutor workers: sent once per worker by the initializer, not per task
+_POOL_SWINGS = None
+
+
+def _init_pool(swings) -> None:
+    global _POOL_SWINGS
+    _POOL_SWINGS = swings
+
+
+def _eval_pool_point(args: tuple) -> TuneResult:
+    return _eval_point(_POOL_SWINGS, *args)
+
+
+def _pool_workers(n_jobs: int, tasks: int) -> int:
+    """joblib-style n_jobs (-1 = all cores, -2 = all but one, ...) capped at `tasks`."""
+    cpus = os.cpu_count() or 1
+    n = n_jobs if n_jobs > 0 else max(1, cpus + 1 + n_jobs)
+    return max(1, min(n, tasks))
+
+
 def tune_wave_options(
     swings,
     base: WaveOptions,
@@ -46,50 +100,41 @@ def tune_wave_options(
     beam_widths: Iterable[int] = (128, 256),
     max_patterns: int = 50,
     nms_overlap: float = 0.70,
+    n_jobs: int = 1,
 ) -> TuneResult:
+    """Evaluate the grid and return the best point.
+
+    Grid points are independent scans. In-process by default: the default grid is a few
+    points and starting worker processes costs far more than scanning it. Pass `n_jobs`
+    (as in joblib; -1 = all cores) to run them in parallel: loky processes with joblib
+    installed, otherwise a spawn ProcessPoolExecutor (callers need a `__main__` guard).
+    """
     t0 = time.time()
-    monowave_skips_l = list(monowave_skips)
-    min_moves_l = list(min_moves)
-    max_gaps_l = list(max_gaps)
-    beam_widths_l = list(beam_widths)
-    # grid size (best effort)
-    try:
-        grid = (len(monowave_skips_l) * len(min_moves_l) * len(max_gaps_l) * len(beam_widths_l))
-    except Exception:
-        grid = None
-    log.debug("tune start", extra={"grid": grid, "max_patterns": max_patterns, "nms_overlap": nms_overlap})
+    debug = log.isEnabledFor(logging.DEBUG)
+    grid = list(product(monowave_skips, min_moves, max_gaps, beam_widths))
+    if debug:
+        log.debug("tune start", extra={"grid": len(grid), "max_patterns": max_patterns, "nms_overlap": nms_overlap})
+
+    workers = _pool_workers(n_jobs, len(grid))
+    if Parallel is not None and workers > 1:
+        results: List[TuneResult] = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_eval_point)(swings, base, sk, mm, mg, bw, max_patterns, nms_overlap) for sk, mm, mg, bw in grid
+        )
+    elif workers > 1:
+        with spawn_pool(workers, initializer=_init_pool, initargs=(swings,)) as ex:
+            results = list(ex.map(_eval_pool_point, [(base, sk, mm, mg, bw, max_patterns, nms_overlap) for sk, mm, mg, bw in grid]))
+    else:
+        results = [_eval_point(swings, base, sk, mm, mg, bw, max_patterns, nms_overlap) for sk, mm, mg, bw in grid]
+
+    # primary: best_conf, then fewer patterns, then best_score (first grid point wins ties)
     best: Optional[TuneResult] = None
-    checked = 0
-    for sk in monowave_skips_l:
-        for mm in min_moves_l:
-            for mg in max_gaps_l:
-                for bw in beam_widths_l:
-                    opts = WaveOptions(
-                        monowave_skip=sk,
-                        min_leg_abs_move=mm,
-                        max_gap=mg,
-                        beam_width=bw,
-                        max_candidates=base.max_candidates,
-                        max_patterns=max_patterns,
-                        nms_overlap=nms_overlap,
-                    )
-                    pats = scan_impulses_from_swings(
-                        swings,
-                        AnalyzerConfig.from_options(opts),
-                    )
-                    bs, bc = _summarize(pats)
-                    tr = TuneResult(opts, len(pats), bs, bc)
-                    checked += 1
-                    if checked % 25 == 0:
-                        log.debug("tune progress", extra={"checked": checked, "best_conf": (best.best_conf if best else None), "best_patterns": (best.patterns if best else None)})
-                    if best is None:
-                        best = tr
-                        log.debug("tune best", extra={"checked": checked, "best_conf": best.best_conf, "patterns": best.patterns, "score": best.best_score, "opts": best.options.__dict__})
-                        continue
-                    # primary: best_conf, then fewer patterns, then best_score
-                    if (tr.best_conf, -tr.patterns, tr.best_score) > (best.best_conf, -best.patterns, best.best_score):
-                        best = tr
-                        log.debug("tune best", extra={"checked": checked, "best_conf": best.best_conf, "patterns": best.patterns, "score": best.best_score, "opts": best.options.__dict__})
+    for checked, (tr, point) in enumerate(zip(results, grid), 1):
+        if best is None or (tr.best_conf, -tr.patterns, tr.best_score) > (best.best_conf, -best.patterns, best.best_score):
+            best = tr
+            if debug:
+                # only the grid coordinates vary between points; full options are logged once at the end
+                log.debug("tune best", extra={"checked": checked, "best_conf": best.best_conf, "patterns": best.patterns, "score": best.best_score, "grid_point": point})
     assert best is not None
-    log.debug("tune done", extra={"checked": checked, "elapsed_s": round(time.time()-t0, 3), "best_conf": best.best_conf, "patterns": best.patterns, "score": best.best_score})
+    if debug:
+        log.debug("tune done", extra={"checked": len(results), "elapsed_s": round(time.time()-t0, 3), "best_conf": best.best_conf, "patterns": best.patterns, "score": best.best_score, "opts": asdict(best.options)})
     return best
@@ -2,9 +2,9 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from typing import Dict, Optional
 
-import pandas as pd
+import numpy as np
 
 from ew6.data.types import BarSeries
 from ew6.exchange.types import Instrument
@@ -38,6 +38,7 @@ class MarketDataConnector(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def fetch_trades(self, req: TradesRequest) -> pd.DataFrame:
-        """Return trades indexed by UTC timestamp with at least: price, size (optional)."""
+    def fetch_trades(self, req: TradesRequest) -> Dict[str, np.ndarray]:
+        """Return trades as chronological, equal-length column arrays:
+        a (trade id, int64), T (ms UTC, int64), p (price), q (size) (float64), m (buyer is maker, bool)."""
         raise NotImplementedError
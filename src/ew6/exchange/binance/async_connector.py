@@ -0,0 +1,101 @@
+"""Concurrent OHLCV fetch for many (symbol, timeframe) requests.
+
+Batch runs used to issue one blocking klines request per job, so fetch wall time was
+the sum of all round trips. `fetch_ohlcv_many` issues them together under a
+semaphore (Binance weight limits) and returns results in request order.
+
+- With `aiohttp` installed, requests share one ClientSession.
+- Without it, the sync urllib connector runs in worker threads via asyncio.to_thread.
+
+Both paths read/write the same disk cache as BinanceConnector.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, List, Optional, Sequence
+from urllib.parse import urlencode
+
+from .connector import BinanceConnector, _klines_to_bars, _loads, _read_cached, _write_cached
+
+try:
+    import aiohttp  # type: ignore
+except Exception:  # pragma: no cover
+    aiohttp = None  # type: ignore
+
+DEFAULT_CONCURRENCY = 10
+
+
+def _read_cache(conn: BinanceConnector, url: str) -> Optional[Any]:
+    cfg = conn.cfg
+    if not (cfg.use_cache and cfg.cache_dir):
+        return None
+    try:
+        return _read_cached(cfg.cache_dir, url, int(cfg.cache_ttl_s))
+    except Exception:
+        return None
+
+
+def _write_cache(conn: BinanceConnector, url: str, data: Any) -> None:
+    cfg = conn.cfg
+    if not (cfg.use_cache and cfg.cache_dir):
+        return
+    try:
+        _write_cached(cfg.cache_dir, url, data)
+    except Exception:
+        pass
+
+
+async def fetch_ohlcv_async(session: Any, conn: BinanceConnector, req: Any) -> Any:
+    """One klines request over an aiohttp session (same retry policy as the sync connector)."""
+    base, path, params = conn._ohlcv_params(req)
+    qs = urlencode({k: v for k, v in params.items() if v is not None})
+    url = f"{base}{path}?{qs}" if qs else f"{base}{path}"
+
+    data = _read_cache(conn, url)
+    if data is not None:
+        return _klines_to_bars(data)
+
+    cfg = conn.cfg
+    timeout = aiohttp.ClientTimeout(total=float(cfg.timeout_s))
+    for attempt in range(int(cfg.retry) + 1):
+        try:
+            async with session.get(url, headers={"User-Agent": cfg.user_agent}, timeout=timeout) as resp:
+                if resp.status == 200:
+                    data = _loads(await resp.read())
+                    _write_cache(conn, url, data)
+                    return _klines_to_bars(data)
+                body = await resp.text()
+                is_transient = resp.status in (418, 429) or 500 <= resp.status <= 599 or "internal error" in body.lower()
+                if not is_transient or attempt >= int(cfg.retry):
+                    raise RuntimeError(f"Binance HTTP {resp.status} for {url}. Body: {body}")
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:  # aiohttp timeouts are not ClientErrors
+            if attempt >= int(cfg.retry):
+                raise RuntimeError(f"Binance ClientError for {url}: {e!r}") from e
+        await asyncio.sleep(min(3.0, float(cfg.retry_sleep_s) * (2 ** attempt)))
+    raise RuntimeError(f"Binance fetch failed for {url}")
+
+
+async def _gather_all(conn: BinanceConnector, reqs: Sequence[Any], concurrency: int) -> List[Any]:
+    sem = asyncio.Semaphore(max(1, int(concurrency)))
+
+    if aiohttp is None:
+        async def one(req: Any) -> Any:
+            async with sem:
+                return await asyncio.to_thread(conn.fetch_ohlcv, req)
+
+        return list(await asyncio.gather(*(one(r) for r in reqs)))
+
+    async with aiohttp.ClientSession() as session:
+        async def one_http(req: Any) -> Any:
+            async with sem:
+                return await fetch_ohlcv_async(session, conn, req)
+
+        return list(await asyncio.gather(*(one_http(r) for r in reqs)))
+
+
+def fetch_ohlcv_many(conn: BinanceConnector, reqs: Sequence[Any], concurrency: int = DEFAULT_CONCURRENCY) -> List[Any]:
+    """Fetch all klines requests concurrently; results are in `reqs` order."""
+    if not reqs:
+        return []
+    return asyncio.run(_gather_all(conn, reqs, concurrency))
@@ -1,7 +1,8 @@
 """Binance connector (spot + futures) for OHLCV and aggTrades.
 
 M1.7 goals:
-- Disk cache (deterministic replay + faster batch)
+- Disk cache (deterministic replay + faster batch); responses are stored as JSON
+  (never pickled: the cache dir is a plain working-tree path anyone may write to)
 - Simple retry/backoff for transient issues (429 / 5xx / "Internal error")
 
 No third-party deps (requests); uses urllib.
@@ -10,15 +11,25 @@ No third-party deps (requests); uses urllib.
 from __future__ import annotations
 
 import json
+import operator
 import time
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from urllib.error import HTTPError, URLError
 from urllib.parse import urlencode
 from urllib.request import Request, urlopen
 
+import numpy as np
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
 from ew6.logging import get_logger
 
 log = get_logger("ew6.binance")
@@ -34,6 +45,7 @@ class BinanceConfig:
     retry: int = 3
     retry_sleep_s: float = 0.35
     progress: bool = False
+    trade_workers: int = 1  # >1: concurrent speculative aggTrades pages (opt-in; costs request weight)
 
     # cache
     use_cache: bool = True
@@ -41,26 +53,60 @@ class BinanceConfig:
     cache_ttl_s: int = 0  # 0 => never expire
 
 
-def _is_spot(market: Any) -> bool:
-    v = None
+# response bodies are parsed straight from bytes (json.loads detects UTF-8 itself)
+_loads = orjson.loads if orjson is not None else json.loads
+
+
+@lru_cache(maxsize=16)
+def _market_str(market: Any) -> str:
+    """MarketType (enum value) or plain string -> its string form."""
     if hasattr(market, "value"):
         try:
-            v = str(getattr(market, "value"))
+            return str(getattr(market, "value"))
         except Exception:
-            v = None
-    if v is None:
-        v = str(market)
-    v = v.lower()
-    return "spot" in v
+            pass
+    return str(market)
 
 
+@lru_cache(maxsize=16)
+def _is_spot(market: Any) -> bool:
+    return "spot" in _market_str(market).lower()
+
+
+# a request hashes its url for the cache read and the write
+@lru_cache(maxsize=1024)
 def _sha256(s: str) -> str:
     return hashlib.sha256(s.encode("utf-8")).hexdigest()
 
 
+@lru_cache(maxsize=16)
+def _cache_root(cache_dir: str) -> Path:
+    return Path(cache_dir)
+
+
 def _cache_path(cache_dir: str, url: str) -> Path:
     key = _sha256(url)
-    return Path(cache_dir) / f"{key}.json"
+    return _cache_root(cache_dir) / f"{key}.json"
+
+
+# responses are parsed JSON (lists/dicts of str/number), so they round-trip as JSON
+_dumps = orjson.dumps if orjson is not None else (lambda data: json.dumps(data).encode("utf-8"))
+
+
+def _read_cached(cache_dir: str, url: str, ttl_s: int) -> Any:
+    """Cached response for `url`, or None."""
+    p = _cache_path(cache_dir, url)
+    if _cache_fresh(p, ttl_s):
+        return _loads(p.read_bytes())
+    return None
+
+
+def _write_cached(cache_dir: str, url: str, data: Any) -> None:
+    p = _cache_path(cache_dir, url)
+    p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_suffix(p.suffix + ".tmp")
+    tmp.write_bytes(_dumps(data))
+    tmp.replace(p)
 
 
 def _cache_fresh(p: Path, ttl_s: int) -> bool:
@@ -75,6 +121,71 @@ def _cache_fresh(p: Path, ttl_s: int) -> bool:
         return False
 
 
+def _klines_to_bars(data: Any) -> Any:
+    # Return BarSeries if available
+    try:
+        from ew6.data.bars import Bar, BarSeries  # type: ignore
+        bars = []
+        for k in data:
+            bars.append(
+                Bar(
+                    ts=int(k[0]),
+                    open=float(k[1]),
+                    high=float(k[2]),
+                    low=float(k[3]),
+                    close=float(k[4]),
+                    volume=float(k[5]),
+                )
+            )
+        return BarSeries.from_bars(bars)
+    except Exception:
+        return data
+
+
+_AGG_COLS = ("a", "T", "p", "q", "m")
+_AGG_ROW = operator.itemgetter(*_AGG_COLS)
+_AGG_PAGE_DTYPE = np.dtype([("a", "i8"), ("T", "i8"), ("p", "f8"), ("q", "f8"), ("m", "?")])
+
+
+def _page_to_columns(data: List[Dict[str, Any]]) -> np.ndarray:
+    """One aggTrades page -> structured array (a, T, p, q, m); rows without T/p are dropped."""
+    try:
+        return np.fromiter(map(_AGG_ROW, data), dtype=_AGG_PAGE_DTYPE, count=len(data))
+    except (KeyError, TypeError, ValueError):
+        pass
+    # partial rows: one lookup per key
+    rows = []
+    for x in data:
+        t = x.get("T")
+        p = x.get("p")
+        if t is None or p is None:
+            continue
+        rows.append((int(x.get("a", -1)), int(t), float(p), float(x.get("q") or 0.0), bool(x.get("m", False))))
+    return np.array(rows, dtype=_AGG_PAGE_DTYPE)
+
+
+def _merge_pages(page_list: List[np.ndarray]) -> Dict[str, np.ndarray]:
+    """Chronological, de-duplicated aggTrades columns from pages fetched newest-first.
+
+    Each page is ascending in T and pages walk backwards in time, so reversing the page
+    order is already sorted. Rows whose aggregate id ("a") does not exceed an earlier id
+    (overlap at a page junction) are dropped; an out-of-order result gets a stable sort on T.
+    """
+    rec = np.concatenate(page_list[::-1]) if page_list else np.empty(0, dtype=_AGG_PAGE_DTYPE)
+    a = rec["a"]
+    if a.shape[0] > 1 and (a >= 0).all():
+        seen = np.maximum.accumulate(a)
+        keep = np.empty(a.shape[0], dtype=bool)
+        keep[0] = True
+        np.greater(a[1:], seen[:-1], out=keep[1:])
+        if not keep.all():
+            rec = rec[keep]
+    t = rec["T"]
+    if t.shape[0] > 1 and (t[1:] < t[:-1]).any():
+        rec = rec[np.argsort(t, kind="stable")]
+    return {name: np.ascontiguousarray(rec[name]) for name in _AGG_COLS}
+
+
 class BinanceConnector:
     def __init__(self, cfg: BinanceConfig = BinanceConfig()):
         self.cfg = cfg
@@ -90,10 +201,9 @@ class BinanceConnector:
         # --- cache read
         if self.cfg.use_cache and self.cfg.cache_dir:
             try:
-                p = _cache_path(self.cfg.cache_dir, url)
-                if _cache_fresh(p, int(self.cfg.cache_ttl_s)):
-                    with p.open("r", encoding="utf-8") as f:
-                        return json.load(f)
+                data = _read_cached(self.cfg.cache_dir, url, int(self.cfg.cache_ttl_s))
+                if data is not None:
+                    return data
             except Exception:
                 pass
 
@@ -103,18 +213,12 @@ class BinanceConnector:
             req = Request(url, headers={"User-Agent": self.cfg.user_agent})
             try:
                 with urlopen(req, timeout=float(self.cfg.timeout_s)) as resp:
-                    raw = resp.read().decode("utf-8")
-                    data = json.loads(raw)
+                    data = _loads(resp.read())
 
                 # cache write
                 if self.cfg.use_cache and self.cfg.cache_dir:
                     try:
-                        p = _cache_path(self.cfg.cache_dir, url)
-                        p.parent.mkdir(parents=True, exist_ok=True)
-                        tmp = p.with_suffix(p.suffix + ".tmp")
-                        with tmp.open("w", encoding="utf-8") as f:
-                            json.dump(data, f)
-                        tmp.replace(p)
+                        _write_cached(self.cfg.cache_dir, url, data)
                     except Exception:
                         pass
 
@@ -159,7 +263,8 @@ class BinanceConnector:
         raise RuntimeError("unknown error")
 
     # -------- OHLCV --------
-    def fetch_ohlcv(self, req) -> Any:
+    def _ohlcv_params(self, req) -> Tuple[str, str, Dict[str, Any]]:
+        """(base, path, params) for a klines request; shared with the async fetcher."""
         inst: Instrument = req.instrument if hasattr(req, "instrument") else req.inst
         timeframe = getattr(req, "timeframe", "5m")
         market = inst.market
@@ -172,29 +277,16 @@ class BinanceConnector:
         end_ms = getattr(req, "end_ms", None)
 
         params = {"symbol": inst.symbol, "interval": timeframe, "limit": limit, "startTime": start_ms, "endTime": end_ms}
-        data = self._get_json(base, path, params)
+        return base, path, params
 
-        # Return BarSeries if available
-        try:
-            from ew6.data.bars import Bar, BarSeries  # type: ignore
-            bars = []
-            for k in data:
-                bars.append(
-                    Bar(
-                        ts=int(k[0]),
-                        open=float(k[1]),
-                        high=float(k[2]),
-                        low=float(k[3]),
-                        close=float(k[4]),
-                        volume=float(k[5]),
-                    )
-                )
-            return BarSeries.from_bars(bars)
-        except Exception:
-            return data
+    def fetch_ohlcv(self, req) -> Any:
+        base, path, params = self._ohlcv_params(req)
+        data = self._get_json(base, path, params)
+        return _klines_to_bars(data)
 
     # -------- Trades / ticks --------
-    def fetch_trades(self, req) -> List[Dict[str, Any]]:
+    def fetch_trades(self, req) -> Dict[str, np.ndarray]:
+        """aggTrades as chronological columns: a (id), T (ms), p, q (float64), m (bool)."""
         inst: Instrument = req.instrument if hasattr(req, "instrument") else req.inst
         market = inst.market
         base = self._base_url(market)
@@ -214,70 +306,122 @@ class BinanceConnector:
 
         meta = FetchMeta(
             venue="binance",
-            market=str(getattr(market, "value", market)),
+            market=_market_str(market),
             kind="trades",
             requested_start_ms=int(start_ms),
             requested_end_ms=int(end_ms),
         )
 
-        out: List[Dict[str, Any]] = []
+        page_list: List[np.ndarray] = []
+        fetched = 0
         pages = 0
         cur_end = int(end_ms)
+        est_step = 0  # ms covered by the last full page; enables speculative fetches
+        workers = max(1, int(self.cfg.trade_workers))
+        pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
 
         retries_left = int(self.cfg.retry)
 
-        while len(out) < max_records:
-            params = {"symbol": inst.symbol, "limit": min(limit, max_records - len(out)), "endTime": cur_end}
-            try:
-                data = self._get_json(base, path, params)
-            except RuntimeError as e:
-                # for aggTrades, Binance sometimes returns 400 with body containing internal error;
-                # _get_json retries already, but we also step back in time and keep going.
-                if retries_left > 0:
-                    retries_left -= 1
-                    meta.notes = f"retry_after_error: {str(e)[:200]}"
-                    time.sleep(float(self.cfg.retry_sleep_s))
-                    cur_end -= 60_000
-                    continue
-                meta.cap_reason = "error"
-                meta.notes = f"error: {str(e)[:250]}"
-                break
-
+        def accept(data: List[Dict[str, Any]], page: np.ndarray, new_rows: int) -> None:
+            nonlocal pages, fetched, cur_end, est_step
             pages += 1
-            if not isinstance(data, list) or len(data) == 0:
-                meta.cap_reason = meta.cap_reason or "empty"
-                break
+            fetched += new_rows
+            page_list.append(page)
+            if page.shape[0]:
+                t_arr = page["T"]
+                batch_min = int(t_arr.min())
+                batch_max = int(t_arr.max())
+                meta.earliest_ms = batch_min if meta.earliest_ms is None else min(meta.earliest_ms, batch_min)
+                meta.latest_ms = batch_max if meta.latest_ms is None else max(meta.latest_ms, batch_max)
+                cur_end = min(cur_end, batch_min - 1)
+                est_step = batch_max - batch_min + 1 if len(data) >= limit else 0
 
-            out.extend(data)
+        try:
+            while fetched < max_records:
+                if pool is not None and est_step > 0 and max_records - fetched >= workers * limit:
+                    # Speculative pages: endTime stepped back by most of the observed page span. A page
+                    # is kept only while aggregate ids stay contiguous with the older data
+                    # already held; on a gap, error or empty page, resume sequentially.
+                    stride = max(1, est_step * 3 // 4)  # overlap pages a little; duplicates are dropped on merge
+                    ends = [cur_end - i * stride for i in range(workers)]
+                    futs = [pool.submit(self._get_json, base, path, {"symbol": inst.symbol, "limit": limit, "endTime": e}) for e in ends]
+                    oldest_a: Optional[int] = int(page_list[-1]["a"].min()) if page_list and page_list[-1].shape[0] else None
+                    contiguous = True
+                    for fut in futs:
+                        try:
+                            data = fut.result()
+                            page = _page_to_columns(data) if isinstance(data, list) else None
+                        except Exception:
+                            page = None
+                        if page is None or oldest_a is None or page.shape[0] == 0 or (page["a"] < 0).any():
+                            contiguous = False
+                            break
+                        if int(page["a"].min()) >= oldest_a:
+                            continue  # already covered
+                        if int(page["a"].max()) + 1 < oldest_a:
+                            contiguous = False  # gap: trades between the two pages were not fetched
+                            break
+                        accept(data, page, int((page["a"] < oldest_a).sum()))
+                        oldest_a = int(page["a"].min())
+                        if meta.earliest_ms is not None and meta.earliest_ms <= int(start_ms):
+                            break
+                    for fut in futs:
+                        fut.cancel()
+                    if meta.earliest_ms is not None and meta.earliest_ms <= int(start_ms):
+                        meta.cap_reason = meta.cap_reason or "start_reached"
+                        break
+                    if pages > 10_000:
+                        meta.cap_reason = meta.cap_reason or "max_pages"
+                        meta.notes = "hit max_pages safety"
+                        break
+                    if not contiguous:
+                        est_step = 0  # errors and empty pages are handled by the sequential path
+                    continue
 
-            try:
-                times = [int(x.get("T")) for x in data if "T" in x]
-                if times:
-                    batch_min = min(times)
-                    batch_max = max(times)
-                    meta.earliest_ms = batch_min if meta.earliest_ms is None else min(meta.earliest_ms, batch_min)
-                    meta.latest_ms = batch_max if meta.latest_ms is None else max(meta.latest_ms, batch_max)
-                    cur_end = batch_min - 1
-            except Exception:
-                pass
+                params = {"symbol": inst.symbol, "limit": min(limit, max_records - fetched), "endTime": cur_end}
+                try:
+                    data = self._get_json(base, path, params)
+                except RuntimeError as e:
+                    # for aggTrades, Binance sometimes returns 400 with body containing internal error;
+                    # _get_json retries already, but we also step back in time and keep going.
+                    if retries_left > 0:
+                        retries_left -= 1
+                        meta.notes = f"retry_after_error: {str(e)[:200]}"
+                        time.sleep(float(self.cfg.retry_sleep_s))
+                        cur_end -= 60_000
+                        continue
+                    meta.cap_reason = "error"
+                    meta.notes = f"error: {str(e)[:250]}"
+                    break
+
+                if not isinstance(data, list) or len(data) == 0:
+                    pages += 1
+                    meta.cap_reason = meta.cap_reason or "empty"
+                    break
 
-            if meta.earliest_ms is not None and meta.earliest_ms <= int(start_ms):
-                meta.cap_reason = meta.cap_reason or "start_reached"
-                break
+                try:
+                    page = _page_to_columns(data)
+                except Exception:
+                    page = np.empty(0, dtype=_AGG_PAGE_DTYPE)
+                accept(data, page, len(data))
 
-            if pages > 10_000:
-                meta.cap_reason = meta.cap_reason or "max_pages"
-                meta.notes = "hit max_pages safety"
-                break
+                if meta.earliest_ms is not None and meta.earliest_ms <= int(start_ms):
+                    meta.cap_reason = meta.cap_reason or "start_reached"
+                    break
 
-        try:
-            out.sort(key=lambda x: int(x.get("T", 0)))
-        except Exception:
-            pass
+                if pages > 10_000:
+                    meta.cap_reason = meta.cap_reason or "max_pages"
+                    meta.notes = "hit max_pages safety"
+                    break
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+        out = _merge_pages(page_list)
 
-        meta.records = len(out)
+        meta.records = int(out["T"].shape[0])
         meta.pages = pages
-        if meta.cap_reason == "" and len(out) >= max_records:
+        if meta.cap_reason == "" and fetched >= max_records:
             meta.cap_reason = "max_records"
 
         self.last_meta = meta
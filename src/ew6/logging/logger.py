@@ -2,11 +2,20 @@ from __future__ import annotations
 
 import json
 import logging
+import math
 import os
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+# numpy scalars/arrays show up in debug extras
+_ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY if orjson is not None else 0
+
 _LEVELS = {
     "debug": logging.DEBUG,
     "info": logging.INFO,
@@ -24,6 +33,33 @@ class LogConfig:
     to_file: Optional[str] = None
     utc: bool = True
 
+# LogRecord attributes that are not user extras
+_RESERVED_FIELDS = frozenset({
+    "args", "msg", "levelname", "levelno", "name", "created", "msecs", "relativeCreated",
+    "pathname", "filename", "module", "lineno", "funcName", "stack_info", "exc_info", "exc_text",
+    "thread", "threadName", "processName", "process",
+})
+
+def _all_finite(v: Any) -> bool:
+    """False if `v` holds a NaN/inf float anywhere (orjson would write it as null)."""
+    if isinstance(v, float):
+        return math.isfinite(v)
+    if isinstance(v, dict):
+        return all(_all_finite(x) for x in v.values())
+    if isinstance(v, (list, tuple)):
+        return all(_all_finite(x) for x in v)
+    if hasattr(v, "dtype") and hasattr(v, "tolist"):  # numpy scalar/array
+        return _all_finite(v.tolist())
+    return True
+
+
+def _json_default(o: Any) -> Any:
+    # numpy scalars/arrays for the stdlib encoder (orjson handles them itself)
+    if hasattr(o, "dtype") and hasattr(o, "tolist"):
+        return o.tolist()
+    raise TypeError(f"Object of type {type(o).__name__} is not JSON serializable")
+
+
 class _JsonFormatter(logging.Formatter):
     def __init__(self, utc: bool = True):
         super().__init__()
@@ -32,22 +68,29 @@ class _JsonFormatter(logging.Formatter):
     def format(self, record: logging.LogRecord) -> str:
         ts = datetime.fromtimestamp(record.created, tz=timezone.utc if self.utc else None)
         payload: Dict[str, Any] = {
-            "ts": ts.isoformat(),
+            # orjson writes datetimes in isoformat itself
+            "ts": ts if orjson is not None else ts.isoformat(),
             "level": record.levelname.lower(),
             "name": record.name,
             "msg": record.getMessage(),
         }
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
-        for k, v in record.__dict__.items():
-            if k.startswith("_") or k in payload:
-                continue
-            if k in ("args","msg","levelname","levelno","name","created","msecs","relativeCreated",
-                     "pathname","filename","module","lineno","funcName","stack_info","exc_info","exc_text",
-                     "thread","threadName","processName","process"):
-                continue
-            payload[k] = v
-        return json.dumps(payload, ensure_ascii=False)
+        payload.update(
+            {
+                k: v
+                for k, v in record.__dict__.items()
+                if k[:1] != "_" and k not in _RESERVED_FIELDS and k not in payload
+            }
+        )
+        # non-finite floats go through the stdlib encoder (Infinity/NaN) with or without orjson
+        if orjson is not None and _all_finite(payload):
+            try:
+                return orjson.dumps(payload, option=_ORJSON_OPTS).decode("utf-8")
+            except TypeError:
+                pass
+        payload["ts"] = ts.isoformat()
+        return json.dumps(payload, ensure_ascii=False, default=_json_default)
 
 def setup_logging(cfg: LogConfig) -> None:
     lvl = _LEVELS.get(cfg.level.lower().strip(), logging.INFO)
@@ -14,3 +14,7 @@ class Notifier:
     name: str = "notifier"
     def send(self, msg: NotificationMessage) -> None:  # pragma: no cover
         raise NotImplementedError
+    def open(self) -> None:
+        """Acquire a transport reused by the following `send` calls (no-op by default)."""
+    def close(self) -> None:
+        """Release what `open` acquired (no-op by default)."""
@@ -1,10 +1,15 @@
 from __future__ import annotations
 
+import copy
+import mmap
 import os
 import smtplib
+import time
 from dataclasses import dataclass
+from email import contentmanager
 from email.message import EmailMessage
-from typing import List
+from functools import lru_cache
+from typing import List, Optional
 
 from ew6.notify.base import NotificationMessage, Notifier
 
@@ -17,6 +22,35 @@ class EmailConfig:
     starttls: bool = True
     mail_from: str = ""
     mail_to: List[str] = None  # type: ignore
+    timeout_s: float = 20.0
+    idle_timeout_s: float = 100.0  # an open() connection unused this long is dropped and redialled
+
+# attachments at least this big are mapped rather than read, so base64 encoding works
+# straight off the page cache instead of a private copy of the whole file
+_MMAP_MIN_BYTES = 4 * 1024 * 1024
+
+# raw_data_manager plus mmap support (encoded exactly like bytes)
+_CONTENT_MANAGER = copy.deepcopy(contentmanager.raw_data_manager)
+_CONTENT_MANAGER.add_set_handler(mmap.mmap, contentmanager.set_bytes_content)
+
+_FALSY = frozenset(("0", "false", "False", "no", "NO"))
+
+@lru_cache(maxsize=1)
+def _env_config() -> EmailConfig:
+    host = os.getenv("EW6_SMTP_HOST", "").strip()
+    port = int(os.getenv("EW6_SMTP_PORT", "587").strip() or "587")
+    user = os.getenv("EW6_SMTP_USER", "").strip()
+    password = os.getenv("EW6_SMTP_PASSWORD", "").strip()
+    starttls = os.getenv("EW6_SMTP_STARTTLS", "1").strip() not in _FALSY
+    mail_from = os.getenv("EW6_EMAIL_FROM", user).strip()
+    to_raw = os.getenv("EW6_EMAIL_TO", "").strip()
+    mail_to = [x.strip() for x in to_raw.split(",") if x.strip()]
+    if not host or not mail_from or not mail_to:
+        raise RuntimeError("Missing EW6_SMTP_HOST / EW6_EMAIL_FROM / EW6_EMAIL_TO (and optionally EW6_SMTP_USER/PASSWORD)")
+    return EmailConfig(
+        smtp_host=host, smtp_port=port, smtp_user=user, smtp_password=password,
+        starttls=starttls, mail_from=mail_from, mail_to=mail_to,
+    )
 
 class EmailNotifier(Notifier):
     name = "email"
@@ -25,23 +59,15 @@ class EmailNotifier(Notifier):
         if not cfg.mail_to:
             raise ValueError("EmailConfig.mail_to must not be empty")
         self.cfg = cfg
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
 
     @classmethod
-    def from_env(cls) -> "EmailNotifier":
-        host = os.getenv("EW6_SMTP_HOST", "").strip()
-        port = int(os.getenv("EW6_SMTP_PORT", "587").strip() or "587")
-        user = os.getenv("EW6_SMTP_USER", "").strip()
-        password = os.getenv("EW6_SMTP_PASSWORD", "").strip()
-        starttls = os.getenv("EW6_SMTP_STARTTLS", "1").strip() not in ("0","false","False","no","NO")
-        mail_from = os.getenv("EW6_EMAIL_FROM", user).strip()
-        to_raw = os.getenv("EW6_EMAIL_TO", "").strip()
-        mail_to = [x.strip() for x in to_raw.split(",") if x.strip()]
-        if not host or not mail_from or not mail_to:
-            raise RuntimeError("Missing EW6_SMTP_HOST / EW6_EMAIL_FROM / EW6_EMAIL_TO (and optionally EW6_SMTP_USER/PASSWORD)")
-        return cls(EmailConfig(
-            smtp_host=host, smtp_port=port, smtp_user=user, smtp_password=password,
-            starttls=starttls, mail_from=mail_from, mail_to=mail_to,
-        ))
+    def from_env(cls, reload: bool = False) -> "EmailNotifier":
+        """Build from EW6_SMTP_* / EW6_EMAIL_* (read once per process; `reload=True` re-reads them)."""
+        if reload:
+            _env_config.cache_clear()
+        return cls(_env_config())
 
     def send(self, msg: NotificationMessage) -> None:
         em = EmailMessage()
@@ -53,14 +79,63 @@ class EmailNotifier(Notifier):
         for p in msg.attachments or []:
             try:
                 with open(p, "rb") as f:
+                    if os.fstat(f.fileno()).st_size >= _MMAP_MIN_BYTES:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            em.add_attachment(mm, maintype="application", subtype="octet-stream",
+                                              filename=os.path.basename(p), content_manager=_CONTENT_MANAGER)
+                        continue
                     data = f.read()
                 em.add_attachment(data, maintype="application", subtype="octet-stream", filename=os.path.basename(p))
             except FileNotFoundError:
                 continue
 
-        with smtplib.SMTP(self.cfg.smtp_host, self.cfg.smtp_port, timeout=20) as s:
+        if self._smtp is None:
+            with self._dial() as s:
+                s.send_message(em)
+            return
+        if time.monotonic() - self._last_used > self.cfg.idle_timeout_s:
+            self._reopen()
+        try:
+            self._smtp.send_message(em)
+        except smtplib.SMTPServerDisconnected:
+            # server dropped the idle session; one redial before giving up
+            self._reopen()
+            self._smtp.send_message(em)
+        self._last_used = time.monotonic()
+
+    def _dial(self) -> smtplib.SMTP:
+        s = smtplib.SMTP(self.cfg.smtp_host, self.cfg.smtp_port, timeout=self.cfg.timeout_s)
+        try:
             if self.cfg.starttls:
                 s.starttls()
             if self.cfg.smtp_user:
                 s.login(self.cfg.smtp_user, self.cfg.smtp_password)
-            s.send_message(em)
+        except Exception:
+            s.close()
+            raise
+        return s
+
+    def _reopen(self) -> None:
+        self.close()
+        self.open()
+
+    def open(self) -> None:
+        """Keep one authenticated SMTP session for the following `send` calls (until `close`)."""
+        if self._smtp is None:
+            self._smtp = self._dial()
+            self._last_used = time.monotonic()
+
+    def close(self) -> None:
+        if self._smtp is not None:
+            s, self._smtp = self._smtp, None
+            try:
+                s.quit()
+            except (smtplib.SMTPException, OSError):
+                s.close()
+
+    def __enter__(self) -> "EmailNotifier":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
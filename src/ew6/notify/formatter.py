@@ -3,9 +3,18 @@ from __future__ import annotations
 from typing import Any, Dict, List
 
 
+# bound str.format per precision, so a cell does not rebuild its format spec
+_SPECS = {2: "{:.2f}".format, 3: "{:.3f}".format}
+
+
 def _fmt_float(x: Any, nd: int = 2) -> str:
+    spec = _SPECS.get(nd)
+    if spec is None:
+        spec = _SPECS.setdefault(nd, f"{{:.{nd}f}}".format)
+    if type(x) is float:
+        return spec(x)
     try:
-        return f"{float(x):.{nd}f}"
+        return spec(float(x))
     except Exception:
         return str(x)
 
@@ -15,16 +24,18 @@ def format_compact(*, results: List[Dict[str, Any]], ranked: List[Dict[str, Any]
     if ranked:
         top = ", ".join([f"{r.get('symbol')}:{r.get('timeframe')}:{_fmt_float(r.get('score'), 3)}" for r in ranked[:10]])
         lines.append(f"reco: {top}")
+    fmt = _fmt_float
     for r in results[:10]:
-        sym = r.get("symbol")
-        tf = r.get("timeframe")
+        get = r.get
         bt = ""
-        if r.get("bt_trades") is not None and r.get("bt_trades", 0) > 0:
-            bt = f" bt_trades={r.get('bt_trades')} ret={_fmt_float(r.get('bt_totalret'))} pf={_fmt_float(r.get('bt_pf'))}"
+        bt_trades = get("bt_trades")
+        if bt_trades is not None and bt_trades > 0:
+            bt = f" bt_trades={bt_trades} ret={fmt(get('bt_totalret'))} pf={fmt(get('bt_pf'))}"
         wf = ""
-        if r.get("wf_score") is not None and float(r.get("wf_score") or 0) > 0:
-            wf = f" wf={_fmt_float(r.get('wf_score'), 2)}"
-        lines.append(f"{sym} {tf}{bt}{wf}")
+        wf_score = get("wf_score")
+        if wf_score is not None and float(wf_score or 0) > 0:
+            wf = f" wf={fmt(wf_score, 2)}"
+        lines.append(f"{get('symbol')} {get('timeframe')}{bt}{wf}")
     if len(results) > 10:
         lines.append(f"... +{len(results)-10} more")
     return "\n".join(lines).strip() + "\n"
@@ -32,23 +43,26 @@ def format_compact(*, results: List[Dict[str, Any]], ranked: List[Dict[str, Any]
 
 def format_pretty(*, results: List[Dict[str, Any]], ranked: List[Dict[str, Any]]) -> str:
     lines: List[str] = []
+    append = lines.append
+    fmt = _fmt_float
     if ranked:
-        lines.append("Top recommendations:")
+        append("Top recommendations:")
         for r in ranked[:10]:
-            lines.append(f"- {r.get('symbol')} {r.get('timeframe')} score={_fmt_float(r.get('score'), 3)}")
-        lines.append("")
-    lines.append("Runs:")
+            append(f"- {r.get('symbol')} {r.get('timeframe')} score={fmt(r.get('score'), 3)}")
+        append("")
+    append("Runs:")
     for r in results:
-        sym = r.get("symbol")
-        tf = r.get("timeframe")
-        bars = r.get("bars")
-        pats = r.get("patterns")
-        conf = _fmt_float(r.get("best_conf"), 2)
-        score = _fmt_float(r.get("best_score"), 2)
-        line = f"- {sym} {tf} bars={bars} patterns={pats} best_score={score} best_conf={conf}"
-        if r.get("bt_trades", 0) > 0:
-            line += f" | BT trades={r.get('bt_trades')} win={_fmt_float(r.get('bt_winrate'),2)} ret={_fmt_float(r.get('bt_totalret'),2)} mdd={_fmt_float(r.get('bt_mdd'),2)} pf={_fmt_float(r.get('bt_pf'),2)}"
-        if float(r.get("wf_score") or 0) > 0:
-            line += f" | WF mode={r.get('wf_mode')} score={_fmt_float(r.get('wf_score'),2)} pos={_fmt_float(r.get('wf_pos'),2)}"
-        lines.append(line)
+        get = r.get
+        parts = [
+            f"- {get('symbol')} {get('timeframe')} bars={get('bars')} patterns={get('patterns')}"
+            f" best_score={fmt(get('best_score'), 2)} best_conf={fmt(get('best_conf'), 2)}"
+        ]
+        if get("bt_trades", 0) > 0:
+            parts.append(
+                f" | BT trades={get('bt_trades')} win={fmt(get('bt_winrate'), 2)} ret={fmt(get('bt_totalret'), 2)}"
+                f" mdd={fmt(get('bt_mdd'), 2)} pf={fmt(get('bt_pf'), 2)}"
+            )
+        if float(get("wf_score") or 0) > 0:
+            parts.append(f" | WF mode={get('wf_mode')} score={fmt(get('wf_score'), 2)} pos={fmt(get('wf_pos'), 2)}")
+        append("".join(parts))
     return "\n".join(lines).strip() + "\n"
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from typing import List, Tuple
 
@@ -38,7 +39,48 @@ class NotifierManager:
                 print(f"Notify channel '{c}' disabled: {e}", file=sys.stderr)
         return cls(notifiers)
 
-    def send(self, msg: NotificationMessage, strict: bool=False) -> SendResult:
+    def send(self, msg: NotificationMessage, strict: bool=False, parallel: bool=True) -> SendResult:
+        """Send `msg` through every notifier; with `parallel` the channels run on their own
+        threads so the total latency is the slowest channel, not the sum of them.
+
+        With `strict`, the serial path stops at the first failing channel; the parallel path
+        has already started every channel, so all of them still send and the first failure
+        (in notifier order) is raised once they have finished."""
+        if not self.notifiers:
+            if strict:
+                raise RuntimeError("No notifiers configured")
+            return SendResult(ok=False, sent=[], failed=[("all","no notifiers configured")])
+
+        sent: List[str] = []
+        failed: List[Tuple[str, str]] = []
+        if not parallel or len(self.notifiers) == 1:
+            for n in self.notifiers:
+                try:
+                    n.send(msg)
+                    sent.append(getattr(n, "name", n.__class__.__name__))
+                except Exception as e:
+                    failed.append((getattr(n,"name", n.__class__.__name__), str(e)))
+                    if strict:
+                        raise
+            return SendResult(ok=(len(failed)==0), sent=sent, failed=failed)
+
+        with ThreadPoolExecutor(max_workers=len(self.notifiers)) as ex:
+            futs = [ex.submit(n.send, msg) for n in self.notifiers]
+        # results in notifier order, whatever order the channels finished in
+        for n, f in zip(self.notifiers, futs):
+            name = getattr(n, "name", n.__class__.__name__)
+            e = f.exception()
+            if e is None:
+                sent.append(name)
+            else:
+                failed.append((name, str(e)))
+                if strict:
+                    raise e
+        return SendResult(ok=(len(failed)==0), sent=sent, failed=failed)
+
+    def send_many(self, msgs: List[NotificationMessage], strict: bool=False) -> SendResult:
+        """Send a batch notifier by notifier, so each keeps one transport open (SMTP session,
+        HTTPS connection) for all of `msgs`; `sent`/`failed` get one entry per (notifier, msg)."""
         if not self.notifiers:
             if strict:
                 raise RuntimeError("No notifiers configured")
@@ -47,11 +89,26 @@ class NotifierManager:
         sent: List[str] = []
         failed: List[Tuple[str, str]] = []
         for n in self.notifiers:
+            name = getattr(n, "name", n.__class__.__name__)
             try:
-                n.send(msg)
-                sent.append(getattr(n, "name", n.__class__.__name__))
+                n.open()
             except Exception as e:
-                failed.append((getattr(n,"name", n.__class__.__name__), str(e)))
+                failed.extend((name, str(e)) for _ in msgs)
                 if strict:
                     raise
+                continue
+            try:
+                for m in msgs:
+                    try:
+                        n.send(m)
+                        sent.append(name)
+                    except Exception as e:
+                        failed.append((name, str(e)))
+                        if strict:
+                            raise
+            finally:
+                try:
+                    n.close()
+                except Exception:
+                    pass
         return SendResult(ok=(len(failed)==0), sent=sent, failed=failed)
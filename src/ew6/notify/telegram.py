@@ -1,100 +1,332 @@
 from __future__ import annotations
 
+import http.client
 import json
 import os
+import random
+import threading
+import time
 import uuid
-from dataclasses import dataclass
-from typing import List
-from urllib.parse import urlencode
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
+import weakref
+from base64 import b64encode
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, List, Optional, Tuple
+from urllib.parse import unquote, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+try:
+    import orjson  # type: ignore
+except Exception:  # pragma: no cover
+    orjson = None  # type: ignore
+
+_API_HOST = "api.telegram.org"
 
 from ew6.notify.base import NotificationMessage, Notifier
 
-def _chunks(text: str, max_len: int = 3500) -> List[str]:
-    if len(text) <= max_len:
+def _chunks(text: str, max_len: int = 4096) -> List[str]:
+    """Split `text` into parts of at most `max_len` UTF-16 code units (how Telegram counts its
+    4096 limit), cutting after the last newline of a part when there is one.
+
+    One pass over the characters: the units up to the last newline are remembered, so a
+    cut does not re-count the text carried over into the next part."""
+    if len(text) <= max_len // 2 or len(text.encode("utf-16-le")) <= 2 * max_len:
         return [text]
-    out = []
-    i = 0
-    while i < len(text):
-        out.append(text[i:i+max_len])
-        i += max_len
+    out: List[str] = []
+    start = units = 0
+    cut = -1  # index just past the last newline inside the current part
+    cut_units = 0  # units of text[start:cut]
+    for i, ch in enumerate(text):
+        w = 2 if ch > "\uffff" else 1
+        if units + w > max_len:
+            if cut > start:  # carry text[cut:i] over into the next part
+                out.append(text[start:cut])
+                start, units = cut, units - cut_units
+            if units + w > max_len:  # no newline to cut at (or the rest is still too long)
+                out.append(text[start:i])
+                start, units = i, 0
+            cut = -1
+        units += w
+        if ch == "\n":
+            cut, cut_units = i + 1, units
+    if start < len(text):
+        out.append(text[start:])
     return out
 
-def _multipart_form(fields: dict, file_field: str, file_path: str) -> tuple[bytes, str]:
-    boundary = "----ew6-" + uuid.uuid4().hex
-    lines: List[bytes] = []
+class _MultipartBody:
+    """multipart/form-data body that streams the attachment from disk.
+
+    Iterating yields the prologue, 64 KiB file blocks and the epilogue, so peak memory does
+    not grow with the attachment; it can be iterated again (retries reopen the file).
+    """
 
-    def add_line(s: str) -> None:
-        lines.append(s.encode("utf-8"))
+    _BLOCK = 64 * 1024
 
+    def __init__(self, prologue: bytes, file_path: str, epilogue: bytes):
+        self.prologue = prologue
+        self.file_path = file_path
+        self.epilogue = epilogue
+
+    def __len__(self) -> int:
+        return len(self.prologue) + os.path.getsize(self.file_path) + len(self.epilogue)
+
+    def __iter__(self):
+        yield self.prologue
+        with open(self.file_path, "rb") as f:
+            while True:
+                block = f.read(self._BLOCK)
+                if not block:
+                    break
+                yield block
+        yield self.epilogue
+
+def _multipart_form(fields: dict, file_field: str, file_path: str) -> tuple[_MultipartBody, str]:
+    boundary = "----ew6-" + uuid.uuid4().hex
+    lines: List[str] = []
     for k, v in fields.items():
-        add_line(f"--{boundary}\r\n")
-        add_line(f'Content-Disposition: form-data; name="{k}"\r\n\r\n{v}\r\n')
+        lines.append(f"--{boundary}\r\n")
+        lines.append(f'Content-Disposition: form-data; name="{k}"\r\n\r\n{v}\r\n')
 
     filename = os.path.basename(file_path)
-    add_line(f"--{boundary}\r\n")
-    add_line(f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n')
-    add_line("Content-Type: application/octet-stream\r\n\r\n")
-    with open(file_path, "rb") as f:
-        lines.append(f.read())
-    add_line("\r\n")
-    add_line(f"--{boundary}--\r\n")
-    body = b"".join(lines)
-    return body, boundary
+    lines.append(f"--{boundary}\r\n")
+    lines.append(f'Content-Disposition: form-data; name="{file_field}"; filename="{filename}"\r\n')
+    lines.append("Content-Type: application/octet-stream\r\n\r\n")
+    prologue = "".join(lines).encode("utf-8")
+    epilogue = f"\r\n--{boundary}--\r\n".encode("utf-8")
+    return _MultipartBody(prologue, file_path, epilogue), boundary
+
+def _retry_after(headers: Any, body: str) -> Optional[float]:
+    """Seconds Telegram asks us to wait on a 429 (JSON parameters.retry_after, else Retry-After)."""
+    try:
+        ra = (json.loads(body).get("parameters") or {}).get("retry_after")
+        if ra is not None:
+            return float(ra)
+    except Exception:
+        pass
+    try:
+        return float(headers.get("Retry-After"))
+    except Exception:
+        return None
+
+class _AfterSendError(Exception):
+    """Failure after the request was fully written (wraps the original as __cause__)."""
+
+@dataclass
+class _Bucket:
+    """Adaptive token bucket: `acquire` blocks for a token; the rate is halved on a
+    429 (down to `min_rate`) and creeps back up by `step` per success (up to `max_rate`)."""
+
+    rate: float
+    capacity: float
+    min_rate: float = 0.05
+    step: float = 0.05
+    max_rate: float = field(default=0.0)
+    tokens: float = field(default=0.0)
+    last: float = field(default_factory=time.monotonic)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def __post_init__(self) -> None:
+        self.max_rate = self.max_rate or self.rate
+        self.tokens = self.capacity
+
+    def acquire(self) -> None:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            if self.tokens < 1.0:
+                time.sleep((1.0 - self.tokens) / self.rate)
+                self.last = time.monotonic()
+                self.tokens = 1.0
+            self.tokens -= 1.0
+
+    def on_throttle(self) -> None:
+        with self.lock:
+            self.rate = max(self.min_rate, self.rate * 0.5)
+            self.tokens = 0.0
+
+    def on_success(self) -> None:
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.step)
+
+# one bucket per chat, shared by every notifier sending to it
+_BUCKETS: "weakref.WeakValueDictionary[str, _Bucket]" = weakref.WeakValueDictionary()
+_BUCKETS_LOCK = threading.Lock()
+
+def _bucket_for(chat_id: str, rate: float, burst: float) -> _Bucket:
+    with _BUCKETS_LOCK:
+        b = _BUCKETS.get(chat_id)
+        if b is None:
+            b = _Bucket(rate=rate, capacity=burst)
+            _BUCKETS[chat_id] = b
+        return b
 
 @dataclass(frozen=True)
 class TelegramConfig:
     token: str
     chat_id: str
     timeout_s: float = 20.0
+    max_attempts: int = 5
+    retry_base_s: float = 0.5  # 5xx/network backoff: base * 2**attempt + jitter
+    retry_cap_s: float = 60.0  # longest single wait (429 retry_after included)
+    rate_per_s: float = 1.0  # client-side pacing per chat (Telegram allows ~1 msg/s per chat)
+    burst: float = 3.0
+
+@lru_cache(maxsize=1)
+def _env_config() -> TelegramConfig:
+    token = os.getenv("EW6_TELEGRAM_BOT_TOKEN", "").strip()
+    chat_id = os.getenv("EW6_TELEGRAM_CHAT_ID", "").strip()
+    timeout_s = float(os.getenv("EW6_TELEGRAM_TIMEOUT_S", "20").strip() or "20")
+    if not token or not chat_id:
+        raise RuntimeError("Missing EW6_TELEGRAM_BOT_TOKEN or EW6_TELEGRAM_CHAT_ID")
+    return TelegramConfig(token=token, chat_id=chat_id, timeout_s=timeout_s)
 
 class TelegramBotNotifier(Notifier):
     name = "telegram"
 
     def __init__(self, cfg: TelegramConfig):
         self.cfg = cfg
+        self._bucket = _bucket_for(cfg.chat_id, cfg.rate_per_s, cfg.burst)
+        # one keep-alive HTTPS connection for all chunks/attachments of a send (or, after an
+        # explicit open(), of every send until close())
+        self._conn: Optional[http.client.HTTPSConnection] = None
+        self._opened = False
 
     @classmethod
-    def from_env(cls) -> "TelegramBotNotifier":
-        token = os.getenv("EW6_TELEGRAM_BOT_TOKEN", "").strip()
-        chat_id = os.getenv("EW6_TELEGRAM_CHAT_ID", "").strip()
-        timeout_s = float(os.getenv("EW6_TELEGRAM_TIMEOUT_S", "20").strip() or "20")
-        if not token or not chat_id:
-            raise RuntimeError("Missing EW6_TELEGRAM_BOT_TOKEN or EW6_TELEGRAM_CHAT_ID")
-        return cls(TelegramConfig(token=token, chat_id=chat_id, timeout_s=timeout_s))
+    def from_env(cls, reload: bool = False) -> "TelegramBotNotifier":
+        """Build from EW6_TELEGRAM_* (read once per process; `reload=True` re-reads them)."""
+        if reload:
+            _env_config.cache_clear()
+        return cls(_env_config())
 
-    def _api_url(self, method: str) -> str:
-        return f"https://api.telegram.org/bot{self.cfg.token}/{method}"
+    def _api_path(self, method: str) -> str:
+        return f"/bot{self.cfg.token}/{method}"
 
-    def _post_json(self, method: str, payload: dict) -> dict:
-        data = json.dumps(payload).encode("utf-8")
-        req = Request(self._api_url(method), data=data, headers={"Content-Type": "application/json"})
-        try:
-            with urlopen(req, timeout=self.cfg.timeout_s) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
+    def _connect(self) -> http.client.HTTPSConnection:
+        if self._conn is None:
+            # the https proxy urlopen would use: *_proxy env / system settings, minus no_proxy
+            proxy = getproxies().get("https")
+            if proxy and not proxy_bypass(_API_HOST):
+                pu = urlsplit(proxy if "://" in proxy else f"http://{proxy}")
+                conn = http.client.HTTPSConnection(pu.hostname, pu.port or 8080, timeout=self.cfg.timeout_s)
+                tunnel_headers = {}
+                if pu.username is not None:
+                    cred = f"{unquote(pu.username)}:{unquote(pu.password or '')}".encode("utf-8")
+                    tunnel_headers["Proxy-Authorization"] = "Basic " + b64encode(cred).decode("ascii")
+                conn.set_tunnel(_API_HOST, headers=tunnel_headers)
+            else:
+                conn = http.client.HTTPSConnection(_API_HOST, timeout=self.cfg.timeout_s)
+            self._conn = conn
+        return self._conn
+
+    def open(self) -> None:
+        """Keep the connection across `send` calls until `close()`."""
+        self._opened = True
+        self._connect()
+
+    def close(self) -> None:
+        self._opened = False
+        self._drop()
+
+    def _drop(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _post(self, path: str, body: Any, headers: dict) -> Tuple[int, Any, bytes]:
+        """One POST on the kept-alive connection.
+
+        Errors while sending propagate as they are (a connection the server already dropped
+        is reopened once first). A reused connection that closes before any response byte
+        (`RemoteDisconnected`: a stale keep-alive socket, usually after an idle period) is
+        reopened once the same way. Other errors after the request was written (read timeout,
+        reset, a fresh connection closing) are raised as `_AfterSendError`: the message may
+        have been delivered.
+        """
+        for fresh in (self._conn is None, True):
+            conn = self._connect()
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+            except (http.client.CannotSendRequest, BrokenPipeError, ConnectionResetError):
+                self._drop()
+                if fresh:
+                    raise
+                continue
+            except Exception:
+                self._drop()
+                raise
+            try:
+                resp = conn.getresponse()
+                return resp.status, resp.headers, resp.read()
+            except http.client.RemoteDisconnected as e:
+                self._drop()
+                if fresh:
+                    raise _AfterSendError(e) from e
+            except Exception as e:
+                self._drop()
+                raise _AfterSendError(e) from e
+        raise RuntimeError("unreachable")  # pragma: no cover
+
+    def _do_request(self, path: str, body: Any, headers: dict) -> dict:
+        """POST `body` (bytes or a re-iterable body, built once and reused), retrying 429s after the server-given
+        delay and 5xx/send errors with jittered exponential backoff. sendMessage is not
+        idempotent: errors after the request was written are not retried."""
+        attempts = max(1, int(self.cfg.max_attempts))
+        for attempt in range(attempts):
+            last = attempt == attempts - 1
+            self._bucket.acquire()
+            try:
+                status, resp_headers, raw_b = self._post(path, body, headers)
+            except _AfterSendError as e:
+                raise RuntimeError(f"Telegram network error after sending (not retried): {e.__cause__!r}") from e.__cause__
+            except (OSError, http.client.HTTPException) as e:
+                if last:
+                    raise RuntimeError(f"Telegram network error: {e!r}") from e
+                wait = self.cfg.retry_base_s * 2 ** attempt + random.uniform(0, self.cfg.retry_base_s)
+                time.sleep(min(wait, self.cfg.retry_cap_s))
+                continue
+            raw = raw_b.decode("utf-8", errors="replace")
+            if 200 <= status < 300:
+                self._bucket.on_success()
                 return json.loads(raw) if raw else {}
-        except HTTPError as e:
-            body = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
-            raise RuntimeError(f"Telegram HTTP {e.code}: {body}") from e
+            if status == 429:
+                self._bucket.on_throttle()
+            if last or not (status == 429 or 500 <= status <= 599):
+                raise RuntimeError(f"Telegram HTTP {status}: {raw}")
+            wait = _retry_after(resp_headers, raw) if status == 429 else None
+            if wait is None:
+                wait = self.cfg.retry_base_s * 2 ** attempt + random.uniform(0, self.cfg.retry_base_s)
+            time.sleep(min(wait, self.cfg.retry_cap_s))
+        raise RuntimeError("Telegram request failed")  # pragma: no cover
+
+    def _post_json(self, method: str, payload: dict) -> dict:
+        # orjson hands back UTF-8 bytes directly (no intermediate str)
+        data = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
+        return self._do_request(self._api_path(method), data, {"Content-Type": "application/json"})
 
     def _post_multipart(self, method: str, fields: dict, file_field: str, file_path: str) -> dict:
         body, boundary = _multipart_form(fields, file_field, file_path)
-        req = Request(self._api_url(method), data=body, headers={"Content-Type": f"multipart/form-data; boundary={boundary}"})
-        try:
-            with urlopen(req, timeout=self.cfg.timeout_s) as resp:
-                raw = resp.read().decode("utf-8", errors="replace")
-                return json.loads(raw) if raw else {}
-        except HTTPError as e:
-            body2 = e.read().decode("utf-8", errors="replace") if hasattr(e, "read") else ""
-            raise RuntimeError(f"Telegram HTTP {e.code}: {body2}") from e
+        headers = {"Content-Type": f"multipart/form-data; boundary={boundary}", "Content-Length": str(len(body))}
+        return self._do_request(self._api_path(method), body, headers)
 
     def send(self, msg: NotificationMessage) -> None:
+        try:
+            self._send(msg)
+        finally:
+            if not self._opened:  # no explicit open(): do not leave the socket to the GC
+                self._drop()
+
+    def _send(self, msg: NotificationMessage) -> None:
         header = msg.title.strip()
         text = msg.text.strip()
-        payload_text = f"{header}\n\n{text}" if header else text
-        for part in _chunks(payload_text):
-            self._post_json("sendMessage", {"chat_id": self.cfg.chat_id, "text": part})
+        payload_text = f"{header}\n\n{text}" if header and text else header or text
+        if len(payload_text) <= 2048:
+            # common case: fits even if every char were an astral (2 UTF-16 units) one
+            if payload_text:
+                self._post_json("sendMessage", {"chat_id": self.cfg.chat_id, "text": payload_text})
+        else:
+            for part in _chunks(payload_text):
+                self._post_json("sendMessage", {"chat_id": self.cfg.chat_id, "text": part})
 
         for p in msg.attachments or []:
             self._post_multipart("sendDocument", fields={"chat_id": self.cfg.chat_id, "caption": header[:512]},
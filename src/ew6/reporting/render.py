@@ -1,12 +1,25 @@
 from __future__ import annotations
 
 import datetime
+import time
 from typing import Any, Dict, List, Optional
 
 from ew6.run.batch import JobResult
 from ew6.run.rank import RankedItem
 
 
+_NOW_CACHE: List[Any] = [None, ""]  # [epoch minute, rendered stamp]
+
+
+def _now_str() -> str:
+    """UTC "%Y-%m-%d %H:%M UTC" stamp; minute resolution, so it is formatted once per minute."""
+    minute = int(time.time() // 60)
+    if _NOW_CACHE[0] != minute:
+        ts = datetime.datetime.fromtimestamp(minute * 60, datetime.timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+        _NOW_CACHE[:] = [minute, ts]
+    return _NOW_CACHE[1]
+
+
 def _fmt_cfg(cfg: Dict[str, Any]) -> str:
     parts = []
     parts.append(f"market={cfg.get('market')} data={cfg.get('data')}")
@@ -22,9 +35,8 @@ def _fmt_cfg(cfg: Dict[str, Any]) -> str:
 
 
 def _compact_lines(results: List[JobResult], ranked: List[RankedItem], cfg: Dict[str, Any], max_jobs: int) -> List[str]:
-    ts = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
     lines: List[str] = []
-    lines.append(f"EW6 {ts}")
+    lines.append(f"EW6 {_now_str()}")
     lines.append(_fmt_cfg(cfg))
     if ranked:
         top = ", ".join([f"{r.symbol}:{r.timeframe}:{r.score:.3f}" for r in ranked[:5]])
@@ -40,11 +52,9 @@ def _compact_lines(results: List[JobResult], ranked: List[RankedItem], cfg: Dict
 
 
 def _pretty_lines(results: List[JobResult], ranked: List[RankedItem], cfg: Dict[str, Any], max_jobs: int, markdown: bool) -> List[str]:
-    ts = datetime.datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC")
-    b1 = "**" if markdown else ""
-    b0 = "**" if markdown else ""
+    b1, b0 = ("**", "**") if markdown else ("", "")
     lines: List[str] = []
-    lines.append(f"{b1}EW6 summary{b0} ({ts})")
+    lines.append(f"{b1}EW6 summary{b0} ({_now_str()})")
     lines.append(_fmt_cfg(cfg))
     lines.append("")
     if ranked:
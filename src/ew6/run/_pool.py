@@ -0,0 +1,17 @@
+"""Worker pools shared by the CLI, batch, walk-forward and tuner runners."""
+
+from __future__ import annotations
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+
+def spawn_pool(max_workers: int, **kwargs: Any) -> ProcessPoolExecutor:
+    """ProcessPoolExecutor whose workers start with spawn (kwargs go to the executor).
+
+    The compiled (Numba) kernels start a thread pool on first use, and forking a process
+    after that is not safe: the child can inherit held locks and hang. Spawned workers
+    import what they need afresh, so callers need a `__main__` guard.
+    """
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"), **kwargs)
@@ -7,20 +7,38 @@ Enhancements:
 
 from __future__ import annotations
 
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, List, Optional, Tuple
+import os
+from dataclasses import dataclass, fields
+from types import SimpleNamespace
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple
 
 from ew6.logging import get_logger
 
-from ew6.swing.zigzag import extract_swings, ZigZagConfig
-from ew6.ew.core.options import WaveOptions
-from ew6.ew.detectors.analyzer import AnalyzerConfig, scan_impulses_from_swings
-from ew6.ew.detectors.tuner import tune_wave_options
-from ew6.backtest.simple import backtest_patterns
-from ew6.run.walkforward import walk_forward_metrics
+if TYPE_CHECKING:  # the pipeline is imported in run_job: JobResult users (render, rank) skip it
+    from ew6.ew.core.options import WaveOptions
 
 log = get_logger("ew6.batch")
 
+# names this module used to import eagerly -> defining module (resolved on first access)
+_LAZY = {
+    "extract_swings": "ew6.swing.zigzag",
+    "ZigZagConfig": "ew6.swing.zigzag",
+    "WaveOptions": "ew6.ew.core.options",
+    "AnalyzerConfig": "ew6.ew.detectors.analyzer",
+    "scan_impulses_from_swings": "ew6.ew.detectors.analyzer",
+    "tune_wave_options": "ew6.ew.detectors.tuner",
+    "backtest_patterns": "ew6.backtest.simple",
+    "walk_forward_metrics": "ew6.run.walkforward",
+}
+
+
+def __getattr__(name: str) -> Any:
+    mod = _LAZY.get(name)
+    if mod is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(mod), name)
+
 
 @dataclass(frozen=True)
 class JobSpec:
@@ -35,7 +53,7 @@ class JobSpec:
     max_trades: int = 200_000
 
 
-@dataclass
+@dataclass(slots=True)
 class JobResult:
     symbol: str
     timeframe: str
@@ -69,6 +87,34 @@ class JobResult:
     wf_score: float = 0.0
 
 
+# Backtest report -> bt_* metrics: (key, report names in order of preference, default, cast).
+# Report field names differ across versions; the first name present wins.
+_BT_FIELDS: Tuple[Tuple[str, Tuple[str, ...], Any, Any], ...] = (
+    ("bt_trades", ("trades", "n_trades"), 0, int),
+    ("bt_winrate", ("winrate",), 0.0, float),
+    ("bt_mdd", ("max_drawdown", "mdd"), 0.0, float),
+    ("bt_totalret", ("total_return", "total_ret"), 0.0, float),
+    ("bt_equity", ("final_equity", "equity_end"), 0.0, float),
+    ("bt_pf", ("profit_factor", "pf"), 0.0, float),
+    ("bt_sharpe", ("sharpe_like", "sharpe"), 0.0, float),
+)
+_MISSING = object()
+
+
+def bt_fields(rep: Any) -> Dict[str, Any]:
+    """bt_* metrics (JobResult field -> value) from a backtest report (used by the CLI too)."""
+    out: Dict[str, Any] = {}
+    for key, names, default, cast in _BT_FIELDS:
+        val = default
+        for name in names:
+            v = getattr(rep, name, _MISSING)
+            if v is not _MISSING:
+                val = v
+                break
+        out[key] = cast(val or default)
+    return out
+
+
 def summarize_patterns(patterns) -> Tuple[float, float]:
     if not patterns:
         return 0.0, 0.0
@@ -91,12 +137,19 @@ def run_job(
     wf_train_bars: int | None = None,
     wf_test_bars: int | None = None,
     wf_step_bars: int | None = None,
+    tune_n_jobs: int = 1,
 ):
+    from ew6.swing.zigzag import extract_swings, ZigZagConfig
+    from ew6.ew.detectors.analyzer import AnalyzerConfig, scan_impulses_from_swings
+    from ew6.ew.detectors.tuner import tune_wave_options
+    from ew6.backtest.simple import backtest_patterns
+    from ew6.run.walkforward import walk_forward_metrics
+
     log.debug("batch run_job start", extra={"bars": len(bars) if hasattr(bars,'__len__') else None, "zigzag_pct": zigzag_pct, "auto_tune": auto_tune, "backtest": backtest, "walk_forward": walk_forward, "wf_mode": wf_mode})
     swings = extract_swings(bars, ZigZagConfig(pct=zigzag_pct))
     tuned = False
     if auto_tune:
-        tr = tune_wave_options(swings, opts)
+        tr = tune_wave_options(swings, opts, n_jobs=tune_n_jobs)
         opts2 = tr.options
         tuned = True
     else:
@@ -107,7 +160,8 @@ def run_job(
 
     bt = {}
     if backtest:
-        kw = backtest_kwargs or {}
+        # trades are not used here; only the report aggregates
+        kw = {"return_trades": False, **(backtest_kwargs or {})}
         out = backtest_patterns(patterns, bars=bars, **kw)
         if isinstance(out, (list, tuple)) and len(out) == 2:
             a, b = out
@@ -116,15 +170,7 @@ def run_job(
             trades = b if rep is a else a
         else:
             rep, trades = out, None
-        bt = {
-            "bt_trades": int(getattr(rep, "trades", getattr(rep, "n_trades", 0)) or 0),
-            "bt_winrate": float(getattr(rep, "winrate", 0.0) or 0.0),
-            "bt_mdd": float(getattr(rep, "max_drawdown", getattr(rep, "mdd", 0.0)) or 0.0),
-            "bt_totalret": float(getattr(rep, "total_return", getattr(rep, "total_ret", 0.0)) or 0.0),
-            "bt_equity": float(getattr(rep, "final_equity", getattr(rep, "equity_end", 0.0)) or 0.0),
-            "bt_pf": float(getattr(rep, "profit_factor", getattr(rep, "pf", 0.0)) or 0.0),
-            "bt_sharpe": float(getattr(rep, "sharpe_like", getattr(rep, "sharpe", 0.0)) or 0.0),
-        }
+        bt = bt_fields(rep)
         log.debug("batch backtest", extra={"trades": bt.get("bt_trades"), "ret": bt.get("bt_totalret"), "mdd": bt.get("bt_mdd"), "pf": bt.get("bt_pf")})
 
     wf = {}
@@ -155,5 +201,44 @@ def run_job(
     return swings, patterns, best_score, best_conf, tuned, bt, obs, wf
 
 
+def _run_job_star(job: Tuple[Any, Any, Dict[str, Any]]):
+    bars, conn, kwargs = job
+    return run_job(bars, conn, **kwargs)
+
+
+def run_jobs(
+    bars_list: Sequence[Any],
+    conns: Optional[Sequence[Any]] = None,
+    *,
+    workers: Optional[int] = None,
+    **kwargs: Any,
+) -> List[Tuple[Any, ...]]:
+    """`run_job` over independent bar series (e.g. symbol x timeframe), in worker processes.
+
+    kwargs are passed to every `run_job`; results come back in input order. Only each
+    connector's `last_meta` crosses the process boundary (connectors hold sockets).
+    """
+    n = len(bars_list)
+    conns = list(conns) if conns is not None else [None] * n
+    if len(conns) != n:
+        raise ValueError("conns must match bars_list in length")
+    n_workers = max(1, min(int(workers or os.cpu_count() or 1), n))
+    if n_workers == 1:
+        return [run_job(bars, conn, **kwargs) for bars, conn in zip(bars_list, conns)]
+
+    from ew6.run._pool import spawn_pool
+
+    jobs = [
+        (bars, SimpleNamespace(last_meta=getattr(conn, "last_meta", None)), kwargs)
+        for bars, conn in zip(bars_list, conns)
+    ]
+    with spawn_pool(n_workers) as ex:
+        return list(ex.map(_run_job_star, jobs))
+
+
+_JOB_FIELDS = tuple(f.name for f in fields(JobResult))
+
+
 def to_dict(results: List[JobResult]) -> List[Dict[str, Any]]:
-    return [asdict(r) for r in results]
+    # every JobResult field is a scalar, so a shallow read replaces asdict's deep copy
+    return [{k: getattr(r, k) for k in _JOB_FIELDS} for r in results]
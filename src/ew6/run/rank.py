@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from math import exp
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 
@@ -13,13 +14,15 @@ class RankedItem:
 
 
 def _get(m: Dict[str, Any], key: str, default: float = 0.0) -> float:
+    v = m.get(key)
+    if v is None:
+        return default
+    if type(v) is float:
+        return v
     try:
-        v = m.get(key, default)
-        if v is None:
-            return float(default)
         return float(v)
     except Exception:
-        return float(default)
+        return default
 
 
 def composite_score(meta: Dict[str, Any], *, oos_weight: float = 0.60) -> float:
@@ -45,12 +48,11 @@ def composite_score(meta: Dict[str, Any], *, oos_weight: float = 0.60) -> float:
     pf = max(0.0, _get(meta, "bt_pf", 0.0))
     sh = _get(meta, "bt_sharpe", 0.0)
 
-    # squashing functions (keep stable)
-    import math
-    s_ret = 1.0 - math.exp(-2.0 * ret)            # 0..1
-    s_mdd = 1.0 / (1.0 + 10.0 * mdd)              # smaller mdd better
-    s_pf = 1.0 - math.exp(-0.15 * min(pf, 40.0))  # saturate
-    s_sh  = 1.0 / (1.0 + math.exp(-1.2 * sh))     # logistic
+    # squashing functions (keep stable); exp skipped on the all-zero default path
+    s_ret = 1.0 - exp(-2.0 * ret) if ret else 0.0           # 0..1
+    s_mdd = 1.0 / (1.0 + 10.0 * mdd)                         # smaller mdd better
+    s_pf = 1.0 - exp(-0.15 * min(pf, 40.0)) if pf else 0.0  # saturate
+    s_sh = 1.0 / (1.0 + exp(-1.2 * sh)) if sh else 0.5      # logistic
 
     in_sample = float(0.35 * s_ret + 0.25 * s_mdd + 0.25 * s_pf + 0.15 * s_sh)
 
@@ -76,9 +78,64 @@ def rank_results(
     oos_weight: float = 0.60,
 ) -> List[RankedItem]:
     """Rank (symbol,timeframe,meta) tuples."""
+    results = list(results)
+    if len(results) >= _NP_MIN_ITEMS:
+        return rank_results_np(results, top=top, oos_weight=oos_weight)
     items: List[RankedItem] = []
     for sym, tf, meta in results:
         sc = composite_score(meta, oos_weight=oos_weight)
         items.append(RankedItem(symbol=sym, timeframe=tf, score=sc, meta=meta))
     items.sort(key=lambda x: x.score, reverse=True)
     return items[: max(0, int(top))]
+
+
+# below this many results the per-call NumPy overhead outweighs the vectorised squashes
+_NP_MIN_ITEMS = 64
+
+
+def _wf_value(meta: Dict[str, Any]) -> float:
+    """Clamped wf_score as `composite_score` reads it, NaN when absent."""
+    wf = meta.get("wf_score", None)
+    if wf is None:
+        return float("nan")
+    try:
+        wf_score = float(wf)
+    except Exception:
+        wf_score = 0.0
+    return max(0.0, min(1.0, wf_score))
+
+
+def rank_results_np(
+    results: Iterable[Tuple[str, str, Dict[str, Any]]],
+    *,
+    top: int = 5,
+    oos_weight: float = 0.60,
+) -> List[RankedItem]:
+    """Vectorised `rank_results`: same scores and (stable) order, squashes computed with NumPy."""
+    import numpy as np  # only the large-input path needs it; render/notify imports stay light
+
+    results = list(results)
+    n = len(results)
+    if n == 0 or int(top) <= 0:
+        return []
+    metas = [m for _, _, m in results]
+    ret = np.fromiter((max(0.0, _get(m, "bt_totalret", 0.0)) for m in metas), dtype=np.float64, count=n)
+    mdd = np.fromiter((max(0.0, _get(m, "bt_mdd", 0.0)) for m in metas), dtype=np.float64, count=n)
+    pf = np.fromiter((max(0.0, _get(m, "bt_pf", 0.0)) for m in metas), dtype=np.float64, count=n)
+    sh = np.fromiter((_get(m, "bt_sharpe", 0.0) for m in metas), dtype=np.float64, count=n)
+    wf = np.fromiter((_wf_value(m) for m in metas), dtype=np.float64, count=n)
+
+    s_ret = 1.0 - np.exp(-2.0 * ret)
+    s_mdd = 1.0 / (1.0 + 10.0 * mdd)
+    s_pf = 1.0 - np.exp(-0.15 * np.minimum(pf, 40.0))
+    s_sh = 1.0 / (1.0 + np.exp(-1.2 * sh))
+    in_sample = 0.35 * s_ret + 0.25 * s_mdd + 0.25 * s_pf + 0.15 * s_sh
+
+    ow = max(0.0, min(1.0, float(oos_weight)))
+    scores = np.where(np.isnan(wf), in_sample, (1.0 - ow) * in_sample + ow * wf)
+
+    order = np.argsort(-scores, kind="stable")[: int(top)]
+    return [
+        RankedItem(symbol=results[i][0], timeframe=results[i][1], score=float(scores[i]), meta=results[i][2])
+        for i in order.tolist()
+    ]
@@ -19,12 +19,18 @@ plus per-fold arrays: wf_fold_ret, wf_fold_start, wf_fold_end
 
 from __future__ import annotations
 
+import weakref
 from dataclasses import asdict
-from typing import Any, Dict, List, Optional, Tuple
+from math import tanh
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from ew6.swing.zigzag import extract_swings, ZigZagConfig
+import numpy as np
+
+from ew6.data.bars import BarSeries
+from ew6.swing.zigzag import extract_swings, SwingArrays, ZigZagConfig
 from ew6.ew.detectors.analyzer import AnalyzerConfig, scan_impulses_from_swings
-from ew6.backtest.simple import backtest_patterns
+from ew6.backtest.simple import _close_array, backtest_patterns
+from ew6.run._pool import spawn_pool
 from ew6.ew.core.options import WaveOptions
 
 try:
@@ -37,32 +43,80 @@ def _clamp(x: int, lo: int, hi: int) -> int:
     return max(lo, min(hi, x))
 
 
-def _slice_to_barseries(bars: Any, i0: int, i1: int) -> Any:
+def _barseries_slicer(bars: Any) -> Callable[[int, int], Any]:
     # Bars can be a list[Bar] or BarSeries (list-like). Keep same type if possible.
+    # The way to slice is picked once per series, not probed again for every fold.
     if hasattr(bars, "slice"):
-        return bars.slice(i0, i1)
+        return bars.slice
     if isinstance(bars, list):
-        return bars[i0:i1]
+        return lambda i0, i1: bars[i0:i1]
+
+    def slicer(i0: int, i1: int) -> Any:
+        try:
+            return bars[i0:i1]  # type: ignore[index]
+        except Exception:
+            return list(bars)[i0:i1]
+
+    return slicer
+
+
+# Converted arrays per bar series, so repeated calls on the same object (parameter sweeps
+# over zigzag_pct/options) convert it once. Keyed by id(); an entry is dropped when its series
+# is garbage-collected. Only `ew6.data.bars.BarSeries` is cached: its column arrays (and the
+# df wrapping them) are read-only. DataFrames, lists, etc. can be edited in place between calls, so they
+# are converted on every call.
+_BAR_CACHE: Dict[int, Tuple[Optional[SwingArrays], Any, bool]] = {}
+
+
+def _bar_arrays(bars: Any) -> Tuple[Optional[SwingArrays], Any, bool]:
+    """(SwingArrays or None, closes, closes_ok) for `bars`, cached per BarSeries."""
+    cacheable = isinstance(bars, BarSeries)
+    key = id(bars)
+    hit = _BAR_CACHE.get(key) if cacheable else None
+    if hit is not None:
+        return hit
     try:
-        return bars[i0:i1]  # type: ignore[index]
+        arrays: Optional[SwingArrays] = SwingArrays.from_bars(bars)
     except Exception:
-        return list(bars)[i0:i1]
+        arrays = None
+    try:
+        closes = _close_array(bars)
+        closes_ok = True
+    except Exception:  # bad closes: let the per-fold backtest raise as it always did
+        closes, closes_ok = None, False
+    out = (arrays, closes, closes_ok)
+    if cacheable:
+        weakref.finalize(bars, _BAR_CACHE.pop, key, None)
+        _BAR_CACHE[key] = out
+    return out
+
+
+class _FoldBars:
+    """Bars stand-in for one fold's backtest: only the closes (a view of the full series) are
+    read there, so folds do not slice/rebuild the bar container."""
+
+    __slots__ = ("close_np",)
+
+    def __init__(self, close_np: Any):
+        self.close_np = close_np
+
+    def __len__(self) -> int:
+        return len(self.close_np)
 
 
 def _run_on_slice(
     bars_slice: Any,
     *,
-    zigzag_pct: float,
-    options: WaveOptions,
+    zz_cfg: ZigZagConfig,
+    analyzer_cfg: AnalyzerConfig,
     backtest_kwargs: Dict[str, Any],
+    swings: Optional[List[Tuple[int, float]]] = None,
 ) -> float:
     # returns total return (as decimal, e.g. 0.12 for +12%)
-    swings = extract_swings(bars_slice, ZigZagConfig(pct=zigzag_pct))
-    patterns, _best_score, _best_conf = scan_impulses_from_swings(
-        swings,
-        AnalyzerConfig(options=options),
-    )
-    out = backtest_patterns(patterns, bars_slice, **backtest_kwargs)
+    if swings is None:
+        swings = extract_swings(bars_slice, zz_cfg)
+    patterns = scan_impulses_from_swings(swings, analyzer_cfg)
+    out = backtest_patterns(patterns, bars=bars_slice, **{"return_trades": False, **backtest_kwargs})
     if isinstance(out, (list, tuple)) and len(out) == 2:
         a, b = out
         rep = a if (hasattr(a, "total_return") or hasattr(a, "final_equity") or hasattr(a, "total_ret")) else b
@@ -71,16 +125,22 @@ def _run_on_slice(
     return float(getattr(rep, "total_return", getattr(rep, "total_ret", 0.0)) or 0.0)
 
 
+def _run_fold(job: Tuple[Any, Any, ZigZagConfig, AnalyzerConfig, Dict[str, Any]]) -> float:
+    # module-level so ProcessPoolExecutor can pickle it; only the fold's own views travel
+    bars_slice, swings, zz_cfg, analyzer_cfg, btkw = job
+    return _run_on_slice(bars_slice, zz_cfg=zz_cfg, analyzer_cfg=analyzer_cfg, backtest_kwargs=btkw, swings=swings)
+
+
 def _score(pos_frac: float, ret_mu: float, ret_sd: float) -> float:
     # simple, stable score in [0,1] (heuristic)
     # prefer positive consistency, higher mean return, lower volatility
     # clamp to avoid exploding due to tiny sd
     sd = max(ret_sd, 1e-9)
     sharpe_like = ret_mu / sd
-    # squash
-    import math
-    s1 = 1 / (1 + math.exp(-3.0 * (pos_frac - 0.5)))  # centered at 0.5
-    s2 = 1 / (1 + math.exp(-1.5 * sharpe_like))      # >0 better
+    # squash: logistic 1/(1+exp(-x)) written as 0.5+0.5*tanh(x/2) -- same value, no
+    # OverflowError when sd is ~0 and the mean is negative
+    s1 = 0.5 + 0.5 * tanh(1.5 * (pos_frac - 0.5))  # centered at 0.5
+    s2 = 0.5 + 0.5 * tanh(0.75 * sharpe_like)      # >0 better
     return float(0.55 * s1 + 0.45 * s2)
 
 
@@ -96,6 +156,7 @@ def walk_forward_metrics(
     train_bars: Optional[int] = None,
     test_bars: Optional[int] = None,
     step_bars: Optional[int] = None,
+    workers: int = 1,
 ) -> Dict[str, Any]:
     """Compute walk-forward metrics.
 
@@ -107,6 +168,9 @@ def walk_forward_metrics(
       - rolling: rolling train [train_end-train:test_end], test [train_end:test_end]
     train_bars/test_bars/step_bars:
       Used for expanding/rolling. If None, inferred from series length and splits.
+    workers:
+      Processes for the fold evaluations (folds are independent). Default 1 (in-process):
+      batch/CLI callers already run one process per job.
 
     Returns
     -------
@@ -136,38 +200,46 @@ def walk_forward_metrics(
         train_bars = max(int(min_bars_per_split), int(2 * test_bars))
     train_bars = int(train_bars)
 
-    fold_ret: List[float] = []
-    fold_start: List[int] = []
-    fold_end: List[int] = []
+    # convert the series once; each fold then works on array views (zigzag kernel, closes)
+    arrays, closes, closes_ok = _bar_arrays(bars)
+
+    slice_bars = _barseries_slicer(bars)
+
+    def fold_inputs(i0: int, i1: int, swings: Optional[List[Tuple[int, float]]]) -> Tuple[Any, Any]:
+        if swings is not None and closes_ok:
+            bars_slice: Any = _FoldBars(closes[i0:i1]) if closes is not None else None
+        else:
+            bars_slice = slice_bars(i0, i1)
+        return bars_slice, swings
 
     if mode == "stability":
         # contiguous segments over full range
         seg = max(int(n / splits), int(min_bars_per_split))
         # recompute splits based on seg
         splits_eff = max(2, min(20, int(n / seg)))
-        for k in range(splits_eff):
-            i0 = k * seg
-            i1 = min(n, (k + 1) * seg)
+        folds = np.empty((splits_eff, 2), dtype=np.int64)  # (start, end) rows; [:k] filled
+        k = 0
+        for j in range(splits_eff):
+            i0 = j * seg
+            i1 = min(n, (j + 1) * seg)
             if i1 - i0 < min_bars_per_split:
                 continue
-            r = _run_on_slice(_slice_to_barseries(bars, i0, i1), zigzag_pct=zigzag_pct, options=options, backtest_kwargs=btkw)
-            fold_ret.append(r)
-            fold_start.append(i0)
-            fold_end.append(i1)
+            folds[k] = i0, i1
+            k += 1
     else:
         # OOS folds
         # define initial train_end
         train_end = max(train_bars, min_bars_per_split)
+        folds = np.empty((max(0, (n - train_end - test_bars) // step + 1), 2), dtype=np.int64)
+        k = 0
         while True:
             test_start = train_end
             test_end = test_start + test_bars
             if test_end > n:
                 break
             # (We compute on test only; train is present for semantics, but EW6 has no fitting yet.)
-            r = _run_on_slice(_slice_to_barseries(bars, test_start, test_end), zigzag_pct=zigzag_pct, options=options, backtest_kwargs=btkw)
-            fold_ret.append(r)
-            fold_start.append(test_start)
-            fold_end.append(test_end)
+            folds[k] = test_start, test_end
+            k += 1
 
             train_end = train_end + step
             if mode == "rolling":
@@ -175,14 +247,30 @@ def walk_forward_metrics(
                 # train size kept by semantics; currently unused.
                 pass
 
-    if not fold_ret:
+    # folds share no state: evaluate them in worker processes when asked to
+    # configs are built once and shared by every fold
+    zz_cfg = ZigZagConfig(pct=zigzag_pct)
+    analyzer_cfg = AnalyzerConfig.from_options(options)
+    folds = folds[:k]
+    ranges = [tuple(r) for r in folds.tolist()]
+    # every fold's zigzag in one kernel call (each range still starts from a fresh state)
+    fold_swings = arrays.swings_many(ranges, zigzag_pct) if arrays is not None else [None] * len(ranges)
+    if not ranges:
         return {"wf_splits": 0, "wf_pos_frac": 0.0, "wf_ret_mu": 0.0, "wf_ret_sd": 0.0, "wf_score": 0.0, "wf_mode": mode}
 
-    mu = sum(fold_ret) / len(fold_ret)
-    # population stdev
-    import math
-    sd = math.sqrt(sum((x - mu) ** 2 for x in fold_ret) / len(fold_ret))
-    pos = sum(1 for x in fold_ret if x > 0) / len(fold_ret)
+    # lazily: in-process, each fold's inputs (a bar slice on the fallback path) are built
+    # right before its evaluation and released after it, not all held up front
+    jobs = ((*fold_inputs(i0, i1, sw), zz_cfg, analyzer_cfg, btkw) for (i0, i1), sw in zip(ranges, fold_swings))
+    n_workers = max(1, min(int(workers or 1), len(ranges)))
+    if n_workers > 1:
+        with spawn_pool(n_workers) as ex:
+            fold_ret = np.fromiter(ex.map(_run_fold, jobs), dtype=np.float64, count=len(ranges))
+    else:
+        fold_ret = np.fromiter(map(_run_fold, jobs), dtype=np.float64, count=len(ranges))
+
+    mu = float(fold_ret.mean())
+    sd = float(fold_ret.std())  # population stdev
+    pos = float(np.count_nonzero(fold_ret > 0)) / fold_ret.size
     sc = _score(pos, mu, sd)
 
     return {
@@ -192,9 +280,10 @@ def walk_forward_metrics(
         "wf_ret_mu": float(mu),
         "wf_ret_sd": float(sd),
         "wf_score": float(sc),
-        "wf_fold_ret": fold_ret,
-        "wf_fold_start": fold_start,
-        "wf_fold_end": fold_end,
+        # plain lists in the result, as before (JSON-friendly)
+        "wf_fold_ret": fold_ret.tolist(),
+        "wf_fold_start": folds[:, 0].tolist(),
+        "wf_fold_end": folds[:, 1].tolist(),
         "wf_test_bars": int(test_bars),
         "wf_train_bars": int(train_bars),
         "wf_step_bars": int(step),
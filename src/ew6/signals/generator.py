@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import List, Optional
 
+import numpy as np
+
 from ew6.ew.core.model import WavePattern
 
 
@@ -35,11 +37,50 @@ def generate_signals(patterns: List[WavePattern], cfg: SignalConfig) -> List[Sig
     if not patterns:
         return [Signal(side=Side.FLAT, confidence=0.0, reason="no_patterns")]
 
-    best = max(patterns, key=lambda p: p.score)
-    if best.score < cfg.min_score:
+    # the analyzer stores the score in meta["score"]; argmax keeps max()'s first-best tie rule
+    scores = np.fromiter((p.meta.get("score", 0.0) for p in patterns), dtype=np.float64, count=len(patterns))
+    i = int(scores.argmax())
+    best, best_score = patterns[i], float(scores[i])
+    if best_score < cfg.min_score:
         return [Signal(side=Side.FLAT, confidence=0.0, reason="low_score", pattern=best)]
 
-    # naive: compare first/last price
-    if best.points[-1].price > best.points[0].price:
-        return [Signal(side=Side.BUY, confidence=min(1.0, max(0.1, best.score)), reason="impulse_up", pattern=best)]
-    return [Signal(side=Side.SELL, confidence=min(1.0, max(0.1, best.score)), reason="impulse_down", pattern=best)]
+    # naive: compare first/last price (WavePattern exposes them from its first/last leg)
+    if best.end_px > best.start_px:
+        return [Signal(side=Side.BUY, confidence=min(1.0, max(0.1, best_score)), reason="impulse_up", pattern=best)]
+    return [Signal(side=Side.SELL, confidence=min(1.0, max(0.1, best_score)), reason="impulse_down", pattern=best)]
+
+
+def generate_signals_batch(patterns_per_fold: List[List[WavePattern]], cfg: SignalConfig) -> List[List[Signal]]:
+    """`generate_signals` for many pattern lists at once (e.g. walk-forward folds).
+
+    All scores go through one NumPy pass: per-list max via `maximum.reduceat`, the first
+    position reaching it (same tie rule as `generate_signals`), then side/confidence for
+    the chosen patterns as arrays.
+    """
+    counts = np.fromiter(map(len, patterns_per_fold), dtype=np.int64, count=len(patterns_per_fold))
+    out: List[List[Signal]] = [[Signal(side=Side.FLAT, confidence=0.0, reason="no_patterns")] for _ in counts]
+    nz = np.flatnonzero(counts)
+    if not nz.size:
+        return out
+
+    flat = [p for ps in patterns_per_fold for p in ps]
+    scores = np.fromiter((p.meta.get("score", 0.0) for p in flat), dtype=np.float64, count=len(flat))
+    starts = (np.cumsum(counts) - counts)[nz]
+    seg_max = np.repeat(np.maximum.reduceat(scores, starts), counts[nz])
+    # argmax semantics: first max, or first NaN when the list has one
+    hits = np.flatnonzero((scores == seg_max) | (np.isnan(scores) & np.isnan(seg_max)))
+    best_i = hits[np.searchsorted(hits, starts)]
+
+    best = [flat[i] for i in best_i.tolist()]
+    best_score = scores[best_i]
+    low = best_score < cfg.min_score
+    up = np.fromiter((p.end_px > p.start_px for p in best), dtype=bool, count=len(best))
+    conf = np.minimum(1.0, np.fmax(best_score, 0.1))  # min(1, max(0.1, s)), NaN -> 0.1 as there
+    for j, p, is_low, is_up, c in zip(nz.tolist(), best, low.tolist(), up.tolist(), conf.tolist()):
+        if is_low:
+            out[j] = [Signal(side=Side.FLAT, confidence=0.0, reason="low_score", pattern=p)]
+        elif is_up:
+            out[j] = [Signal(side=Side.BUY, confidence=c, reason="impulse_up", pattern=p)]
+        else:
+            out[j] = [Signal(side=Side.SELL, confidence=c, reason="impulse_down", pattern=p)]
+    return out
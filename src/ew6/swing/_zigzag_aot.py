@@ -0,0 +1,29 @@
+"""Ahead-of-time build of the zigzag kernel (optional, needs the `fast` extra).
+
+    python -m ew6.swing._zigzag_aot
+
+compiles `_zigzag_hl_loop` with `numba.pycc` into the extension module
+`ew6.swing.zigzag_aot` next to this file. `ew6.swing.zigzag` imports it when present, so
+one-off runs skip the first-call JIT compile of `zigzag_from_hl_nb`; without it they use
+the `njit(cache=True)` kernel as before. Rebuild after changing `_zigzag_hl_loop`.
+
+Both builds use numba's default (IEEE-strict) flags: `cc.export` takes no fastmath option,
+and `zigzag_from_hl_nb` must stay without `fastmath=True` too, or NaN bars would be
+handled differently depending on whether the extension was built.
+"""
+
+from __future__ import annotations
+
+import os
+
+from numba.pycc import CC  # type: ignore
+
+from ew6.swing.zigzag import _zigzag_hl_loop
+
+cc = CC("zigzag_aot")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("zigzag_hl", "Tuple((i8[:], f8[:]))(f8[:], f8[:], f8)")(_zigzag_hl_loop)
+
+
+if __name__ == "__main__":
+    cc.compile()
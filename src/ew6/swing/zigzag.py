@@ -10,19 +10,26 @@ This module provides a *stable adapter API*:
 - extract_swings(bars_or_df, cfg_or_pct)
 - zigzag_swings(bars_or_df, cfg_or_pct)  (alias)
 
-If you already have implementations `zigzag_from_hl` and `zigzag_from_close` in your version,
-keep them below; the adapter will call them if present.
+`zigzag_from_hl` / `zigzag_from_close` are implemented at the bottom of this module on top of
+one array kernel (`zigzag_from_hl_nb`, Numba-compiled when the `fast` extra is installed).
 
 The returned swings are normalized to a list of tuples: (idx:int, price:float).
 """
 
 from __future__ import annotations
 
+import inspect
 from dataclasses import dataclass
 from typing import Any, Iterable, List, Sequence, Tuple, Optional
 
+import numpy as np
 import pandas as pd
 
+try:
+    from numba import njit  # type: ignore
+except Exception:  # pragma: no cover
+    njit = None  # type: ignore
+
 
 # -------------------------
 # Stable config
@@ -36,7 +43,11 @@ class ZigZagConfig:
 # Helpers
 # -------------------------
 def _bars_to_df(bars: Any) -> pd.DataFrame:
-    """Best-effort conversion of BarSeries-like object to DataFrame with OHLCV."""
+    """Best-effort conversion of BarSeries-like object to DataFrame with OHLCV.
+
+    The attribute-walking fallback rebuilds the frame on every call: such containers (e.g. a
+    feed whose `.bars` list keeps growing) are mutable, so a memo could go stale.
+    """
     if isinstance(bars, pd.DataFrame):
         return bars
     if hasattr(bars, "df") and isinstance(getattr(bars, "df"), pd.DataFrame):
@@ -88,13 +99,21 @@ def _normalize_swings(swings: Any) -> List[Tuple[int, float]]:
         return []
     # If it's a DataFrame, try columns
     if isinstance(swings, pd.DataFrame):
+        # columns -> int64/float64 arrays in one conversion each; .tolist() yields Python scalars
         for a, b in (("idx", "price"), ("index", "price"), ("idx", "px"), ("index", "px")):
             if a in swings.columns and b in swings.columns:
-                return [(int(i), float(p)) for i, p in zip(swings[a].tolist(), swings[b].tolist())]
+                idx_arr = swings[a].to_numpy(dtype=np.int64)
+                px_arr = swings[b].to_numpy(dtype=np.float64)
+                return list(zip(idx_arr.tolist(), px_arr.tolist()))
         # fallback: use index as idx, first numeric column as price
         cols = [c for c in swings.columns if pd.api.types.is_numeric_dtype(swings[c])]
         if cols:
-            return [(int(i), float(swings.iloc[k][cols[0]])) for k, i in enumerate(swings.index)]
+            px_arr = swings[cols[0]].to_numpy(dtype=np.float64)
+            if pd.api.types.is_numeric_dtype(swings.index):
+                idx_l = swings.index.to_numpy().astype(np.int64).tolist()
+            else:  # e.g. timestamps: int() rejects them, as this branch always did
+                idx_l = [int(i) for i in swings.index]
+            return list(zip(idx_l, px_arr.tolist()))
         return []
 
     # If it's (idxs, prices)
@@ -148,40 +167,17 @@ def extract_swings(bars_or_df: Any, cfg_or_pct: Any = None) -> List[Tuple[int, f
     pct = _get_pct(cfg_or_pct) if cfg_or_pct is not None else 1.0
     df = _bars_to_df(bars_or_df)
 
-    # Prefer HL zigzag when available
-    fn_hl = globals().get("zigzag_from_hl", None)
-    if callable(fn_hl) and "high" in df.columns and "low" in df.columns:
-        hi = df["high"]
-        lo = df["low"]
-        for args in ((hi, lo, pct), (hi, lo, float(pct))):
-            try:
-                swings = fn_hl(*args)
-                norm = _normalize_swings(swings)
-                if len(norm) >= 2:
-                    return norm
-            except Exception:
-                continue
-
-    fn_c = globals().get("zigzag_from_close", None)
-    if callable(fn_c) and "close" in df.columns:
-        cl = df["close"]
-        for args in ((cl, pct), (cl, float(pct))):
-            try:
-                swings = fn_c(*args)
-                norm = _normalize_swings(swings)
-                if len(norm) >= 2:
-                    return norm
-            except Exception:
-                continue
+    # HL kernel when high/low exist, else close: columns go to float64 arrays once and the
+    # (Numba) kernel runs on them directly
+    norm = SwingArrays.from_df(df).swings(0, len(df), pct)
+    if norm is not None:
+        return norm
 
-    # last resort: look for any callable with 'zigzag' in name
-    for name, obj in list(globals().items()):
-        if not callable(obj):
-            continue
-        lname = str(name).lower()
-        if "zigzag" not in lname and "swing" not in lname:
-            continue
+    # last resort: any other zigzag/swing callable of this module (resolved once, see bottom)
+    for obj, arities in _FALLBACKS:
         for args in ((df, pct), (df,), (bars_or_df, pct), (bars_or_df,)):
+            if len(args) not in arities:
+                continue
             try:
                 swings = obj(*args)
                 norm = _normalize_swings(swings)
@@ -197,8 +193,279 @@ def zigzag_swings(bars_or_df: Any, cfg_or_pct: Any = None) -> List[Tuple[int, fl
     return extract_swings(bars_or_df, cfg_or_pct)
 
 
+@dataclass(frozen=True)
+class SwingArrays:
+    """High/low/close of one bar series as float64 arrays, converted once.
+
+    For swings over many sub-ranges of the same series (walk-forward folds): `swings(i0, i1)`
+    runs the kernel on array views instead of converting every slice to a DataFrame. A zigzag
+    depends on where it starts, so each range is still computed on its own; only the
+    conversion is shared.
+    """
+
+    high: Optional[np.ndarray]
+    low: Optional[np.ndarray]
+    close: Optional[np.ndarray]
+
+    @classmethod
+    def from_bars(cls, bars_or_df: Any) -> "SwingArrays":
+        return cls.from_df(_bars_to_df(bars_or_df))
+
+    @classmethod
+    def from_df(cls, df: pd.DataFrame) -> "SwingArrays":
+        def col(name: str) -> Optional[np.ndarray]:
+            if name not in df.columns:
+                return None
+            try:
+                return _as_f64(df[name])
+            except (TypeError, ValueError):
+                return None
+
+        return cls(col("high"), col("low"), col("close"))
+
+    def swings(self, i0: int, i1: int, cfg_or_pct: Any = None) -> Optional[List[Tuple[int, float]]]:
+        """`extract_swings(bars[i0:i1], cfg_or_pct)` (indices relative to i0), or None when
+        neither kernel finds two pivots and the caller should use `extract_swings` itself."""
+        sl = slice(i0, i1)
+        return extract_swings_arr(
+            self.high[sl] if self.high is not None else None,
+            self.low[sl] if self.low is not None else None,
+            cfg_or_pct,
+            close=self.close[sl] if self.close is not None else None,
+        )
+
+    def swings_many(
+        self, ranges: Sequence[Tuple[int, int]], cfg_or_pct: Any = None
+    ) -> List[Optional[List[Tuple[int, float]]]]:
+        """`swings(i0, i1)` for every range, with the HL kernel run over all of them in one call."""
+        if self.high is None or self.low is None or not ranges:
+            return [self.swings(i0, i1, cfg_or_pct) for i0, i1 in ranges]
+        pct = _get_pct(cfg_or_pct) if cfg_or_pct is not None else 1.0
+        starts = np.asarray([r[0] for r in ranges], dtype=np.int64)
+        ends = np.asarray([r[1] for r in ranges], dtype=np.int64)
+        idx, px, offsets = zigzag_hl_ranges_nb(self.high, self.low, float(pct), starts, ends)
+        idx_l, px_l, off = idx.tolist(), px.tolist(), offsets.tolist()
+        out: List[Optional[List[Tuple[int, float]]]] = []
+        for r, (i0, i1) in enumerate(ranges):
+            a, b = off[r], off[r + 1]
+            if b - a >= 2:
+                out.append(list(zip(idx_l[a:b], px_l[a:b])))
+            else:  # HL found < 2 pivots: close kernel, as in `swings`
+                close = self.close[i0:i1] if self.close is not None else None
+                out.append(extract_swings_arr(None, None, pct, close=close))
+        return out
+
+
+def extract_swings_arr(
+    high: Optional[np.ndarray],
+    low: Optional[np.ndarray],
+    cfg_or_pct: Any = None,
+    *,
+    close: Optional[np.ndarray] = None,
+) -> Optional[List[Tuple[int, float]]]:
+    """`extract_swings` over float64 arrays (views are fine), skipping the DataFrame adapter.
+
+    HL kernel first, close kernel second, as in `extract_swings`; None when neither finds
+    two pivots.
+    """
+    pct = _get_pct(cfg_or_pct) if cfg_or_pct is not None else 1.0
+    if high is not None and low is not None:
+        norm = zigzag_from_hl(high, low, pct)
+        if len(norm) >= 2:
+            return norm
+    if close is not None:
+        norm = zigzag_from_close(close, pct)
+        if len(norm) >= 2:
+            return norm
+    return None
+
+
 # -------------------------
-# Optional: legacy implementations (if your repo already has them, keep yours)
+# Implementations
 # -------------------------
-# def zigzag_from_close(close: pd.Series, pct: float): ...
-# def zigzag_from_hl(high: pd.Series, low: pd.Series, pct: float): ...
+def _zigzag_hl_loop(high, low, pct):
+    """Percent-reversal zigzag over high/low arrays -> (pivot idx int64[k], pivot price float64[k]).
+
+    A pivot is confirmed once price reverses by `pct` percent from the running extreme;
+    the last running extreme is emitted as the final (unconfirmed) pivot. Pivot indices
+    strictly increase and alternate low/high. Bars with a NaN high or low are skipped.
+    """
+    n = high.shape[0]
+    out_idx = np.empty(n, dtype=np.int64)
+    out_px = np.empty(n, dtype=np.float64)
+    k = 0
+    i0 = 0
+    while i0 < n and (high[i0] != high[i0] or low[i0] != low[i0]):
+        i0 += 1
+    if i0 == n:
+        return out_idx[:0], out_px[:0]
+    up = 1.0 + pct / 100.0
+    dn = 1.0 - pct / 100.0
+    trend = 0  # 0 = undecided, 1 = tracking a high, -1 = tracking a low
+    hi = high[i0]
+    hi_i = i0
+    lo = low[i0]
+    lo_i = i0
+    # Extreme tracking is written as conditional expressions (selects once compiled), so
+    # only the rarely taken pivot-commit paths branch on price data.
+    for i in range(i0 + 1, n):
+        h = high[i]
+        l = low[i]
+        if h != h or l != l:
+            continue
+        if trend == 0:
+            new_hi = h > hi
+            hi = h if new_hi else hi
+            hi_i = i if new_hi else hi_i
+            new_lo = l < lo
+            lo = l if new_lo else lo
+            lo_i = i if new_lo else lo_i
+            # both extremes on one bar: which came first is unknown, so wait until one of
+            # them moves to another bar (otherwise the first monowave has zero width)
+            if hi >= lo * up and lo_i != hi_i:
+                if lo_i < hi_i:
+                    out_idx[k] = lo_i
+                    out_px[k] = lo
+                    trend = 1
+                else:
+                    out_idx[k] = hi_i
+                    out_px[k] = hi
+                    trend = -1
+                k += 1
+        elif trend == 1:
+            new_hi = h > hi
+            hi = h if new_hi else hi
+            hi_i = i if new_hi else hi_i
+            if not new_hi and l <= hi * dn:
+                out_idx[k] = hi_i
+                out_px[k] = hi
+                k += 1
+                trend = -1
+                lo = l
+                lo_i = i
+        else:
+            new_lo = l < lo
+            lo = l if new_lo else lo
+            lo_i = i if new_lo else lo_i
+            if not new_lo and h >= lo * up:
+                out_idx[k] = lo_i
+                out_px[k] = lo
+                k += 1
+                trend = 1
+                hi = h
+                hi_i = i
+    if trend == 1:
+        out_idx[k] = hi_i
+        out_px[k] = hi
+        k += 1
+    elif trend == -1:
+        out_idx[k] = lo_i
+        out_px[k] = lo
+        k += 1
+    return out_idx[:k], out_px[:k]
+
+
+if njit is not None:
+    zigzag_from_hl_nb = njit(cache=True)(_zigzag_hl_loop)
+else:  # pragma: no cover
+    zigzag_from_hl_nb = _zigzag_hl_loop
+
+# the same kernel compiled ahead of time, when built (python -m ew6.swing._zigzag_aot): no
+# JIT compile on first call. Python-level callers only; compiled kernels keep the njit one.
+try:
+    from ew6.swing.zigzag_aot import zigzag_hl as _zigzag_hl  # type: ignore
+except Exception:
+    _zigzag_hl = zigzag_from_hl_nb
+
+
+def _zigzag_hl_ranges_loop(high, low, pct, starts, ends):
+    """`zigzag_from_hl_nb` over several [start, end) ranges of one series in one call.
+
+    Returns (pivot idx relative to its range start, pivot price, offsets): range r owns
+    entries offsets[r]:offsets[r + 1]. Each range starts from a fresh state, exactly like
+    running the kernel on that slice; the fusion only saves the per-range call overhead.
+    """
+    m = starts.shape[0]
+    total = 0
+    for r in range(m):
+        if ends[r] > starts[r]:
+            total += ends[r] - starts[r]
+    out_idx = np.empty(total, dtype=np.int64)
+    out_px = np.empty(total, dtype=np.float64)
+    offsets = np.zeros(m + 1, dtype=np.int64)
+    k = 0
+    for r in range(m):
+        idx, px = zigzag_from_hl_nb(high[starts[r]:ends[r]], low[starts[r]:ends[r]], pct)
+        for j in range(idx.shape[0]):
+            out_idx[k] = idx[j]
+            out_px[k] = px[j]
+            k += 1
+        offsets[r + 1] = k
+    return out_idx[:k], out_px[:k], offsets
+
+
+if njit is not None:
+    zigzag_hl_ranges_nb = njit(cache=True)(_zigzag_hl_ranges_loop)
+else:  # pragma: no cover
+    zigzag_hl_ranges_nb = _zigzag_hl_ranges_loop
+
+
+def _as_f64(x: Any) -> np.ndarray:
+    if isinstance(x, pd.Series):
+        x = x.to_numpy()
+    return np.ascontiguousarray(x, dtype=np.float64)
+
+
+def zigzag_from_hl(high: Any, low: Any, pct: Any = 1.0) -> List[Tuple[int, float]]:
+    """ZigZag pivots from high/low series; `pct` may be a number or a ZigZagConfig."""
+    idx, px = _zigzag_hl(_as_f64(high), _as_f64(low), _get_pct(pct))
+    return list(zip(idx.tolist(), px.tolist()))
+
+
+def zigzag_from_close(close: Any, pct: Any = 1.0) -> List[Tuple[int, float]]:
+    """ZigZag pivots from a close series (high = low = close)."""
+    c = _as_f64(close)
+    idx, px = _zigzag_hl(c, c, _get_pct(pct))
+    return list(zip(idx.tolist(), px.tolist()))
+
+
+def _default_pct_swings(bars_or_df: Any, pct: Any = 1.0) -> List[Tuple[int, float]]:
+    """What probing `extract_swings` from its own fallback amounted to: the same extraction
+    at the default 1% threshold (fails when that is the threshold already being tried)."""
+    if pct == 1.0:
+        raise ValueError("already at the default pct")
+    return extract_swings(bars_or_df)
+
+
+def _arities(obj: Any) -> frozenset:
+    """Positional-argument counts (1 and/or 2) `obj` accepts, read from its signature once;
+    both when it has none to inspect (e.g. a compiled kernel)."""
+    try:
+        sig = inspect.signature(obj)
+    except (TypeError, ValueError):
+        return frozenset((1, 2))
+    ok = set()
+    for n in (1, 2):
+        try:
+            sig.bind(*range(n))
+        except TypeError:
+            continue
+        ok.add(n)
+    return frozenset(ok)
+
+
+# Last-resort candidates for `extract_swings`: module callables named like a zigzag/swing
+# routine, collected once (with the call shapes each accepts) instead of scanning globals()
+# and raising TypeError on every call. The adapter entry points used to be probed too,
+# re-entering `extract_swings` until the recursion limit; the one useful outcome of that
+# (a retry at the default pct) is kept explicitly in their place.
+_FALLBACKS: Tuple[Tuple[Any, frozenset], ...] = tuple(
+    (f, _arities(f))
+    for f in (
+        _default_pct_swings if name == "extract_swings" else obj
+        for name, obj in list(globals().items())
+        if callable(obj)
+        and ("zigzag" in name.lower() or "swing" in name.lower())
+        and name not in ("zigzag_swings", "_default_pct_swings", "_zigzag_hl")
+    )
+)
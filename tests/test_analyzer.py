@@ -0,0 +1,255 @@
+from types import SimpleNamespace
+
+import numpy as np
+
+from ew6.ew.core.model import WaveLeg, WavePattern
+from ew6.ew.core.monowave import MonoWave, MonoWaveConfig, build_monowaves_from_swings
+from ew6.ew.core.pruner import BeamConfig, beam_search, beam_search_grid, nms_by_span, overlap_ratio
+from ew6.ew.core.rules_p5 import is_valid_impulse_batch, is_valid_impulse_from_monowaves
+from ew6.ew.core.scorer import (
+    ScoreConfig,
+    _params,
+    _score_impulse_loop,
+    _score_rows_np,
+    confidence_from_score,
+    score_impulse,
+    score_impulse_batch,
+)
+from ew6.ew.detectors.analyzer import AnalyzerConfig, _mw_to_leg, scan_impulses_from_swings
+
+
+def _random_windows(seed, n=4000):
+    # mostly alternating chains on an integer grid, so flat legs, equal moves and equal
+    # levels are common; some legs are detached from the previous end or flip direction
+    rng = np.random.default_rng(seed)
+    sign = np.where(rng.random((n, 1)) < 0.5, 1, -1) * np.array([1, -1, 1, -1, 1])
+    sign = np.where(rng.random((n, 5)) < 0.1, -sign, sign)
+    steps = sign * rng.integers(0, 5, size=(n, 5))
+    ep = (10 + np.cumsum(steps, axis=1)).astype(np.float64)
+    sp = np.concatenate([np.full((n, 1), 10.0), ep[:, :-1]], axis=1)
+    detached = rng.random((n, 5)) < 0.1
+    sp[detached] += rng.integers(-2, 3, size=detached.sum())
+    return sp, ep
+
+
+def _monowaves(sp, ep):
+    return [MonoWave(start_idx=k, end_idx=k + 1, start_px=s, end_px=e) for k, (s, e) in enumerate(zip(sp, ep))]
+
+
+def _random_swings(seed, n=80):
+    rng = np.random.default_rng(seed)
+    idx = np.cumsum(rng.integers(1, 12, n))
+    px = np.round(100.0 + np.cumsum(rng.normal(0.0, 2.0, n)), 1)
+    return list(zip(idx.tolist(), px.tolist()))
+
+
+def _reference_scan(swings, cfg):
+    """The scalar analyzer: tuple beam, per-window rule check and score_impulse."""
+    mws = build_monowaves_from_swings(swings, MonoWaveConfig(skip=cfg.monowave_skip, min_abs_move=cfg.min_leg_abs_move))
+    n = len(mws)
+    if n < 5:
+        return []
+    layers = [list(range(0, n - 4))] + [list(range(1, cfg.max_gap + 2))] * 4
+
+    def window(tup):
+        return [mws[i] for i in np.cumsum(tup).tolist()]
+
+    def pattern(win, meta):
+        return WavePattern(kind="impulse_1_5", legs=[_mw_to_leg(x) for x in win], meta=dict(meta))
+
+    def score_prefix(tup):
+        idxs = np.cumsum(tup).tolist()
+        if idxs[-1] >= n:
+            return -1e9
+        if len(idxs) == 5:
+            ok, meta = is_valid_impulse_from_monowaves(window(tup), return_meta=True)
+            if not ok:
+                return -1e6
+            return score_impulse(pattern(window(tup), meta)) - 0.05 * sum(d - 1 for d in tup[1:])
+        dirs = [mws[i].direction for i in idxs]
+        if len(idxs) >= 2:
+            if 0 in dirs:
+                return -1e9
+            if any(d != (dirs[0] if k % 2 == 0 else -dirs[0]) for k, d in enumerate(dirs)):
+                return -1e3
+        return 0.0
+
+    bcfg = BeamConfig(beam_width=cfg.beam_width, max_candidates=cfg.max_candidates, max_patterns=cfg.max_patterns)
+    patterns = []
+    for tup, _ in beam_search(layers, score_prefix, bcfg):
+        if len(tup) != 5 or sum(tup) >= n:
+            continue
+        ok, meta = is_valid_impulse_from_monowaves(window(tup), return_meta=True)
+        if ok:
+            p = pattern(window(tup), meta)
+            p.meta["score"] = score_impulse(p, ScoreConfig())
+            p.meta["confidence"] = confidence_from_score(p.meta["score"])
+            patterns.append(p)
+    return nms_by_span(
+        patterns,
+        span_fn=lambda p: (p.start_idx, p.end_idx),
+        score_fn=lambda p: p.meta["score"],
+        overlap_thresh=cfg.nms_overlap,
+        max_keep=cfg.max_patterns,
+    )
+
+
+def _assert_same_patterns(got, want):
+    assert len(got) == len(want)
+    for g, w in zip(got, want):
+        assert g.legs == w.legs
+        assert g.meta["w4_overlap"] == w.meta["w4_overlap"]
+        assert np.isclose(g.meta["score"], w.meta["score"], rtol=0.0, atol=1e-12)
+        assert np.isclose(g.meta["confidence"], w.meta["confidence"], rtol=0.0, atol=1e-12)
+
+
+def _reference_rules(mws):
+    """Direction-list form of the impulse rules: (valid, w4_overlap)."""
+    d = [1 if m.end_px > m.start_px else (-1 if m.end_px < m.start_px else 0) for m in mws]
+    s = d[0]
+    if s == 0 or d != [s, -s, s, -s, s]:
+        return False, None
+    p0, p1, p2, p4 = mws[0].start_px, mws[0].end_px, mws[1].end_px, mws[3].end_px
+    if (p2 <= p0) if s == 1 else (p2 >= p0):
+        return False, None
+    w1, w3, w5 = (abs(mws[k].end_px - mws[k].start_px) for k in (0, 2, 4))
+    if w3 <= min(w1, w5):
+        return False, None
+    return True, (p4 < p1) if s == 1 else (p4 > p1)
+
+
+def test_scalar_rules_match_reference():
+    for seed in range(5):
+        sp, ep = _random_windows(seed)
+        for k in range(sp.shape[0]):
+            for win in (
+                _monowaves(sp[k], ep[k]),
+                [SimpleNamespace(start_px=s, end_px=e) for s, e in zip(sp[k], ep[k])],
+            ):
+                ok, w4 = _reference_rules(win)
+                assert is_valid_impulse_from_monowaves(win) == ok
+                assert is_valid_impulse_from_monowaves(win, return_meta=True) == (ok, {"w4_overlap": w4} if ok else {})
+    assert is_valid_impulse_from_monowaves(_monowaves(sp[0, :4], ep[0, :4])) is False
+
+
+def test_impulse_batch_matches_scalar_rules():
+    for seed in range(5):
+        sp, ep = _random_windows(seed)
+        valid, w4 = is_valid_impulse_batch(sp, ep)
+        for k in range(sp.shape[0]):
+            ok, meta = is_valid_impulse_from_monowaves(_monowaves(sp[k], ep[k]), return_meta=True)
+            assert valid[k] == ok
+            if ok:
+                assert w4[k] == meta["w4_overlap"]
+
+
+def test_scan_matches_scalar_reference():
+    configs = [
+        AnalyzerConfig(),
+        AnalyzerConfig(monowave_skip=0, max_gap=0, beam_width=16, max_patterns=10),
+        AnalyzerConfig(monowave_skip=0, max_gap=2, beam_width=64, max_candidates=800, nms_overlap=0.3),
+        AnalyzerConfig(monowave_skip=0, min_leg_abs_move=1.5, beam_width=8, max_patterns=5),
+    ]
+    found = 0
+    for seed in range(10):
+        swings = _random_swings(seed)
+        for cfg in configs:
+            got = scan_impulses_from_swings(swings, cfg)
+            _assert_same_patterns(got, _reference_scan(swings, cfg))
+            found += len(got)
+    assert found > 0
+
+
+def _reference_nms(items, overlap_thresh, max_keep):
+    kept = []
+    for it in sorted(items, key=lambda it: it[2], reverse=True):
+        if any(overlap_ratio(it[:2], k[:2]) >= overlap_thresh for k in kept):
+            continue
+        kept.append(it)
+        if len(kept) >= max_keep:
+            break
+    return kept
+
+
+def test_nms_window_matches_full_scan():
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        n = int(rng.integers(1, 120))
+        a0 = rng.integers(0, 200, n)
+        # zero-width and reversed spans included; scores on a grid so ties occur
+        a1 = a0 + rng.integers(-2, 60, n)
+        sc = rng.integers(0, 20, n).astype(float)
+        items = list(zip(a0.tolist(), a1.tolist(), sc.tolist()))
+        for thresh in (-0.1, 0.0, 0.05, 0.3, 0.7, 1.0):
+            for max_keep in (1, 5, 50):
+                got = nms_by_span(items, lambda it: it[:2], lambda it: it[2], thresh, max_keep)
+                assert got == _reference_nms(items, thresh, max_keep)
+
+
+def _random_moves(seed, n=5000):
+    rng = np.random.default_rng(seed)
+    # grid moves (zeros, equal legs, exact Fibonacci edges) mixed with continuous ones
+    moves = np.where(rng.random((n, 5)) < 0.5, rng.integers(0, 6, (n, 5)) * 0.5, rng.exponential(2.0, (n, 5)))
+    return moves, rng.random(n) < 0.5, rng.integers(-10, 600, n).astype(np.float64)
+
+
+def test_batch_scorer_matches_scalar_kernel():
+    cfgs = [ScoreConfig(), ScoreConfig(fib_w2=(0.0, 0.5), fib_w3=(1.0, 0.0), overlap_penalty=0.0)]
+    for seed in range(3):
+        moves, ov, span = _random_moves(seed)
+        for cfg in cfgs:
+            params = np.asarray(_params(cfg), dtype=np.float64)
+            want = np.array([_score_impulse_loop(*m, o, sp, *params) for m, o, sp in zip(moves.tolist(), ov.tolist(), span.tolist())])
+            # np.exp and math.exp may disagree in the last ulp
+            np.testing.assert_allclose(_score_rows_np(moves, ov, span, params), want, rtol=0.0, atol=1e-12)
+            np.testing.assert_allclose(score_impulse_batch(moves, ov, span, cfg), want, rtol=0.0, atol=1e-12)
+
+
+def test_batch_scorer_matches_score_impulse():
+    moves, ov, span = _random_moves(0, n=500)
+    got = score_impulse_batch(moves, ov, span)
+    for k in range(moves.shape[0]):
+        ends = [0, 0, 0, 0, int(span[k])]
+        legs = [WaveLeg(start_idx=0, end_idx=e, start_px=0.0, end_px=m) for e, m in zip(ends, moves[k].tolist())]
+        p = WavePattern(kind="impulse_1_5", legs=legs, meta={"w4_overlap": bool(ov[k])})
+        assert abs(got[k] - score_impulse(p)) <= 1e-12
+
+
+def _random_layers(rng):
+    return [rng.integers(0, 30, int(rng.integers(0 if li else 1, 12))) for li in range(int(rng.integers(1, 6)))]
+
+
+def _tie_scores(cands):
+    # few distinct values, so top-k cuts fall inside runs of equal scores
+    w = np.array([3, 5, 7, 11, 13][: cands.shape[1]])
+    return ((cands * w).sum(axis=1) % 7).astype(np.float64)
+
+
+def test_beam_grid_matches_tuple_beam():
+    rng = np.random.default_rng(0)
+    for _ in range(400):
+        layers = _random_layers(rng)
+        cfg = BeamConfig(beam_width=int(rng.integers(1, 20)), max_candidates=int(rng.integers(1, 400)), max_patterns=int(rng.integers(1, 25)))
+        rows, scores = beam_search_grid(layers, _tie_scores, cfg)
+        want = beam_search(
+            [layer.tolist() for layer in layers],
+            None,
+            cfg,
+            score_batch_fn=lambda c: _tie_scores(np.array(c, dtype=np.int64)) if c else np.empty(0),
+        )
+        assert [tuple(r) for r in rows.tolist()] == [t for t, _ in want]
+        assert scores.tolist() == [sc for _, sc in want]
+
+
+def test_final_layer_cutoff_keeps_top_rows():
+    # selecting only max_patterns rows on the last layer equals a full-width
+    # selection truncated afterwards
+    rng = np.random.default_rng(1)
+    for _ in range(400):
+        layers = _random_layers(rng)
+        bw, mp = int(rng.integers(1, 20)), int(rng.integers(1, 25))
+        cfg = BeamConfig(beam_width=bw, max_candidates=int(rng.integers(1, 400)), max_patterns=mp)
+        full = BeamConfig(beam_width=bw, max_candidates=cfg.max_candidates, max_patterns=max(bw, mp))
+        rows, scores = beam_search_grid(layers, _tie_scores, cfg)
+        full_rows, full_scores = beam_search_grid(layers, _tie_scores, full)
+        assert np.array_equal(rows, full_rows[:mp]) and np.array_equal(scores, full_scores[:mp])
@@ -0,0 +1,72 @@
+import math
+
+import numpy as np
+import pytest
+
+from ew6.backtest._nb import HAVE_NUMBA, _simulate_trades_np, simulate_trades
+from ew6.backtest.simple import backtest_patterns, backtest_patterns_grid
+from ew6.ew.core.model import WaveLeg, WavePattern
+
+
+def _pattern(prices, conf=1.0):
+    legs = [WaveLeg(i, i + 1, prices[i], prices[i + 1]) for i in range(len(prices) - 1)]
+    return WavePattern(kind="impulse_1_5", legs=legs, meta={"confidence": conf})
+
+
+def test_backtest_compounds_and_filters():
+    pats = [
+        _pattern([100, 110, 105, 120, 115, 130]),  # long, +30%
+        _pattern([100, 90, 95, 80, 85, 70], conf=0.1),  # filtered by confidence
+        _pattern([100, 90, 95, 80, 85, 110]),  # short, -10%
+        _pattern([100, 110, 105, 120]),  # < 5 legs
+    ]
+    trades, rep = backtest_patterns(pats, initial_cash=1000.0, min_confidence=0.5, fee_bps=10.0)
+    assert rep.trades == 2
+    assert trades.pattern_idx.tolist() == [0, 2]
+    assert [t.direction for t in trades] == [1, -1]
+    cost = 2 * 10.0 / 10_000.0
+    r0, r1 = 0.30 - cost, -0.10 - cost
+    assert math.isclose(rep.final_equity, 1000.0 * (1 + r0) * (1 + r1))
+    assert rep.wins == 1
+    assert math.isclose(rep.profit_factor, r0 / -r1)
+    assert math.isclose(rep.max_drawdown, -r1)
+    assert len(rep.equity_curve) == 3
+
+
+def test_backtest_grid_matches_single_runs():
+    pats = [
+        _pattern([100, 110, 105, 120, 115, 130]),
+        _pattern([100, 90, 95, 80, 85, 110]),
+        _pattern([100, 104, 102, 108, 106, 111]),
+    ]
+    df = backtest_patterns_grid(pats, fee_grid=[0.0, 5.0], slip_grid=[1.0], risk_grid=[0.5, 1.0])
+    assert len(df) == 4
+    for row in df.itertuples(index=False):
+        _, rep = backtest_patterns(
+            pats, fee_bps=row.fee_bps, slippage_bps=row.slippage_bps, risk_fraction=row.risk_fraction
+        )
+        assert math.isclose(row.final_equity, rep.final_equity)
+        assert math.isclose(row.max_drawdown, rep.max_drawdown)
+        assert row.wins == rep.wins
+
+
+@pytest.mark.skipif(not HAVE_NUMBA, reason="compiled kernel needs numba")
+@pytest.mark.parametrize("bad_frac", [0.0, 0.02])
+def test_simulate_trades_matches_numpy_path(bad_frac):
+    for seed in range(50):
+        rng = np.random.default_rng(seed)
+        n = int(rng.integers(0, 200))
+        entry = 100.0 + rng.normal(0.0, 5.0, n)
+        exitp = entry * (1.0 + rng.normal(0.0, 0.05, n))
+        # NaN and inf prices (NaN / inf returns) must behave like the fallback
+        entry[rng.random(n) < bad_frac] = np.nan
+        exitp[rng.random(n) < bad_frac] = np.inf
+        direction = np.where(rng.random(n) < 0.5, 1.0, -1.0)
+        got = simulate_trades(entry, exitp, direction, 0.002, 0.5, 1000.0)
+        with np.errstate(invalid="ignore"):
+            want = _simulate_trades_np(entry, exitp, direction, 0.002, 0.5, 1000.0)
+        assert np.allclose(got[0], want[0], rtol=1e-12, equal_nan=True)
+        assert np.array_equal(got[1], want[1], equal_nan=True)
+        assert got[2] == want[2]
+        assert np.allclose(got[3:5], want[3:5], rtol=1e-12, equal_nan=True)
+        assert np.isclose(got[5], want[5], rtol=1e-12, equal_nan=True)
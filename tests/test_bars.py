@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from ew6.data.bars import Bar, BarSeries
+
+
+def _series(n=5):
+    close = np.arange(1.0, n + 1.0)
+    return BarSeries.from_arrays(np.arange(n, dtype=np.int64) * 60_000, close, close, close, close)
+
+
+@pytest.mark.parametrize(
+    "bs",
+    [_series(), BarSeries.from_bars([Bar(ts=i, open=1.0, high=2.0, low=0.5, close=1.5) for i in range(5)])],
+)
+def test_barseries_columns_are_read_only(bs):
+    before = bs.close_np.copy()
+    for name in ("ts", "open", "high", "low", "close", "volume"):
+        assert not getattr(bs, name).flags.writeable
+    with pytest.raises(ValueError):
+        bs.df.loc[bs.df.index[0], "close"] = 999.0
+    with pytest.raises(ValueError):
+        bs.close[0] = 999.0
+    assert np.array_equal(bs.close_np, before)
+    assert np.array_equal(bs.df["close"].to_numpy(), before)
+
+    df = bs.to_df()
+    df.loc[df.index[0], "close"] = 999.0
+    assert np.array_equal(bs.close_np, before)
+
+
+def test_from_arrays_leaves_caller_arrays_writable():
+    close = np.arange(1.0, 6.0)
+    BarSeries.from_arrays(np.arange(5, dtype=np.int64), close, close, close, close)
+    assert close.flags.writeable
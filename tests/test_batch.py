@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+# In a fresh interpreter: the hang being guarded against (a forked pool after the compiled
+# kernels' thread pool started in-process) shows as a process that never exits.
+_SCRIPT = textwrap.dedent(
+    """
+    import numpy as np
+    from ew6.data.bars import BarSeries
+    from ew6.ew.core.options import WaveOptions
+    from ew6.run.batch import run_jobs
+
+    def bars(seed, n=1200):
+        rng = np.random.default_rng(seed)
+        close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+        ts = np.arange(n, dtype=np.int64) * 3_600_000
+        return BarSeries.from_arrays(ts, close, close * 1.004, close * 0.996, close)
+
+    if __name__ == "__main__":
+        kw = dict(zigzag_pct=1.0, opts=WaveOptions(), backtest=True)
+        serial = run_jobs([bars(1)], workers=1, **kw)
+        pooled = run_jobs([bars(1), bars(2)], workers=2, **kw)
+        assert len(serial) == 1 and len(pooled) == 2
+        assert pooled[0][2] == serial[0][2]  # best_score: same series, same result
+        print("ok")
+    """
+)
+
+
+def test_run_jobs_pool_after_in_process_run(tmp_path):
+    script = tmp_path / "run_jobs_twice.py"
+    script.write_text(_SCRIPT)
+    env = dict(os.environ)
+    src = str(Path(__file__).resolve().parents[1] / "src")
+    env["PYTHONPATH"] = os.pathsep.join(p for p in (src, env.get("PYTHONPATH")) if p)
+    proc = subprocess.run([sys.executable, str(script)], env=env, capture_output=True, text=True, timeout=120)
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "ok"
@@ -0,0 +1,98 @@
+import json
+import pickle
+import threading
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from ew6.exchange.binance.connector import BinanceConfig, BinanceConnector, _read_cached, _write_cached
+from ew6.exchange.types import Instrument
+
+N_TRADES = 3000
+LIMIT = 100
+SPACING_MS = 100_000  # > the 60 s step-back after a sequential error, so that skips no trade
+
+
+class _FakeTape(BinanceConnector):
+    """aggTrades endpoint over ids 0..N-1 (T = id * SPACING_MS): the newest `limit` trades
+    with T <= endTime, ascending. Every `every`-th speculative (pool-thread) call gets `fault`."""
+
+    def __init__(self, cfg, fault=None, every=3):
+        super().__init__(cfg)
+        self.fault = fault
+        self.every = every
+        self.lock = threading.Lock()
+        self.spec_calls = 0
+
+    def _page(self, end_ms, limit):
+        hi = min(N_TRADES - 1, end_ms // SPACING_MS)
+        ids = range(max(0, hi - limit + 1), hi + 1)
+        return [{"a": i, "T": i * SPACING_MS, "p": "1.5", "q": "2", "m": False} for i in ids]
+
+    def _get_json(self, base, path, params):
+        end_ms, limit = int(params["endTime"]), int(params["limit"])
+        if threading.current_thread() is not threading.main_thread():
+            with self.lock:
+                self.spec_calls += 1
+                faulty = self.fault is not None and self.spec_calls % self.every == 0
+            if faulty:
+                if self.fault == "error":
+                    raise RuntimeError("Binance HTTP 500")
+                if self.fault == "empty":
+                    return []
+                if self.fault == "gap":
+                    return self._page(end_ms - 5 * limit * SPACING_MS, limit)
+        return self._page(end_ms, limit)
+
+
+def _fetch(conn, start_id=500):
+    req = SimpleNamespace(
+        instrument=Instrument(symbol="BTCUSDT", venue="binance"),
+        limit=LIMIT,
+        max_records=200_000,
+        start_ms=start_id * SPACING_MS,
+        end_ms=(N_TRADES - 1) * SPACING_MS,
+    )
+    return conn.fetch_trades(req)
+
+
+def _assert_contiguous(out, start_id=500):
+    a = out["a"]
+    assert np.unique(a).shape[0] == a.shape[0]
+    assert (np.diff(a) == 1).all()
+    assert a[0] <= start_id and a[-1] == N_TRADES - 1
+    assert (np.diff(out["T"]) > 0).all()
+
+
+def test_fetch_trades_serial_by_default():
+    cfg = BinanceConfig(use_cache=False, retry_sleep_s=0.0)
+    assert cfg.trade_workers == 1
+    conn = _FakeTape(cfg, fault="error", every=1)
+    out = _fetch(conn)
+    _assert_contiguous(out)
+    assert conn.spec_calls == 0
+    assert conn.last_meta.cap_reason == "start_reached"
+
+
+@pytest.mark.parametrize("fault", [None, "gap", "empty", "error"])
+def test_fetch_trades_speculative_pages_merge_contiguously(fault):
+    conn = _FakeTape(BinanceConfig(use_cache=False, retry_sleep_s=0.0, trade_workers=4), fault=fault)
+    out = _fetch(conn)
+    _assert_contiguous(out)
+    assert conn.spec_calls > 0
+    assert conn.last_meta.records == out["a"].shape[0]
+
+
+def test_response_cache_is_json(tmp_path):
+    url = "https://api.binance.com/api/v3/klines?symbol=BTCUSDT"
+    data = [[1, "1.5", "2.0"], {"a": 3, "p": "1.5", "m": False}]
+    _write_cached(str(tmp_path), url, data)
+    (entry,) = tmp_path.iterdir()
+    assert json.loads(entry.read_text()) == data
+    assert _read_cached(str(tmp_path), url, 0) == data
+
+    # a pickle dropped into the cache dir is never loaded
+    entry.unlink()
+    (tmp_path / entry.with_suffix(".pkl").name).write_bytes(pickle.dumps(data))
+    assert _read_cached(str(tmp_path), url, 0) is None
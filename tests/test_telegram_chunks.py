@@ -0,0 +1,44 @@
+import random
+
+from ew6.notify.telegram import _chunks
+
+
+def _units(s):
+    return len(s.encode("utf-16-le")) // 2
+
+
+def test_chunks_short_text_is_one_part():
+    assert _chunks("hello\nworld") == ["hello\nworld"]
+    assert _chunks("") == [""]
+
+
+def test_chunks_cut_after_last_newline():
+    text = "aaaa\nbbb\ncccccc"
+    assert _chunks(text, max_len=10) == ["aaaa\nbbb\n", "cccccc"]
+
+
+def test_chunks_without_newline_cut_at_limit():
+    assert _chunks("x" * 25, max_len=10) == ["x" * 10, "x" * 10, "x" * 5]
+
+
+def test_chunks_count_astral_chars_as_two_units():
+    # 3 emoji = 6 UTF-16 units: a 5-unit part holds only two of them, never half of one
+    parts = _chunks("\U0001F600" * 3, max_len=5)
+    assert parts == ["\U0001F600" * 2, "\U0001F600"]
+    # 4096 emoji are 4096 code points but 8192 units: two parts, not one
+    parts = _chunks("\U0001F600" * 4096)
+    assert [len(p) for p in parts] == [2048, 2048]
+
+
+def test_chunks_roundtrip_and_unit_limit():
+    rng = random.Random(0)
+    alphabet = ["a", "b", "\n", "\U0001F600", "é", "\n\n"]
+    for _ in range(500):
+        max_len = rng.choice([3, 5, 8, 16, 64])
+        text = "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 400)))
+        parts = _chunks(text, max_len=max_len)
+        assert "".join(parts) == text
+        assert all(_units(p) <= max_len for p in parts)
+        # every part but the last is cut after its last newline when it has one
+        for p in parts[:-1]:
+            assert "\n" not in p or p.endswith("\n")
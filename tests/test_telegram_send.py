@@ -0,0 +1,76 @@
+import http.client
+
+import pytest
+
+import ew6.notify.telegram as tg
+from ew6.notify.base import NotificationMessage
+
+
+class _Resp:
+    status = 200
+    headers = {}
+
+    def read(self):
+        return b'{"ok": true}'
+
+
+class _Conn:
+    """HTTPSConnection stand-in: getresponse() pops the next outcome of the shared script
+    (an exception instance is raised, anything else returns a 200 response)."""
+
+    script = []
+    made = []
+
+    def __init__(self, *args, **kwargs):
+        self.requests = 0
+        _Conn.made.append(self)
+
+    def request(self, method, path, body=None, headers=None):
+        self.requests += 1
+
+    def getresponse(self):
+        out = _Conn.script.pop(0)
+        if isinstance(out, Exception):
+            raise out
+        return _Resp()
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def notifier(monkeypatch):
+    monkeypatch.setattr(http.client, "HTTPSConnection", _Conn)
+    monkeypatch.setattr(tg, "getproxies", lambda: {})
+    monkeypatch.setattr(_Conn, "script", [])
+    monkeypatch.setattr(_Conn, "made", [])
+    return tg.TelegramBotNotifier(tg.TelegramConfig(token="t", chat_id="c", retry_base_s=0.0, rate_per_s=1e6, burst=1e6))
+
+
+def _msg():
+    return NotificationMessage(title="t", text="hello")
+
+
+def test_stale_keep_alive_connection_is_redialled(notifier):
+    notifier.open()
+    _Conn.script[:] = ["ok", http.client.RemoteDisconnected("closed"), "ok"]
+    notifier.send(_msg())
+    notifier.send(_msg())  # the kept connection went stale while idle
+    assert [c.requests for c in _Conn.made] == [2, 1]
+    assert not _Conn.script
+
+
+def test_fresh_connection_disconnect_is_not_retried(notifier):
+    _Conn.script[:] = [http.client.RemoteDisconnected("closed"), "ok"]
+    with pytest.raises(RuntimeError, match="after sending"):
+        notifier.send(_msg())
+    assert [c.requests for c in _Conn.made] == [1]
+
+
+def test_other_errors_after_send_are_not_retried(notifier):
+    notifier.open()
+    _Conn.script[:] = ["ok", TimeoutError("read"), "ok"]
+    notifier.send(_msg())
+    with pytest.raises(RuntimeError, match="after sending"):
+        notifier.send(_msg())
+    assert [c.requests for c in _Conn.made] == [2]
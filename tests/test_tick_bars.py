@@ -0,0 +1,21 @@
+import numpy as np
+import pytest
+
+from ew6.data._agg_numba import _tick_bars_np, tick_bars
+
+
+@pytest.mark.parametrize("nan_frac", [0.0, 0.01])
+def test_tick_bars_matches_numpy_path(nan_frac):
+    for seed in range(50):
+        rng = np.random.default_rng(seed)
+        m = int(rng.integers(1, 3000))
+        ts = np.cumsum(rng.integers(1, 100, m)).astype(np.int64)
+        px = 100.0 + rng.normal(0.0, 1.0, m)
+        px[rng.random(m) < nan_frac] = np.nan
+        qty = rng.exponential(1.0, m)
+        n = int(rng.integers(1, 300))
+        bar_ts, ohlcv = tick_bars(ts, px, qty, n)
+        np_ts, np_ohlcv = _tick_bars_np(ts, px, qty, n)
+        assert np.array_equal(bar_ts, np_ts)
+        assert np.array_equal(ohlcv[:, :4], np_ohlcv[:, :4], equal_nan=True)
+        assert np.allclose(ohlcv[:, 4], np_ohlcv[:, 4], rtol=1e-12, atol=0.0)
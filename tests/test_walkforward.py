@@ -0,0 +1,47 @@
+import math
+
+import numpy as np
+import pytest
+
+from ew6.data.bars import BarSeries
+from ew6.ew.core.options import WaveOptions
+from ew6.run.walkforward import walk_forward_metrics
+
+_WF_KEYS = {"wf_mode", "wf_splits", "wf_pos_frac", "wf_ret_mu", "wf_ret_sd", "wf_score", "wf_fold_ret", "wf_fold_start", "wf_fold_end"}
+
+
+def _bars(n=1200, seed=7):
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+    ts = np.arange(n, dtype=np.int64) * 3_600_000
+    return BarSeries.from_arrays(ts, close, close * 1.004, close * 0.996, close)
+
+
+@pytest.mark.parametrize(
+    "mode, kwargs, starts, ends",
+    [
+        ("stability", {}, [0, 400, 800], [400, 800, 1200]),
+        ("expanding", {"train_bars": 400, "test_bars": 200}, [400, 600, 800, 1000], [600, 800, 1000, 1200]),
+        ("rolling", {"train_bars": 400, "test_bars": 200, "step_bars": 200}, [400, 600, 800, 1000], [600, 800, 1000, 1200]),
+    ],
+)
+def test_walk_forward_modes(mode, kwargs, starts, ends):
+    wf = walk_forward_metrics(
+        _bars(), zigzag_pct=1.0, options=WaveOptions(), splits=3, min_bars_per_split=200, mode=mode, **kwargs
+    )
+    assert _WF_KEYS <= wf.keys()
+    assert wf["wf_mode"] == mode
+    assert wf["wf_fold_start"] == starts
+    assert wf["wf_fold_end"] == ends
+    assert wf["wf_splits"] == len(starts) == len(wf["wf_fold_ret"])
+    rets = np.asarray(wf["wf_fold_ret"])
+    assert np.isfinite(rets).all()
+    assert math.isclose(wf["wf_ret_mu"], float(rets.mean()))
+    assert math.isclose(wf["wf_pos_frac"], float((rets > 0).mean()))
+    assert 0.0 <= wf["wf_score"] <= 1.0
+
+
+def test_walk_forward_too_short_has_no_folds():
+    wf = walk_forward_metrics(_bars(n=150), zigzag_pct=1.0, options=WaveOptions(), mode="expanding")
+    assert wf["wf_splits"] == 0
+    assert wf["wf_score"] == 0.0
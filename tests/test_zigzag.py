@@ -1,6 +1,16 @@
+from types import SimpleNamespace
+
+import numpy as np
 import pandas as pd
 
-from ew6.swing.zigzag import ZigZagConfig, zigzag_from_close
+from ew6.swing.zigzag import (
+    ZigZagConfig,
+    _zigzag_hl_loop,
+    extract_swings,
+    zigzag_from_close,
+    zigzag_from_hl,
+    zigzag_from_hl_nb,
+)
 
 
 def test_zigzag_basic():
@@ -8,3 +18,71 @@ def test_zigzag_basic():
     close = pd.Series([100, 102, 105, 100, 98, 103], index=idx)
     pts = zigzag_from_close(close, ZigZagConfig(pct=3.0))
     assert len(pts) >= 1
+
+
+def _random_hl(seed, n=400, nan_frac=0.0):
+    rng = np.random.default_rng(seed)
+    close = 100.0 * np.exp(np.cumsum(rng.normal(0.0, 0.01, n)))
+    spread = rng.uniform(0.0, 0.02, n)
+    high, low = close * (1.0 + spread), close * (1.0 - spread)
+    if nan_frac:
+        gaps = rng.random(n) < nan_frac
+        high[gaps] = np.nan
+        low[rng.random(n) < nan_frac] = np.nan
+    return high, low
+
+
+def _assert_alternating(idx, px, high, low):
+    assert (np.diff(idx) > 0).all()
+    assert np.isfinite(px).all()
+    # each pivot sits on its bar's high or low, and highs and lows alternate
+    is_hi = px == high[idx]
+    assert (is_hi | (px == low[idx])).all()
+    assert (is_hi[1:] != is_hi[:-1]).all()
+
+
+def test_zigzag_from_hl_alternates():
+    for seed in range(50):
+        high, low = _random_hl(seed)
+        for pct in (0.5, 1.0, 3.0):
+            idx, px = zigzag_from_hl_nb(high, low, pct)
+            _assert_alternating(idx, px, high, low)
+            py_idx, py_px = _zigzag_hl_loop(high, low, pct)
+            assert np.array_equal(idx, py_idx) and np.array_equal(px, py_px)
+
+
+def test_zigzag_from_hl_wide_first_bar():
+    # bar 0 alone spans more than pct: its high and low must not both become pivots
+    assert zigzag_from_hl([101, 100.5, 100.6, 102], [99, 99.8, 99.9, 100.5], 1.0) == [(0, 99.0), (3, 102.0)]
+
+
+def test_zigzag_from_hl_skips_nan_bars():
+    for seed in range(50):
+        high, low = _random_hl(seed, nan_frac=0.1)
+        high[0] = np.nan
+        idx, px = zigzag_from_hl_nb(high, low, 1.0)
+        _assert_alternating(idx, px, high, low)
+        py_idx, py_px = _zigzag_hl_loop(high, low, 1.0)
+        assert np.array_equal(idx, py_idx) and np.array_equal(px, py_px)
+        # same pivots as on the series with the NaN bars dropped
+        keep = np.flatnonzero(~(np.isnan(high) | np.isnan(low)))
+        k_idx, k_px = zigzag_from_hl_nb(high[keep], low[keep], 1.0)
+        assert np.array_equal(keep[k_idx], idx) and np.array_equal(k_px, px)
+    assert zigzag_from_hl([np.nan] * 3, [np.nan] * 3, 1.0) == []
+
+
+def test_extract_swings_sees_bars_appended_to_a_feed():
+    class Feed:
+        def __init__(self):
+            self.bars = []
+
+    high, low = _random_hl(3, n=120)
+
+    def bar(i):
+        return SimpleNamespace(ts=i, open=low[i], high=high[i], low=low[i], close=high[i], volume=1.0)
+
+    feed = Feed()
+    feed.bars.extend(bar(i) for i in range(60))
+    first = extract_swings(feed, 1.0)
+    feed.bars.extend(bar(i) for i in range(60, 120))
+    assert extract_swings(feed, 1.0) == zigzag_from_hl(high, low, 1.0) != first